@@ -0,0 +1,3 @@
+"""
+Performance benchmarks, run as modules (python -m src.benchmarks.<name>)
+"""
@@ -0,0 +1,48 @@
+"""
+Bake benchmark: tracing the static models serially and in a process pool
+
+Run with `python -m src.benchmarks.bake`. The on-disk asset cache is off,
+so every model is traced; the pool is timed first, while this process
+has built no primitives its workers could inherit, then the serial bake.
+No window is needed, since tracing does not touch GL.
+"""
+import os
+import time
+from typing import Optional, Sequence
+
+from ..rendering.asset_cache import asset_cache
+from ..rendering.baking import bake, static_model_jobs
+from ..rendering.trace import trace_cache
+
+
+def _timed_bake(workers: int) -> float:
+    """Milliseconds to bake every static model with the given worker count"""
+    trace_cache.clear()
+    start = time.perf_counter()
+    bake(static_model_jobs(), workers)
+    return (time.perf_counter() - start) * 1000
+
+
+def run(worker_counts: Optional[Sequence[int]] = None):
+    """Time a parallel bake per worker count, then a serial one, and print a table"""
+    cores = os.cpu_count() or 1
+    if worker_counts is None:
+        worker_counts = sorted({2, max(cores, 2)})
+    asset_cache.enabled = False
+
+    print(f'{len(static_model_jobs())} models, {cores} cores')
+    parallel = {workers: _timed_bake(workers) for workers in worker_counts}
+    serial = _timed_bake(1)
+    print(f'{"workers":>8} {"bake ms":>9} {"speedup":>8}')
+    print(f'{"serial":>8} {serial:>9.1f} {1.0:>8.2f}')
+    for workers, elapsed in parallel.items():
+        print(f'{workers:>8} {elapsed:>9.1f} {serial / elapsed:>8.2f}')
+
+
+def main():
+    """Run the benchmark"""
+    run()
+
+
+if __name__ == "__main__":
+    main()
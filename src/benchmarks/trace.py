@@ -0,0 +1,96 @@
+"""
+Trace compiler benchmark: immediate-mode models against their traced meshes
+
+Run with `python -m src.benchmarks.trace`. Each static model is traced,
+checked against its immediate-mode drawing through GL_FEEDBACK, and timed
+drawn both ways, along with how long tracing and compiling a display list
+from either path takes.
+"""
+import sys
+import time
+from typing import Callable
+
+from OpenGL.GL import *
+from OpenGL.GLU import *
+from OpenGL.GLUT import *
+
+from ..config import WINDOW_WIDTH, WINDOW_HEIGHT
+from ..models.buildings import draw_single_floor
+from ..models.landmarks import (
+    draw_shaheed_minar, draw_radio_tower_structure, draw_national_parliament_structure
+)
+from ..models.plane import draw_plane
+from ..rendering.display_lists import DisplayListCache
+from ..rendering.trace import trace, verify
+
+# Models to compare: (name, function, arguments)
+MODELS = [
+    ('shaheed minar', draw_shaheed_minar, ()),
+    ('radio tower', draw_radio_tower_structure, (0, 0, 0, 1.0)),
+    ('parliament', draw_national_parliament_structure, (0, 0, 0, 0.8)),
+    ('plane high', draw_plane, ('high',)),
+    ('plane low', draw_plane, ('low',)),
+    ('building floor', draw_single_floor, (1, 2, 3)),
+]
+
+
+def _timed(function: Callable, frames: int) -> float:
+    """Average milliseconds per call, including finishing the GL work"""
+    glFinish()
+    start = time.perf_counter()
+    for _ in range(frames):
+        function()
+    glFinish()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def _compile_ms(build: Callable, *args) -> float:
+    """Milliseconds to compile build(*args) into a fresh display list"""
+    cache = DisplayListCache()
+    elapsed = _timed(lambda: cache.call('model', build, *args), 1)
+    cache.clear()
+    return elapsed
+
+
+def run(frames: int = 20):
+    """Trace, verify and time every model and print a table"""
+    glMatrixMode(GL_PROJECTION)
+    glLoadIdentity()
+    gluPerspective(60.0, WINDOW_WIDTH / WINDOW_HEIGHT, 1.0, 500.0)
+    glMatrixMode(GL_MODELVIEW)
+    glLoadIdentity()
+    gluLookAt(0.0, 6.0, 14.0, 0.0, 3.0, 0.0, 0.0, 1.0, 0.0)
+
+    print(f'{"model":>15} {"vertices":>9} {"trace ms":>9} {"max diff":>9} '
+          f'{"immediate ms":>13} {"traced ms":>10} {"compile ms":>11} {"traced compile ms":>18}')
+    for name, build, args in MODELS:
+        start = time.perf_counter()
+        mesh = trace(build, *args)
+        traced_ms = (time.perf_counter() - start) * 1000
+        difference = verify(build, *args)
+        immediate = _timed(lambda: build(*args), frames)
+        drawn = _timed(mesh.draw, frames)
+        compiled = _compile_ms(build, *args)
+        compiled_traced = _compile_ms(mesh.draw)
+        print(f'{name:>15} {mesh.vertex_count:>9} {traced_ms:>9.1f} {difference:>9.2g} '
+              f'{immediate:>13.2f} {drawn:>10.2f} {compiled:>11.2f} {compiled_traced:>18.2f}')
+
+
+def main():
+    """Open a window for the GL context and run the benchmark"""
+    glutInit(sys.argv)
+    glutInitWindowSize(WINDOW_WIDTH, WINDOW_HEIGHT)
+    glutInitDisplayMode(GLUT_RGB | GLUT_DOUBLE | GLUT_DEPTH)
+    glutCreateWindow(b"Trace benchmark")
+    glEnable(GL_DEPTH_TEST)
+    glEnable(GL_CULL_FACE)
+    glEnable(GL_LIGHTING)
+    glEnable(GL_LIGHT0)
+    glEnable(GL_NORMALIZE)
+    glEnable(GL_COLOR_MATERIAL)
+    glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
+    run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Traffic benchmark: simulation and drawing cost at increasing vehicle counts
+
+Run with `python -m src.benchmarks.traffic`. Each count is timed for the
+vectorized vehicle update alone, and for a frame of update plus drawing
+the vehicles in all five building zones, both with the batched mesh and,
+for comparison, with the per-vehicle immediate-mode path.
+"""
+import sys
+import time
+from typing import Sequence
+
+import numpy as np
+from OpenGL.GL import *
+from OpenGL.GLU import *
+from OpenGL.GLUT import *
+
+from ..config import VEHICLE_COLORS, WINDOW_WIDTH, WINDOW_HEIGHT
+from ..game_state import state
+from ..simulation import Simulation
+from ..models.environment import draw_vehicles, draw_single_vehicle, update_vehicle_batch, vehicle_headings
+
+COUNTS = (10, 1000, 10000)
+ZONES = 5  # The vehicle list is drawn once per building zone
+IMMEDIATE_LIMIT = 1000  # Per-vehicle drawing is too slow to time beyond this
+
+
+def _timed(function, frames: int) -> float:
+    """Average milliseconds per call, including finishing the GL work"""
+    glFinish()
+    start = time.perf_counter()
+    for _ in range(frames):
+        function()
+    glFinish()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def _draw_zones(draw):
+    """Draw the vehicles once for every building zone"""
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    for zone in range(ZONES):
+        glPushMatrix()
+        glTranslated(0, 0, -40.0 * zone)
+        draw()
+        glPopMatrix()
+
+
+def _draw_immediate():
+    """Draw every vehicle on its own, as before batching"""
+    vehicles = state.vehicle_data
+    headings = vehicle_headings(vehicles['axis'], vehicles['direction'])
+    for x, z, heading, color in zip(vehicles['x'], vehicles['z'], headings, vehicles['color']):
+        draw_single_vehicle(x, z, heading, VEHICLE_COLORS[color])
+
+
+def run(counts: Sequence[int] = COUNTS, frames: int = 30):
+    """Time update and drawing for each vehicle count and print a table"""
+    simulation = Simulation(seed=0)
+    simulation.start()
+
+    glMatrixMode(GL_PROJECTION)
+    glLoadIdentity()
+    gluPerspective(60.0, WINDOW_WIDTH / WINDOW_HEIGHT, 1.0, 500.0)
+    glMatrixMode(GL_MODELVIEW)
+    glLoadIdentity()
+    gluLookAt(0.0, 15.0, 30.0, 0.0, 0.0, -60.0, 0.0, 1.0, 0.0)
+
+    print(f'{"vehicles":>9} {"update ms":>10} {"batched frame ms":>17} {"immediate frame ms":>19}')
+    for count in counts:
+        simulation.generate_vehicles(count, side_roads=True)
+        update = _timed(lambda: simulation.update_vehicles(1.0), frames)
+        batched = _timed(lambda: (simulation.update_vehicles(1.0), update_vehicle_batch(),
+                                  _draw_zones(draw_vehicles)), frames)
+        immediate = '-'
+        if count <= IMMEDIATE_LIMIT:
+            frame = lambda: (simulation.update_vehicles(1.0), _draw_zones(_draw_immediate))
+            immediate = f'{_timed(frame, max(frames // 10, 1)):.2f}'
+        print(f'{count:>9} {update:>10.3f} {batched:>17.2f} {immediate:>19}')
+
+
+def main():
+    """Open a window for the GL context and run the benchmark"""
+    glutInit(sys.argv)
+    glutInitWindowSize(WINDOW_WIDTH, WINDOW_HEIGHT)
+    glutInitDisplayMode(GLUT_RGB | GLUT_DOUBLE | GLUT_DEPTH)
+    glutCreateWindow(b"Traffic benchmark")
+    glEnable(GL_DEPTH_TEST)
+    glEnable(GL_LIGHTING)
+    glEnable(GL_LIGHT0)
+    glEnable(GL_NORMALIZE)
+    glEnable(GL_COLOR_MATERIAL)
+    glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
+    run()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 Configuration constants for Plane Game 3D
 """
 import math
+import os
 
 # Math constants
 RAD = math.pi / 180
@@ -13,26 +14,98 @@ EN_SIZE = 20
 BUILDING_COLORS_R = [0.1, 0.4, 0.0, 0.9, 0.2, 0.5, 0.0, 0.7, 0.5, 0.0]
 BUILDING_COLORS_G = [0.2, 0.0, 0.4, 0.5, 0.2, 0.0, 0.3, 0.9, 0.0, 0.2]
 BUILDING_COLORS_B = [0.4, 0.5, 0.0, 0.7, 0.9, 0.0, 0.1, 0.2, 0.5, 0.0]
+BUILDING_RENDER_MODE = 'textured'  # 'textured' (one box per building) or 'geometry' (a cube per floor and window)
 
 # Obstacle positions for each zone
 TORUS_POS_X = [1.0, -2.0, 3.0, -4.0, -2.0, 0.0, 2.0]
 TORUS_POS_Y = [2.0, 3.0, 10.0, 6.0, 7.0, 4.0, 1.0]
 
+# Number of zone variants, each with its own building layout
+NUM_ZONE_VARIANTS = len(TORUS_POS_X)
+
 # Cloud configuration
 NUM_CLOUDS = 20
+CLOUD_RENDER_MODE = 'geometry'  # 'geometry' (spheres) or 'impostor' (textured quads), toggle with 'C'
+
+# Trees scattered beside the flight path (drawn as one batch, so thousands are fine)
+NUM_TREES = 40
 
 # Vehicle configuration
 NUM_VEHICLES = 12
 
+# Traffic mode: many more vehicles, on the main road and the side roads at x = +/-10
+TRAFFIC_MODE = False
+TRAFFIC_VEHICLES = 2000
+
+# Vehicle colors: [R, G, B]
+VEHICLE_COLORS = [
+    [0.8, 0.1, 0.1],   # Red
+    [0.1, 0.1, 0.8],   # Blue
+    [0.9, 0.9, 0.1],   # Yellow
+    [0.1, 0.7, 0.1],   # Green
+    [0.9, 0.5, 0.0],   # Orange
+    [0.6, 0.1, 0.6],   # Purple
+    [0.2, 0.2, 0.2],   # Dark gray
+    [0.9, 0.9, 0.9],   # White
+]
+
 # Initial game values
 INITIAL_SPEED = 0.3
 MAX_SPEED = 0.7
 ANGLE_BACK_FRAC = 0.2
 
+# Frame rate the per-frame movement rates above were tuned for
+SIM_FRAME_RATE = 60
+
+# Fixed simulation timestep (steps per second), independent of the frame rate
+SIM_TICK_RATE = 120
+MAX_FRAME_TIME = 0.25  # Longest frame the simulation catches up on, in seconds
+
+# Frame pacing
+TARGET_FPS = 60
+IDLE_FPS = 15  # Menu, pause and game over; 0 redraws only on input
+
 # Window configuration
 WINDOW_WIDTH = 1366
 WINDOW_HEIGHT = 720
 
+# HUD overlay text color
+HUD_TEXT_COLOR = (0.05, 0.05, 0.2)
+
+# Level of detail for curved primitives
+LOD_LEVELS = (1.0, 0.5, 0.25)  # tessellation fraction per level, finest first
+LOD_MAX_ERROR_PIXELS = 0.75  # allowed silhouette error on screen
+LOD_HYSTERESIS = 0.25  # extra margin before switching to a coarser level
+LOD_MIN_SLICES = 5
+LOD_MIN_STACKS = 3
+
+# Bake static models (landmarks, plane) from a trace of their immediate-mode
+# drawing into flat vertex buffers instead of replaying every call
+TRACE_STATIC_MODELS = True
+
+# Keep baked meshes on disk between launches (rebuilt when their source changes)
+ASSET_CACHE = True
+ASSET_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'plane_game_3d', 'meshes')
+
+# Worker processes tracing uncached models at startup (None: one per core, 1: no pool)
+BAKE_WORKERS = None
+
+# Draw static scenery with its lighting baked into vertex colors (off while the view spins)
+BAKE_STATIC_LIGHTING = True
+
+# Print per-frame render statistics (toggle in game with 'I')
+SHOW_RENDER_STATS = False
+RENDER_STATS_INTERVAL = 1.0
+
+# Print how long each startup phase took up to the first frame (or run with --startup-report)
+SHOW_STARTUP_REPORT = False
+STARTUP_BUDGET_MS = 300
+
+# Camera placement (gluLookAt eye, target and up vector)
+CAMERA_EYE = (0.0, 4.5, 10.0)
+CAMERA_CENTER = (0.0, 4.0, 0.0)
+CAMERA_UP = (0.0, 1.0, 0.0)
+
 # Light configuration
 LIGHT_AMBIENT = [0.0, 0.0, 0.0, 1.0]
 LIGHT_DIFFUSE = [1.0, 1.0, 1.0, 1.0]
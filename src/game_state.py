@@ -2,10 +2,38 @@
 Global game state management for Plane Game 3D
 """
 import time
-import random
-from typing import List
 
-from .config import NUM_CLOUDS, NUM_VEHICLES, INITIAL_SPEED
+import numpy as np
+
+from .config import INITIAL_SPEED, EN_SIZE, NUM_ZONE_VARIANTS, CLOUD_RENDER_MODE
+
+# Record layouts of the cloud and vehicle arrays
+CLOUD_DTYPE = np.dtype([('pos', np.float64, 3), ('scale', np.float64)])
+VEHICLE_DTYPE = np.dtype([
+    ('x', np.float64), ('z', np.float64), ('direction', np.float64),
+    ('speed', np.float64), ('color', np.uint8),
+    ('axis', np.uint8),  # 0 drives along X (main road), 1 along Z (side roads)
+])
+
+
+class BuildingGrid:
+    """Compact building layout store with one uint8 height layer per zone"""
+
+    def __init__(self, zones: int = NUM_ZONE_VARIANTS, size: int = EN_SIZE + 1):
+        self.cells = np.zeros((zones, size, size), dtype=np.uint8)
+
+    def get(self, zone: int, idx_i: int, idx_j: int) -> int:
+        """Return the number of floors at a cell (0 means empty)"""
+        return int(self.cells[zone, idx_i, idx_j])
+
+    def randomize(self, sites: np.ndarray, rng: 'np.random.Generator'):
+        """Give every cell in the sites mask a random height of 1-5 floors, clear the rest"""
+        floors = rng.integers(1, 6, size=self.cells.shape, dtype=np.uint8)
+        self.cells[:] = np.where(sites, floors, 0)
+
+    def clear(self):
+        """Remove all buildings so layouts are regenerated"""
+        self.cells.fill(0)
 
 
 class GameState:
@@ -24,7 +52,14 @@ class GameState:
         self.zoom = 4.0
         
         # Building data storage
-        self.tola = [[0 for _ in range(5000)] for _ in range(5000)]
+        self.tola = BuildingGrid()
+        
+        # Bumped whenever building or tree layouts are re-randomized
+        self.layout_version = 0
+        
+        # Bumped whenever the tree or vehicle arrays are replaced, which
+        # can also happen without a new layout (e.g. changing the traffic)
+        self.population_version = 0
         
         # Position variables
         self.tX = 0.0
@@ -63,25 +98,25 @@ class GameState:
         
         # Time tracking
         self.start_time = time.time()
-        self.pause_start_time = 0.0
-        self.total_pause_time = 0.0
+        
+        # Seconds of unpaused play, advanced by the simulation
+        self.play_time = 0.0
         
         # Animation times
         self.glow_time = 0.0
         self.blink_time = 0.0
         
-        # Cloud data: [x, y, z, scale]
-        self.cloud_data = [
-            [random.uniform(-50, 50), random.uniform(18, 50), -10.0 - i * 5.0, random.uniform(1.5, 6.0)]
-            for i in range(NUM_CLOUDS)
-        ]
+        # Cloud data: CLOUD_DTYPE records, generated when a game starts
+        self.cloud_data = np.zeros(0, dtype=CLOUD_DTYPE)
+        
+        # Cloud rendering mode: 'geometry' or 'impostor'
+        self.cloud_mode = CLOUD_RENDER_MODE
         
-        # Vehicle data: [x, z, direction, speed, color_idx, color]
-        self.vehicle_data: List[List[float]] = []
+        # Vehicle data: VEHICLE_DTYPE records
+        self.vehicle_data = np.zeros(0, dtype=VEHICLE_DTYPE)
         
-        # Tree positions: [x, y, z, scale]
-        self.tree_positions: List[List[float]] = []
-        self.TREES_GENERATED = False
+        # Tree positions: (N, 4) rows of [x, y, z, scale]
+        self.tree_positions = np.zeros((0, 4))
     
     def reset(self):
         """Reset game to initial state"""
@@ -89,6 +124,10 @@ class GameState:
         self.tY = 0.0
         self.tZ = -8.0
         
+        # Re-randomize building layouts
+        self.tola.clear()
+        self.layout_version += 1
+        
         self.tZ1 = -20.0
         self.tZ2 = -40.0
         self.tZ3 = -60.0
@@ -108,8 +147,7 @@ class GameState:
         self.GAME_OVER = False
         self.PAUSED = False
         
-        self.pause_start_time = 0.0
-        self.total_pause_time = 0.0
+        self.play_time = 0.0
         
         self.obstacle_passed = [False, False, False, False, False, False, False]
         self.start_time = time.time()
@@ -117,18 +155,11 @@ class GameState:
         self.glow_time = 0.0
         self.blink_time = 0.0
         
-        # Reset vehicles for new random positions
-        self.vehicle_data = []
-        
-        # Reset trees for new random positions
-        self.tree_positions = []
-        self.TREES_GENERATED = False
-        
-        # Reset cloud positions with new random values
-        self.cloud_data = [
-            [random.uniform(-50, 50), random.uniform(18, 50), -10.0 - i * 5.0, random.uniform(1.5, 6.0)]
-            for i in range(NUM_CLOUDS)
-        ]
+        # Vehicles, trees and clouds are regenerated when the next game starts
+        self.vehicle_data = np.zeros(0, dtype=VEHICLE_DTYPE)
+        self.tree_positions = np.zeros((0, 4))
+        self.population_version += 1
+        self.cloud_data = np.zeros(0, dtype=CLOUD_DTYPE)
 
 
 # Global state instance
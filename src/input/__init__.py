@@ -1,9 +1,9 @@
 """
 Input handling module for Plane Game
 """
-from .handlers import keyboard_handler, special_key_handler, mouse_handler, idle_handler
+from .handlers import keyboard_handler, special_key_handler, mouse_handler
 
 __all__ = [
-    'keyboard_handler', 'special_key_handler', 'mouse_handler', 'idle_handler'
+    'keyboard_handler', 'special_key_handler', 'mouse_handler'
 ]
 
@@ -2,11 +2,12 @@
 Input handling functions (keyboard, mouse)
 """
 import sys
-import time
 
 from OpenGL.GLUT import *
 
 from ..game_state import state
+from ..rendering.stats import render_stats
+from ..simulation import simulation, UP, DOWN, LEFT, RIGHT, PAUSE, START, MENU
 
 
 def keyboard_handler(key_char: bytes, x: int, y: int):
@@ -16,12 +17,7 @@ def keyboard_handler(key_char: bytes, x: int, y: int):
     if key_str == '\x1b' or key_str == 'q':  # ESC or 'q'
         sys.exit(0)
     elif key_str == ' ':  # Space bar
-        if not state.PAUSED:
-            state.pause_start_time = time.time()
-            state.PAUSED = True
-        else:
-            state.total_pause_time += time.time() - state.pause_start_time
-            state.PAUSED = False
+        simulation.queue(PAUSE)
     elif key_str == 'r':
         state.rot = True
     elif key_str == 't':
@@ -31,34 +27,27 @@ def keyboard_handler(key_char: bytes, x: int, y: int):
     elif key_str == '-' or key_str == '_':
         state.zoom -= 0.05
     elif key_str == 'g':
-        state.reset()
-        state.START = True
+        simulation.queue(START)
     elif key_str == 'm':
-        state.reset()
-        state.START = False
+        simulation.queue(MENU)
+    elif key_str == 'c':
+        state.cloud_mode = 'impostor' if state.cloud_mode == 'geometry' else 'geometry'
+    elif key_str == 'i':
+        render_stats.enabled = not render_stats.enabled
 
     glutPostRedisplay()
 
 
 def special_key_handler(key: int, x: int, y: int):
     """Special keyboard callback function for arrow keys"""
-    frac = 0.3
-    rot_frac = 1.0
-
     if key == GLUT_KEY_UP:
-        state.tY -= frac
-        state.rotZ += rot_frac
+        simulation.queue(UP)
     elif key == GLUT_KEY_DOWN:
-        state.tY += frac
-        state.rotZ -= rot_frac
+        simulation.queue(DOWN)
     elif key == GLUT_KEY_LEFT:
-        state.tX += frac
-        state.rotX -= rot_frac * 3
-        state.rotY += rot_frac / 2
+        simulation.queue(LEFT)
     elif key == GLUT_KEY_RIGHT:
-        state.tX -= frac
-        state.rotX += rot_frac * 3
-        state.rotY -= rot_frac / 2
+        simulation.queue(RIGHT)
 
     glutPostRedisplay()
 
@@ -72,8 +61,3 @@ def mouse_handler(button: int, direction: int, x: int, y: int):
 
     glutPostRedisplay()
 
-
-def idle_handler():
-    """Idle callback function"""
-    glutPostRedisplay()
-
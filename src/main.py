@@ -6,6 +6,7 @@ Script: Run with `python main.py` after activating virtual environment
 """
 import sys
 
+from .startup import startup
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 
@@ -15,11 +16,21 @@ from .config import (
     MAT_AMBIENT, MAT_DIFFUSE, MAT_SPECULAR, HIGH_SHININESS
 )
 from .rendering.display import display, resize
-from .input.handlers import keyboard_handler, special_key_handler, mouse_handler, idle_handler
+from .rendering.hud import hud
+from .rendering.baking import baker, static_model_jobs
+from .models.buildings import window_texture
+from .rendering.scheduler import scheduler
+from .input.handlers import keyboard_handler, special_key_handler, mouse_handler
 
 
 def main():
     """Main entry point"""
+    startup.mark('imports')
+    
+    # Trace the static models in worker processes while the window opens and
+    # the menu is shown; the first game frame waits for any still running
+    baker.start(static_model_jobs())
+    startup.mark('bake started')
     glutInit(sys.argv)
 
     # Center the window on display
@@ -33,6 +44,7 @@ def main():
     glutInitDisplayMode(GLUT_RGB | GLUT_DOUBLE | GLUT_DEPTH | GLUT_RGBA)
     
     glutCreateWindow(b"Plane Game 3D")
+    startup.mark('window')
     
     # Register callbacks
     glutReshapeFunc(resize)
@@ -40,7 +52,6 @@ def main():
     glutKeyboardFunc(keyboard_handler)
     glutSpecialFunc(special_key_handler)
     glutMouseFunc(mouse_handler)
-    glutIdleFunc(idle_handler)
     
     # OpenGL configuration
     glClearColor(0.53, 0.81, 0.92, 1.0)  # Light sky blue fallback
@@ -69,7 +80,16 @@ def main():
     glMaterialfv(GL_FRONT, GL_DIFFUSE, MAT_DIFFUSE)
     glMaterialfv(GL_FRONT, GL_SPECULAR, MAT_SPECULAR)
     glMaterialfv(GL_FRONT, GL_SHININESS, HIGH_SHININESS)
+    startup.mark('GL setup')
+    
+    # Generate the HUD font atlas and the building windows before the first frame
+    # (textures cannot be created while the zone display lists are compiling)
+    hud.load()
+    window_texture()
+    startup.mark('HUD and textures')
     
+    # Redraw from a paced timer instead of a busy idle callback
+    scheduler.start()
     glutMainLoop()
 
 
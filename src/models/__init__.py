@@ -1,21 +1,28 @@
 """
 3D Models for Plane Game
 """
+# The models draw through rendering.primitives while the rendering package
+# imports the models back, so make sure rendering is initialized first
+from .. import rendering  # noqa: F401
 from .plane import draw_plane
 from .buildings import draw_house, draw_single_floor
-from .landmarks import draw_shaheed_minar, draw_radio_tower, draw_national_parliament
+from .landmarks import (
+    draw_shaheed_minar, draw_radio_tower, draw_radio_tower_structure,
+    draw_radio_tower_lights, draw_national_parliament,
+    draw_national_parliament_structure, draw_parliament_water
+)
 from .environment import (
     draw_sky_gradient, draw_sun_with_glow, draw_clouds,
-    draw_single_tree, draw_trees, generate_tree_positions,
-    draw_roads, draw_vehicles, init_vehicles, update_vehicles
+    draw_trees, draw_roads, draw_vehicles, update_vehicle_batch
 )
 
 __all__ = [
     'draw_plane',
     'draw_house', 'draw_single_floor',
-    'draw_shaheed_minar', 'draw_radio_tower', 'draw_national_parliament',
+    'draw_shaheed_minar', 'draw_radio_tower', 'draw_radio_tower_structure',
+    'draw_radio_tower_lights', 'draw_national_parliament',
+    'draw_national_parliament_structure', 'draw_parliament_water',
     'draw_sky_gradient', 'draw_sun_with_glow', 'draw_clouds',
-    'draw_single_tree', 'draw_trees', 'generate_tree_positions',
-    'draw_roads', 'draw_vehicles', 'init_vehicles', 'update_vehicles'
+    'draw_trees', 'draw_roads', 'draw_vehicles', 'update_vehicle_batch'
 ]
 
@@ -1,56 +1,136 @@
 """
 Building and house rendering
 """
+import numpy as np
 from OpenGL.GL import *
-from OpenGL.GLUT import *
 
-from ..config import BUILDING_COLORS_R, BUILDING_COLORS_G, BUILDING_COLORS_B
+from ..config import BUILDING_COLORS_R, BUILDING_COLORS_G, BUILDING_COLORS_B, BUILDING_RENDER_MODE
+from ..rendering.glstate import gl_state
+from ..rendering.lighting import baked_lighting, bake_colors
+from ..rendering.primitives import solid_cube
+from ..rendering.textures import textures
+
+# Window atlas: a floor tile with two windows, then a plain wall tile for roofs
+WINDOW_TILE = 64  # Texels per tile side
+WINDOW_SPANS = [(0.15, 0.45), (0.55, 0.85)]  # Window columns across a face (fractions)
+WINDOW_ROWS = (0.35, 0.65)  # Window band up a floor (fractions)
+PLAIN_UV = (0.75, 0.5)  # Texture coordinate inside the plain tile
+
+# Building faces: (normal, corner offsets (x, z) going counter-clockwise from outside)
+SIDE_FACES = [
+    ((0, 0, 1), ((-0.5, 0.5), (0.5, 0.5))),
+    ((1, 0, 0), ((0.5, 0.5), (0.5, -0.5))),
+    ((0, 0, -1), ((0.5, -0.5), (-0.5, -0.5))),
+    ((-1, 0, 0), ((-0.5, -0.5), (-0.5, 0.5))),
+]
+
+
+def floor_color(r_idx: int, g_idx: int, b_idx: int) -> tuple:
+    """Palette color of a building floor"""
+    return (BUILDING_COLORS_R[r_idx % 10], BUILDING_COLORS_G[g_idx % 10], BUILDING_COLORS_B[b_idx % 10])
 
 
 def draw_single_floor(r_idx: int, g_idx: int, b_idx: int):
     """Draw a single floor of a building"""
-    glColor3d(
-        BUILDING_COLORS_R[r_idx % 10],
-        BUILDING_COLORS_G[g_idx % 10],
-        BUILDING_COLORS_B[b_idx % 10]
-    )
+    gl_state.color(*floor_color(r_idx, g_idx, b_idx))
     glPushMatrix()
     glTranslated(0, 0, 0)
-    glutSolidCube(1)
+    solid_cube(1)
     glPopMatrix()
     
     # Windows
-    glColor3d(0, 0, 0)
+    gl_state.color(0, 0, 0)
     glPushMatrix()
     glTranslated(0.2, 0, 0)
     glScaled(0.3, 0.3, 1.001)
-    glutSolidCube(1)
+    solid_cube(1)
     glPopMatrix()
     
-    glColor3d(0, 0, 0)
+    gl_state.color(0, 0, 0)
     glPushMatrix()
     glTranslated(-0.2, 0, 0)
     glScaled(0.3, 0.3, 1.001)
-    glutSolidCube(1)
+    solid_cube(1)
     glPopMatrix()
     
-    glColor3d(0, 0, 0)
+    gl_state.color(0, 0, 0)
     glPushMatrix()
     glTranslated(0, 0, 0.2)
     glScaled(1.001, 0.3, 0.3)
-    glutSolidCube(1)
+    solid_cube(1)
     glPopMatrix()
     
-    glColor3d(0, 0, 0)
+    gl_state.color(0, 0, 0)
     glPushMatrix()
     glTranslated(0, 0, -0.2)
     glScaled(1.001, 0.3, 0.3)
-    glutSolidCube(1)
+    solid_cube(1)
     glPopMatrix()
 
 
+def make_window_image() -> np.ndarray:
+    """White window atlas, black where the windows are, to be tinted per floor"""
+    image = np.full((WINDOW_TILE, WINDOW_TILE * 2, 4), 255, dtype=np.uint8)
+    texels = (np.arange(WINDOW_TILE) + 0.5) / WINDOW_TILE
+    rows = (texels >= WINDOW_ROWS[0]) & (texels <= WINDOW_ROWS[1])
+    columns = np.zeros(WINDOW_TILE, dtype=bool)
+    for start, end in WINDOW_SPANS:
+        columns |= (texels >= start) & (texels <= end)
+    image[:, :WINDOW_TILE, :3][rows[:, None] & columns[None, :]] = 0
+    return image
+
+
+def window_texture() -> int:
+    """The window atlas texture (create it before compiling building lists)"""
+    return textures.get('building_windows', make_window_image)
+
+
+def building_mesh(num_floors: int, r_idx: int, g_idx: int) -> np.ndarray:
+    """One box for the whole building as GL_T2F_C4F_N3F_V3F quads, a band per floor"""
+    quads = []
+    for i in range(num_floors):
+        color = floor_color(g_idx, r_idx, i) + (1.0,)
+        bottom, top = 0.3 + i, 1.3 + i
+        for normal, ((x0, z0), (x1, z1)) in SIDE_FACES:
+            for u, v, x, y, z in ((0, 0, x0, bottom, z0), (0.5, 0, x1, bottom, z1),
+                                  (0.5, 1, x1, top, z1), (0, 1, x0, top, z0)):
+                quads.append((u, v) + color + normal + (x, y, z))
+
+    # Roof and floor take the top and bottom floor colors from the plain tile
+    roof = floor_color(g_idx, r_idx, num_floors - 1) + (1.0,)
+    base = floor_color(g_idx, r_idx, 0) + (1.0,)
+    top, bottom = 0.3 + num_floors, 0.3
+    for x, z in ((-0.5, 0.5), (0.5, 0.5), (0.5, -0.5), (-0.5, -0.5)):
+        quads.append(PLAIN_UV + roof + (0, 1, 0) + (x, top, z))
+    for x, z in ((-0.5, 0.5), (-0.5, -0.5), (0.5, -0.5), (0.5, 0.5)):
+        quads.append(PLAIN_UV + base + (0, -1, 0) + (x, bottom, z))
+    return np.array(quads, dtype=np.float32)
+
+
+def draw_textured_house(num_floors: int, r_idx: int, g_idx: int):
+    """Draw a multi-story building as one window-textured box"""
+    gl_state.enable(GL_TEXTURE_2D)
+    glBindTexture(GL_TEXTURE_2D, window_texture())
+    mesh = building_mesh(num_floors, r_idx, g_idx)
+    baked = baked_lighting()
+    if baked:
+        # Buildings are only translated, so their lighting is baked in
+        mesh = bake_colors(mesh, 2, 6)
+        gl_state.disable(GL_LIGHTING)
+    glInterleavedArrays(GL_T2F_C4F_N3F_V3F, 0, mesh)
+    glDrawArrays(GL_QUADS, 0, len(mesh))
+    gl_state.invalidate_color()
+    if baked:
+        gl_state.enable(GL_LIGHTING)
+    glBindTexture(GL_TEXTURE_2D, 0)
+    gl_state.disable(GL_TEXTURE_2D)
+
+
 def draw_house(num_floors: int, r_idx: int, g_idx: int):
     """Draw a multi-story building"""
+    if BUILDING_RENDER_MODE == 'textured':
+        draw_textured_house(num_floors, r_idx, g_idx)
+        return
     for i in range(num_floors):
         glPushMatrix()
         glTranslated(0, 0.8 + i, 0)
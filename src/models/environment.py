@@ -2,32 +2,40 @@
 Environment elements rendering (sky, clouds, trees, roads, vehicles)
 """
 import math
-import random
-from typing import List
+from typing import List, Optional, Tuple
 
+import numpy as np
 from OpenGL.GL import *
-from OpenGL.GLUT import *
 
-from ..config import EN_SIZE, NUM_VEHICLES
+from ..config import EN_SIZE, VEHICLE_COLORS
 from ..game_state import state
+from ..rendering.glstate import gl_state
+from ..rendering.instancing import InstancedMesh, Part
+from ..rendering.lod import lod
+from ..rendering.primitives import (
+    solid_cube, solid_sphere, cone_mesh, cube_mesh, sphere_mesh
+)
+from ..rendering.render_queue import render_queue
+from ..rendering.transforms import current_modelview, scaled, translated
+from ..rendering.textures import textures
 
 
 def draw_sky_gradient():
     """Draw a sky gradient background - light cyan at horizon to deep blue at top"""
-    glDisable(GL_LIGHTING)
-    glDepthMask(GL_FALSE)
+    gl_state.disable(GL_LIGHTING)
+    gl_state.depth_mask(False)
     
     glPushMatrix()
     
     glBegin(GL_QUADS)
     
     # Bottom vertices - light cyan (horizon)
-    glColor3f(0.53, 0.81, 0.92)
+    gl_state.color(0.53, 0.81, 0.92)
     glVertex3f(-800, -100, -600)
     glVertex3f(800, -100, -600)
     
     # Top vertices - deeper blue (zenith)
-    glColor3f(0.25, 0.41, 0.88)
+    gl_state.color(0.25, 0.41, 0.88)
     glVertex3f(800, 600, -600)
     glVertex3f(-800, 600, -600)
     
@@ -35,344 +43,357 @@ def draw_sky_gradient():
     
     glPopMatrix()
     
-    glDepthMask(GL_TRUE)
-    glEnable(GL_LIGHTING)
+    gl_state.depth_mask(True)
+    gl_state.enable(GL_LIGHTING)
+
+
+# Sun placement and glow layers (largest to smallest): (radius, r, g, b, alpha).
+# The outer layers were animated by the pulse, which now scales the whole quad.
+SUN_POSITION = (80.0, 120.0, -400.0)
+SUN_GLOW_LAYERS = [
+    (45.0, 1.0, 0.85, 0.3, 0.03),
+    (35.0, 1.0, 0.75, 0.2, 0.05),
+    (28.0, 1.0, 0.65, 0.1, 0.08),
+    (22.0, 1.0, 0.55, 0.0, 0.12),
+    (16.0, 1.0, 0.9, 0.4, 0.2),
+    (12.0, 1.0, 0.95, 0.7, 0.5),
+    (8.0, 1.0, 1.0, 0.9, 0.9),
+    (6.0, 1.0, 1.0, 0.95, 1.0),  # Core sun - bright white/yellow
+]
+SUN_RADIUS = SUN_GLOW_LAYERS[0][0]
+
+
+def make_sun_image(size: int = 256, smoothing: float = 0.03) -> np.ndarray:
+    """Radial gradient equivalent to alpha-blending the glow layers as discs"""
+    # Composite the layers back to front in premultiplied alpha, per radius
+    radii = np.linspace(0.0, 1.0, 1024)
+    premultiplied = np.zeros((len(radii), 3))
+    alpha = np.zeros(len(radii))
+    for radius, r, g, b, a in SUN_GLOW_LAYERS:
+        inside = radii <= radius / SUN_RADIUS
+        premultiplied[inside] = np.array([r, g, b]) * a + premultiplied[inside] * (1.0 - a)
+        alpha[inside] = a + alpha[inside] * (1.0 - a)
+    
+    # Soften the layer steps into a continuous gradient
+    window = max(1, int(smoothing * len(radii)))
+    kernel = np.ones(window) / window
+    premultiplied = np.stack([np.convolve(premultiplied[:, c], kernel, mode='same') for c in range(3)], axis=1)
+    alpha = np.convolve(alpha, kernel, mode='same')
+    
+    coords = np.linspace(-1.0, 1.0, size)
+    dist = np.sqrt(coords[None, :] ** 2 + coords[:, None] ** 2)
+    idx = np.minimum((dist * (len(radii) - 1)).astype(int), len(radii) - 1)
+    pixel_alpha = np.where(dist <= 1.0, alpha[idx], 0.0)
+    color = premultiplied[idx] / np.maximum(alpha[idx], 1e-6)[..., None]
+    
+    image = np.empty((size, size, 4), dtype=np.uint8)
+    image[..., :3] = np.clip(color * 255, 0, 255).astype(np.uint8)
+    image[..., 3] = np.clip(pixel_alpha * 255, 0, 255).astype(np.uint8)
+    return image
+
+
+def _camera_axes() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Current modelview matrix with the camera right and up axes in model space"""
+    modelview = np.asarray(glGetFloatv(GL_MODELVIEW_MATRIX), dtype=np.float64).reshape(4, 4)
+    return modelview, modelview[:3, 0], modelview[:3, 1]
 
 
 def draw_sun_with_glow():
     """Draw a sun with beautiful layered glow effect"""
-    glDisable(GL_LIGHTING)
-    glDepthMask(GL_FALSE)
-    
-    sun_x, sun_y, sun_z = 80.0, 120.0, -400.0
+    gl_state.disable(GL_LIGHTING)
+    gl_state.depth_mask(False)
     
     # Pulsating glow intensity
     pulse = 0.15 * math.sin(state.glow_time * 2.0) + 1.0
     
-    glPushMatrix()
-    glTranslated(sun_x, sun_y, sun_z)
-    
-    # Outer glow layers (largest to smallest for proper blending)
-    glow_layers = [
-        (45.0 * pulse, 1.0, 0.85, 0.3, 0.03),
-        (35.0 * pulse, 1.0, 0.75, 0.2, 0.05),
-        (28.0 * pulse, 1.0, 0.65, 0.1, 0.08),
-        (22.0 * pulse, 1.0, 0.55, 0.0, 0.12),
-        (16.0 * pulse, 1.0, 0.9, 0.4, 0.2),
-        (12.0, 1.0, 0.95, 0.7, 0.5),
-        (8.0, 1.0, 1.0, 0.9, 0.9),
-    ]
-    
-    for size, r, g, b, a in glow_layers:
-        glColor4f(r, g, b, a)
-        glutSolidSphere(size, 20, 20)
+    # One camera-facing quad carrying the whole pre-blended glow
+    _, right, up = _camera_axes()
+    size = SUN_RADIUS * pulse
+    center = np.array(SUN_POSITION)
+    corners = [center + (sx * right + sy * up) * size for sx, sy in ((-1, -1), (1, -1), (1, 1), (-1, 1))]
     
-    # Core sun - bright white/yellow
-    glColor3f(1.0, 1.0, 0.95)
-    glutSolidSphere(6.0, 25, 25)
-    
-    glPopMatrix()
+    gl_state.enable(GL_TEXTURE_2D)
+    glBindTexture(GL_TEXTURE_2D, textures.get('sun', make_sun_image))
+    gl_state.color(1.0, 1.0, 1.0, 1.0)
+    glBegin(GL_QUADS)
+    for (u, v), corner in zip(((0, 0), (1, 0), (1, 1), (0, 1)), corners):
+        glTexCoord2f(u, v)
+        glVertex3f(*corner)
+    glEnd()
+    glBindTexture(GL_TEXTURE_2D, 0)
+    gl_state.disable(GL_TEXTURE_2D)
     
-    glDepthMask(GL_TRUE)
-    glEnable(GL_LIGHTING)
+    gl_state.depth_mask(True)
+    gl_state.enable(GL_LIGHTING)
+
+
+# Cloud puffs in cloud-local coordinates: (x, y, z, radius)
+CLOUD_PUFFS = [
+    (0.0, 0.0, 0.0, 1.0),     # Main body
+    (-0.8, 0.1, 0.0, 0.7),    # Left puff
+    (0.9, 0.15, 0.0, 0.75),   # Right puff
+    (0.2, 0.5, 0.0, 0.6),     # Top puff
+    (-0.3, 0.0, 0.5, 0.55),   # Front puff
+    (0.4, 0.2, -0.4, 0.5),    # Back puff
+]
 
+# Vertical squash applied to every cloud
+CLOUD_FLATTEN = 0.6
 
-def draw_single_cloud(x: float, y: float, z: float, scale: float):
-    """Draw a single cloud cluster using grouped spheres"""
+# Impostor quad extent in cloud-local coordinates (before flattening)
+CLOUD_QUAD_X = (min(x - r for x, _, _, r in CLOUD_PUFFS) - 0.05, max(x + r for x, _, _, r in CLOUD_PUFFS) + 0.05)
+CLOUD_QUAD_Y = (min(y - r for _, y, _, r in CLOUD_PUFFS) - 0.05, max(y + r for _, y, _, r in CLOUD_PUFFS) + 0.05)
+
+
+def draw_single_cloud(x: float, y: float, z: float, scale: float, lod_key=None,
+                      modelview: Optional[np.ndarray] = None):
+    """Draw a single cloud cluster using grouped spheres (modelview: the current one, if known)"""
     glPushMatrix()
     glTranslated(x, y, z)
-    glScaled(scale, scale * 0.6, scale)
-    
-    glColor3f(1.0, 1.0, 1.0)
+    glScaled(scale, scale * CLOUD_FLATTEN, scale)
+    if modelview is not None:
+        modelview = scaled(translated(modelview, x, y, z), scale, scale * CLOUD_FLATTEN, scale)
     
-    # Main body
-    glutSolidSphere(1.0, 15, 15)
-    
-    # Left puff
-    glPushMatrix()
-    glTranslated(-0.8, 0.1, 0)
-    glutSolidSphere(0.7, 15, 15)
-    glPopMatrix()
-    
-    # Right puff
-    glPushMatrix()
-    glTranslated(0.9, 0.15, 0)
-    glutSolidSphere(0.75, 15, 15)
-    glPopMatrix()
+    slices, stacks = lod.detail(lod_key, 1.0, 15, 15, modelview)
     
-    # Top puff
-    glPushMatrix()
-    glTranslated(0.2, 0.5, 0)
-    glutSolidSphere(0.6, 15, 15)
-    glPopMatrix()
+    gl_state.color(1.0, 1.0, 1.0)
     
-    # Front puff
-    glPushMatrix()
-    glTranslated(-0.3, 0.0, 0.5)
-    glutSolidSphere(0.55, 15, 15)
-    glPopMatrix()
+    for px, py, pz, radius in CLOUD_PUFFS:
+        glPushMatrix()
+        glTranslated(px, py, pz)
+        solid_sphere(radius, slices, stacks)
+        glPopMatrix()
     
-    # Back puff
-    glPushMatrix()
-    glTranslated(0.4, 0.2, -0.4)
-    glutSolidSphere(0.5, 15, 15)
     glPopMatrix()
+
+
+def make_cloud_image(width: int = 128, height: int = 64) -> np.ndarray:
+    """Render the cloud silhouette seen from the front into an RGBA image"""
+    (x0, x1), (y0, y1) = CLOUD_QUAD_X, CLOUD_QUAD_Y
+    xs = np.linspace(x0, x1, width)[None, :]
+    ys = np.linspace(y0, y1, height)[:, None]
+    pixel = (x1 - x0) / width
+    
+    # Anti-aliased coverage of the union of the puff discs
+    coverage = np.zeros((height, width))
+    for px, py, _, radius in CLOUD_PUFFS:
+        dist = np.sqrt((xs - px) ** 2 + (ys - py) ** 2)
+        coverage = np.maximum(coverage, np.clip((radius - dist) / pixel + 0.5, 0.0, 1.0))
+    
+    image = np.full((height, width, 4), 255, dtype=np.uint8)
+    image[:, :, 3] = (coverage * 255).astype(np.uint8)
+    return image
+
+
+def draw_cloud_impostors():
+    """Draw every cloud as a camera-facing textured quad, back to front"""
+    if len(state.cloud_data) == 0:
+        return
     
-    glPopMatrix()
+    centers, scales = state.cloud_data['pos'], state.cloud_data['scale']
+    
+    # Camera right/up axes and eye depth from the modelview matrix
+    modelview, right, up = _camera_axes()
+    eye_z = centers @ modelview[:3, 2] + modelview[3, 2]
+    order = np.argsort(eye_z)
+    centers, scales = centers[order], scales[order]
+    
+    (x0, x1), (y0, y1) = CLOUD_QUAD_X, CLOUD_QUAD_Y
+    corners = np.array([[x0, y0], [x1, y0], [x1, y1], [x0, y1]])
+    offsets = corners[:, 0, None] * right + corners[:, 1, None] * CLOUD_FLATTEN * up
+    positions = centers[:, None, :] + scales[:, None, None] * offsets[None, :, :]
+    texcoords = np.tile([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]], (len(centers), 1))
+    vertices = np.hstack([texcoords, positions.reshape(-1, 3)]).astype(np.float32)
+    
+    gl_state.enable(GL_TEXTURE_2D)
+    glBindTexture(GL_TEXTURE_2D, textures.get('cloud', make_cloud_image))
+    gl_state.enable(GL_ALPHA_TEST)
+    glAlphaFunc(GL_GREATER, 0.0)
+    gl_state.color(1.0, 1.0, 1.0, 1.0)
+    
+    glInterleavedArrays(GL_T2F_V3F, 0, vertices)
+    glDrawArrays(GL_QUADS, 0, len(vertices))
+    
+    gl_state.disable(GL_ALPHA_TEST)
+    glBindTexture(GL_TEXTURE_2D, 0)
+    gl_state.disable(GL_TEXTURE_2D)
 
 
 def draw_clouds():
     """Draw multiple clouds scattered across the sky"""
-    glDisable(GL_LIGHTING)
+    gl_state.disable(GL_LIGHTING)
     
-    for cloud in state.cloud_data:
-        x, y, z, scale = cloud
-        draw_single_cloud(x, y, z, scale)
+    if state.cloud_mode == 'impostor':
+        draw_cloud_impostors()
+    else:
+        clouds = zip(state.cloud_data['pos'].tolist(), state.cloud_data['scale'].tolist())
+        modelview = current_modelview()
+        for idx, ((x, y, z), scale) in enumerate(clouds):
+            draw_single_cloud(x, y, z, scale, ('cloud', idx), modelview)
     
-    glEnable(GL_LIGHTING)
+    gl_state.enable(GL_LIGHTING)
 
 
-def draw_single_tree(x: float, y: float, z: float, scale: float = 1.0):
-    """Draw a single tree with trunk and foliage"""
-    glPushMatrix()
-    glTranslated(x, y, z)
-    glScaled(scale, scale, scale)
-    
-    # Tree trunk - brown
-    glColor3f(0.45, 0.25, 0.1)
-    glPushMatrix()
-    glTranslated(0, 0.4, 0)
-    glScaled(0.15, 0.8, 0.15)
-    glutSolidCube(1)
-    glPopMatrix()
-    
-    # Foliage layers
-    foliage_colors = [
-        (0.1, 0.5, 0.15),   # Dark green
-        (0.15, 0.6, 0.2),   # Medium green
-        (0.2, 0.65, 0.25),  # Light green
+# Tree model parts: (shape, offset, size, color), for a tree of scale 1 standing at the origin.
+# Foliage cones point up; their size is (base radius, height, base radius).
+TREE_PARTS = [
+    ('cube', (0, 0.4, 0), (0.15, 0.8, 0.15), (0.45, 0.25, 0.1)),  # Trunk - brown
+    ('cone', (0, 0.7, 0), (0.6, 0.8, 0.6), (0.1, 0.5, 0.15)),  # Bottom foliage - dark green
+    ('cone', (0, 1.1, 0), (0.5, 0.7, 0.5), (0.15, 0.6, 0.2)),  # Middle foliage - medium green
+    ('cone', (0, 1.5, 0), (0.35, 0.6, 0.35), (0.2, 0.65, 0.25)),  # Top foliage - light green
+]
+TREE_CONE_DETAIL = (12, 4)
+
+
+def upright_cone_mesh(slices: int, stacks: int) -> np.ndarray:
+    """Unit cone mesh turned to point along +Y (glRotated(-90, 1, 0, 0))"""
+    mesh = cone_mesh(slices, stacks).copy()
+    for column in (0, 3):  # normal, then vertex
+        y, z = mesh[:, column + 1].copy(), mesh[:, column + 2].copy()
+        mesh[:, column + 1], mesh[:, column + 2] = z, -y
+    return mesh
+
+
+def tree_parts() -> List[Part]:
+    """Unit meshes and placement of the tree model parts"""
+    return [
+        (cube_mesh() if shape == 'cube' else upright_cone_mesh(*TREE_CONE_DETAIL), offset, size, color, 0.0)
+        for shape, offset, size, color in TREE_PARTS
     ]
-    
-    # Bottom foliage layer
-    glColor3f(*foliage_colors[0])
-    glPushMatrix()
-    glTranslated(0, 0.7, 0)
-    glRotated(-90, 1, 0, 0)
-    glutSolidCone(0.6, 0.8, 12, 4)
-    glPopMatrix()
-    
-    # Middle foliage layer
-    glColor3f(*foliage_colors[1])
-    glPushMatrix()
-    glTranslated(0, 1.1, 0)
-    glRotated(-90, 1, 0, 0)
-    glutSolidCone(0.5, 0.7, 12, 4)
-    glPopMatrix()
-    
-    # Top foliage layer
-    glColor3f(*foliage_colors[2])
-    glPushMatrix()
-    glTranslated(0, 1.5, 0)
-    glRotated(-90, 1, 0, 0)
-    glutSolidCone(0.35, 0.6, 12, 4)
-    glPopMatrix()
-    
-    glPopMatrix()
 
 
-def generate_tree_positions():
-    """Generate random tree positions for the environment"""
-    if state.TREES_GENERATED:
-        return
-    
-    state.tree_positions = []
-    
-    # Generate trees around the edges, avoiding the center flight path
-    for _ in range(40):
-        side = random.choice([-1, 1])
-        x = side * random.uniform(6, 18)
-        z = random.uniform(-18, 18)
-        scale = random.uniform(0.8, 1.5)
-        state.tree_positions.append([x, 0.15, z, scale])
-    
-    state.TREES_GENERATED = True
+# All trees of a zone drawn as one batch
+tree_batch = InstancedMesh(tree_parts, static_lighting=True)
 
 
 def draw_trees():
-    """Draw all trees in the environment"""
-    for tree_data in state.tree_positions:
-        x, y, z, scale = tree_data
-        draw_single_tree(x, y, z, scale)
+    """Draw all trees in the environment with one batched call"""
+    trees = state.tree_positions
+    count = len(trees)
+    tree_batch.update(
+        (state.layout_version, state.population_version),
+        np.zeros(count), np.zeros((count, 3)), trees[:, :3], trees[:, 3],
+    )
+    tree_batch.draw()
 
 
 def draw_roads():
     """Draw roads in the environment"""
-    glColor3f(0.25, 0.25, 0.28)  # Dark gray asphalt
+    gl_state.color(0.25, 0.25, 0.28)  # Dark gray asphalt
     
     # Main horizontal road
     glPushMatrix()
     glTranslated(0, 0.16, 0)
     glScaled(EN_SIZE * 2, 0.02, 2.0)
-    glutSolidCube(1)
+    solid_cube(1)
     glPopMatrix()
     
     # Road markings - center line (yellow)
-    glColor3f(0.9, 0.8, 0.1)
+    gl_state.color(0.9, 0.8, 0.1)
     for i in range(-EN_SIZE, EN_SIZE, 3):
         glPushMatrix()
         glTranslated(i, 0.17, 0)
         glScaled(1.5, 0.01, 0.1)
-        glutSolidCube(1)
+        solid_cube(1)
         glPopMatrix()
     
     # Side roads perpendicular
-    glColor3f(0.25, 0.25, 0.28)
+    gl_state.color(0.25, 0.25, 0.28)
     
     # Left side road
     glPushMatrix()
     glTranslated(-10, 0.16, 0)
     glScaled(1.5, 0.02, EN_SIZE * 2)
-    glutSolidCube(1)
+    solid_cube(1)
     glPopMatrix()
     
     # Right side road
     glPushMatrix()
     glTranslated(10, 0.16, 0)
     glScaled(1.5, 0.02, EN_SIZE * 2)
-    glutSolidCube(1)
+    solid_cube(1)
     glPopMatrix()
 
 
-def init_vehicles():
-    """Initialize vehicle positions and properties"""
-    if len(state.vehicle_data) > 0:
-        return
-    
-    # Vehicle colors: [R, G, B]
-    vehicle_colors = [
-        [0.8, 0.1, 0.1],   # Red
-        [0.1, 0.1, 0.8],   # Blue
-        [0.9, 0.9, 0.1],   # Yellow
-        [0.1, 0.7, 0.1],   # Green
-        [0.9, 0.5, 0.0],   # Orange
-        [0.6, 0.1, 0.6],   # Purple
-        [0.2, 0.2, 0.2],   # Dark gray
-        [0.9, 0.9, 0.9],   # White
+# Vehicle model parts: (shape, offset, size, color, tint), in a car facing +Z.
+# A part's color is its color plus tint times the vehicle color.
+VEHICLE_PARTS = [
+    ('cube', (0, 0, 0), (0.5, 0.25, 0.8), (0.0, 0.0, 0.0), 1.0),  # Car body
+    ('cube', (0, 0.18, -0.05), (0.4, 0.2, 0.5), (0.0, 0.0, 0.0), 0.8),  # Roof/cabin
+    ('cube', (0.21, 0.18, -0.05), (0.01, 0.15, 0.4), (0.1, 0.1, 0.15), 0.0),  # Windows
+    ('cube', (-0.21, 0.18, -0.05), (0.01, 0.15, 0.4), (0.1, 0.1, 0.15), 0.0),
+] + [
+    ('wheel', (wx, -0.1, wz), (0.1, 0.1, 0.08), (0.1, 0.1, 0.1), 0.0)  # Wheels
+    for wx, wz in ((0.2, 0.25), (0.2, -0.25), (-0.2, 0.25), (-0.2, -0.25))
+] + [
+    ('cube', (hx, 0.0, 0.4), (0.08, 0.08, 0.02), (1.0, 1.0, 0.8), 0.0)  # Headlights
+    for hx in (0.15, -0.15)
+] + [
+    ('cube', (hx, 0.0, -0.4), (0.08, 0.06, 0.02), (0.9, 0.1, 0.1), 0.0)  # Taillights
+    for hx in (0.15, -0.15)
+]
+VEHICLE_HEIGHT = 0.35  # Y of the car body center
+VEHICLE_WHEEL_DETAIL = (6, 4)  # Wheel tessellation in the batch (what LOD picks at road distance)
+
+
+def vehicle_parts() -> List[Part]:
+    """Unit meshes and placement of the vehicle model parts"""
+    return [
+        (cube_mesh() if shape == 'cube' else sphere_mesh(*VEHICLE_WHEEL_DETAIL), offset, size, color, tint)
+        for shape, offset, size, color, tint in VEHICLE_PARTS
     ]
-    
-    for i in range(NUM_VEHICLES):
-        x_pos = random.uniform(-18, 18)
-        speed_val = random.uniform(0.03, 0.08)
-        color_idx = random.randint(0, len(vehicle_colors) - 1)
-        
-        # Alternate vehicles between two lanes
-        if i % 2 == 0:
-            lane_z = -0.5
-            direction = 1
-        else:
-            lane_z = 0.5
-            direction = -1
-        
-        state.vehicle_data.append([x_pos, lane_z, direction, speed_val, color_idx, vehicle_colors[color_idx]])
 
 
-def update_vehicles():
-    """Update vehicle positions - make them move horizontally along X-axis"""
-    for vehicle in state.vehicle_data:
-        vehicle[0] += vehicle[2] * vehicle[3]  # x += direction * speed
-        
-        # Wrap around when reaching edge of road
-        if vehicle[0] > 20:
-            vehicle[0] = -20
-        elif vehicle[0] < -20:
-            vehicle[0] = 20
+# All vehicles drawn as one batch
+vehicle_batch = InstancedMesh(vehicle_parts)
+
+
+def vehicle_headings(axis: np.ndarray, direction: np.ndarray) -> np.ndarray:
+    """Rotation about Y (degrees) that faces each vehicle along its travel direction"""
+    along_x = np.where(direction > 0, 90.0, -90.0)
+    along_z = np.where(direction > 0, 0.0, 180.0)
+    return np.where(axis == 0, along_x, along_z)
 
 
-def draw_single_vehicle(x: float, z: float, direction: int, color: List[float]):
+# Per-vehicle immediate-mode drawing, kept as the baseline the traffic
+# benchmark times the batch against
+def draw_single_vehicle(x: float, z: float, heading: float, color: List[float], lod_key=None):
     """Draw a single vehicle (simple car shape)"""
     glPushMatrix()
-    glTranslated(x, 0.35, z)
-    
-    # Rotate car to face direction of travel
-    if direction > 0:
-        glRotated(90, 0, 1, 0)
-    else:
-        glRotated(-90, 0, 1, 0)
-    
-    # Car body
-    glColor3f(color[0], color[1], color[2])
-    glPushMatrix()
-    glScaled(0.5, 0.25, 0.8)
-    glutSolidCube(1)
-    glPopMatrix()
+    glTranslated(x, VEHICLE_HEIGHT, z)
     
-    # Car roof/cabin
-    glColor3f(color[0] * 0.8, color[1] * 0.8, color[2] * 0.8)
-    glPushMatrix()
-    glTranslated(0, 0.18, -0.05)
-    glScaled(0.4, 0.2, 0.5)
-    glutSolidCube(1)
-    glPopMatrix()
+    wheel_detail = lod.detail(lod_key, 0.1, 8, 8)
     
-    # Windows (dark)
-    glColor3f(0.1, 0.1, 0.15)
-    glPushMatrix()
-    glTranslated(0.21, 0.18, -0.05)
-    glScaled(0.01, 0.15, 0.4)
-    glutSolidCube(1)
-    glPopMatrix()
-    
-    glPushMatrix()
-    glTranslated(-0.21, 0.18, -0.05)
-    glScaled(0.01, 0.15, 0.4)
-    glutSolidCube(1)
-    glPopMatrix()
+    # Rotate car to face direction of travel
+    glRotated(heading, 0, 1, 0)
     
-    # Wheels (black)
-    glColor3f(0.1, 0.1, 0.1)
-    wheel_positions = [(0.2, -0.1, 0.25), (0.2, -0.1, -0.25),
-                       (-0.2, -0.1, 0.25), (-0.2, -0.1, -0.25)]
-    for wx, wy, wz in wheel_positions:
+    for shape, offset, size, part_color, tint in VEHICLE_PARTS:
+        gl_state.color(*(c + tint * v for c, v in zip(part_color, color)))
         glPushMatrix()
-        glTranslated(wx, wy, wz)
-        glScaled(0.1, 0.1, 0.08)
-        glutSolidSphere(1, 8, 8)
+        glTranslated(*offset)
+        glScaled(*size)
+        if shape == 'cube':
+            solid_cube(1)
+        else:
+            solid_sphere(1, *wheel_detail)
         glPopMatrix()
     
-    # Headlights (front)
-    glColor3f(1.0, 1.0, 0.8)
-    glPushMatrix()
-    glTranslated(0.15, 0.0, 0.4)
-    glScaled(0.08, 0.08, 0.02)
-    glutSolidCube(1)
-    glPopMatrix()
-    
-    glPushMatrix()
-    glTranslated(-0.15, 0.0, 0.4)
-    glScaled(0.08, 0.08, 0.02)
-    glutSolidCube(1)
-    glPopMatrix()
-    
-    # Taillights (back, red)
-    glColor3f(0.9, 0.1, 0.1)
-    glPushMatrix()
-    glTranslated(0.15, 0.0, -0.4)
-    glScaled(0.08, 0.06, 0.02)
-    glutSolidCube(1)
-    glPopMatrix()
-    
-    glPushMatrix()
-    glTranslated(-0.15, 0.0, -0.4)
-    glScaled(0.08, 0.06, 0.02)
-    glutSolidCube(1)
-    glPopMatrix()
-    
     glPopMatrix()
 
 
-def draw_vehicles():
-    """Draw all vehicles moving horizontally on the road"""
-    for vehicle in state.vehicle_data:
-        x, z, direction, _, _, color = vehicle
-        draw_single_vehicle(x, z, direction, color)
+def update_vehicle_batch():
+    """Move the vehicle batch to the current vehicle positions (once per frame, before drawing)"""
+    vehicles = state.vehicle_data
+    count = len(vehicles)
+    translations = np.column_stack([vehicles['x'], np.full(count, VEHICLE_HEIGHT), vehicles['z']])
+    vehicle_batch.update(
+        (state.layout_version, state.population_version),
+        vehicle_headings(vehicles['axis'], vehicles['direction']),
+        np.asarray(VEHICLE_COLORS)[vehicles['color']],
+        translations,
+    )
+
 
+def draw_vehicles(matrix: Optional[np.ndarray] = None):
+    """Draw all vehicles on the roads with one batched call, through the render queue"""
+    render_queue.submit(vehicle_batch.draw, center=(0.0, VEHICLE_HEIGHT, 0.0), matrix=matrix)
@@ -1,13 +1,17 @@
 """
 Rendering module for Plane Game
 """
-from .text import draw_stroke_text, draw_stroke_text_large, draw_stroke_char
-from .scene import draw_scene, draw_environment, draw_shaheed_minar_env
+from .scene import (
+    draw_scene, draw_shaheed_minar_env,
+    draw_zone
+)
+from .meshes import draw_plane_mesh
 from .display import display, resize
 
 __all__ = [
-    'draw_stroke_text', 'draw_stroke_text_large', 'draw_stroke_char',
-    'draw_scene', 'draw_environment', 'draw_shaheed_minar_env',
+    'draw_scene', 'draw_shaheed_minar_env',
+    'draw_zone',
+    'draw_plane_mesh',
     'display', 'resize'
 ]
 
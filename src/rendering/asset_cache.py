@@ -0,0 +1,103 @@
+"""
+On-disk cache of baked geometry
+
+Baked buffers are saved as .npy files, one directory per entry, and
+memory-mapped on the next launch so they can be handed to GL without
+being read into memory first. An entry is named after what it holds and
+a hash of its parameters, so the same model placed twice gets two
+entries, and of the source it was baked from: editing a model, the
+primitives or the settings it reads (tessellation, palettes) makes the
+old entry miss, and it is removed when the new one is saved.
+"""
+import hashlib
+import importlib
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from ..config import ASSET_CACHE, ASSET_CACHE_DIR
+
+
+@lru_cache(maxsize=None)
+def source_digest(modules: Tuple[str, ...]) -> str:
+    """Hash of the source files of the given modules and packages"""
+    digest = hashlib.sha1()
+    for name in sorted(modules):
+        module = importlib.import_module(name)
+        if hasattr(module, '__path__'):
+            directory = list(module.__path__)[0]
+            paths = sorted(os.path.join(directory, f) for f in os.listdir(directory) if f.endswith('.py'))
+        else:
+            paths = [module.__file__]
+        for path in paths:
+            digest.update(os.path.basename(path).encode())
+            with open(path, 'rb') as source:
+                digest.update(source.read())
+    return digest.hexdigest()[:16]
+
+
+def value_digest(value: object) -> str:
+    """Short stable hash of a parameter or settings tuple"""
+    return hashlib.sha1(repr(value).encode()).hexdigest()[:16]
+
+
+class AssetCache:
+    """Named arrays stored per (name, parameters, source) under a directory"""
+
+    def __init__(self, directory: str, enabled: bool = True):
+        self.directory = directory
+        self.enabled = enabled
+
+    def _entry(self, name: str, params: object) -> str:
+        """Entry prefix shared by every source version of (name, params)"""
+        return f'{name}-{value_digest(params)}-'
+
+    def load(self, name: str, params: object, source: str) -> Optional[Dict[str, np.ndarray]]:
+        """Memory-map the arrays saved for (name, params, source), or None on a miss"""
+        if not self.enabled:
+            return None
+        path = os.path.join(self.directory, self._entry(name, params) + source)
+        if not os.path.isdir(path):
+            return None
+        try:
+            return {
+                file[:-4]: np.load(os.path.join(path, file), mmap_mode='r')
+                for file in sorted(os.listdir(path)) if file.endswith('.npy')
+            }
+        except (OSError, ValueError):
+            # Truncated or unreadable: drop it so it is baked again
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+
+    def save(self, name: str, params: object, source: str, arrays: Dict[str, np.ndarray]):
+        """Store arrays for (name, params, source), replacing stale versions"""
+        if not self.enabled:
+            return
+        prefix = self._entry(name, params)
+        staging = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            for entry in os.listdir(self.directory):
+                if entry.startswith(prefix) and entry != prefix + source:
+                    shutil.rmtree(os.path.join(self.directory, entry), ignore_errors=True)
+            # Written aside and renamed into place, so an entry is never seen half saved
+            staging = tempfile.mkdtemp(prefix='.staging-', dir=self.directory)
+            for key, array in arrays.items():
+                np.save(os.path.join(staging, key + '.npy'), array)
+            os.replace(staging, os.path.join(self.directory, prefix + source))
+        except OSError:
+            # Read-only or full disk: keep going with the in-memory copy
+            if staging is not None:
+                shutil.rmtree(staging, ignore_errors=True)
+
+    def clear(self):
+        """Delete every cached entry"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+# Global baked geometry cache
+asset_cache = AssetCache(ASSET_CACHE_DIR, ASSET_CACHE)
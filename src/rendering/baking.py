@@ -0,0 +1,170 @@
+"""
+Startup baking of the traced static models
+
+Tracing a model is plain Python and NumPy work, independent per model,
+so the models missing from the trace cache are fanned out over a process
+pool while the main process creates the window and shows the menu. Each
+worker traces one model and leaves its buffers in shared memory; the main
+process maps them and adopts them into the trace cache (and the on-disk
+asset cache) as they complete, and waits for the rest only when the
+first game frame needs the scene. Without a pool the models are traced
+one per menu frame instead.
+
+The pool and shared memory modules are imported only when a pool is
+needed, so a start with a warm disk cache does not pay for them.
+"""
+import os
+from concurrent.futures import Future, as_completed
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from ..config import BAKE_WORKERS, LOD_LEVELS, TRACE_STATIC_MODELS
+from ..models.landmarks import draw_radio_tower_structure, draw_national_parliament_structure
+from ..models.plane import PLANE_DETAIL, draw_plane
+from .lod import lod
+from .scene import (
+    SHAHEED_MINAR_ZONE, SHAHEED_MINARS, ZONE_PARLIAMENTS, ZONE_RADIO_TOWERS,
+    draw_shaheed_minar_ground, draw_shaheed_minar_placed, draw_zone_base, zone_layout
+)
+from .trace import TracedMesh, trace, trace_cache
+
+# A traced batch left in shared memory: (lit, block name, shape)
+SharedBatch = Tuple[bool, str, Tuple[int, ...]]
+
+
+class BakeJob(NamedTuple):
+    """A model to trace: function, arguments and forced level of detail"""
+    build: Callable
+    args: tuple = ()
+    level: Optional[int] = None
+
+
+def static_model_jobs() -> List[BakeJob]:
+    """Every model the scene draws from a traced mesh"""
+    if not TRACE_STATIC_MODELS:
+        return []
+    jobs = [BakeJob(draw_plane, (detail,)) for detail in PLANE_DETAIL]
+    jobs.append(BakeJob(draw_shaheed_minar_ground))
+    jobs.extend(BakeJob(draw_shaheed_minar_placed, placement) for placement in SHAHEED_MINARS)
+    zones = sorted({n for n, _ in zone_layout()} - {SHAHEED_MINAR_ZONE})
+    jobs.extend(BakeJob(draw_zone_base, (n,)) for n in zones)
+    for placements in ZONE_RADIO_TOWERS.values():
+        jobs.extend(BakeJob(draw_radio_tower_structure, placement) for placement in placements)
+    # Parliaments are baked once per detail level
+    for placements in ZONE_PARLIAMENTS.values():
+        jobs.extend(BakeJob(draw_national_parliament_structure, placement, level)
+                    for placement in placements for level in range(len(LOD_LEVELS)))
+    return jobs
+
+
+def bake_worker(job: BakeJob) -> List[SharedBatch]:
+    """Trace a job in a worker process, leaving its buffers in shared memory"""
+    from multiprocessing import shared_memory
+
+    with lod.forced_level(job.level):
+        mesh = trace(job.build, *job.args)
+    batches = []
+    for lit, vertices in mesh.batches:
+        block = shared_memory.SharedMemory(create=True, size=max(vertices.nbytes, 1))
+        np.ndarray(vertices.shape, vertices.dtype, buffer=block.buf)[:] = vertices
+        batches.append((lit, block.name, vertices.shape))
+        block.close()
+    return batches
+
+
+class Baker:
+    """Trace jobs in a process pool (or in turn) and adopt the results"""
+
+    def __init__(self):
+        self._executor = None  # ProcessPoolExecutor while jobs are pending
+        self._pending: Dict[Future, BakeJob] = {}
+        self._serial: List[BakeJob] = []
+        # Shared memory blocks stay mapped while the adopted meshes use them
+        self._blocks = []
+
+    def start(self, jobs: List[BakeJob], workers: Optional[int] = BAKE_WORKERS):
+        """Begin baking the jobs that are not cached yet"""
+        jobs = [job for job in jobs if not self._cached(job)]
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        if workers <= 1:
+            self._serial = jobs
+            return
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import resource_tracker
+
+        # Share one tracker with the workers, so their blocks are not
+        # unlinked when a worker exits before the results are adopted
+        resource_tracker.ensure_running()
+        self._executor = ProcessPoolExecutor(workers)
+        self._pending = {self._executor.submit(bake_worker, job): job for job in jobs}
+
+    @property
+    def busy(self) -> bool:
+        """Whether any job is still waiting to be adopted"""
+        return bool(self._serial or self._pending)
+
+    def poll(self):
+        """Adopt the results that are ready, or trace one serial job, without waiting"""
+        if self._serial:
+            self._trace(self._serial.pop(0))
+        for future in [future for future in self._pending if future.done()]:
+            self._adopt(self._pending.pop(future), future.result())
+        self._stop_when_done()
+
+    def finish(self):
+        """Adopt every result as it completes"""
+        while self._serial:
+            self._trace(self._serial.pop(0))
+        try:
+            for future in as_completed(list(self._pending)):
+                self._adopt(self._pending.pop(future), future.result())
+        finally:
+            self._pending = {}
+            self._stop_when_done()
+
+    def _stop_when_done(self):
+        """Shut the pool down once nothing is pending"""
+        if self._executor is not None and not self._pending:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _trace(self, job: BakeJob):
+        """Trace a job in this process"""
+        with lod.forced_level(job.level):
+            trace_cache.get(job.build, *job.args)
+
+    def _cached(self, job: BakeJob) -> bool:
+        """Whether a job's mesh is already in memory or on disk"""
+        with lod.forced_level(job.level):
+            return trace_cache.lookup(job.build, *job.args) is not None
+
+    def _adopt(self, job: BakeJob, batches: List[SharedBatch]):
+        """Map a worker's buffers and keep them as the job's traced mesh"""
+        from multiprocessing import shared_memory
+
+        blocks = []
+        for _, name, _ in batches:
+            block = shared_memory.SharedMemory(name=name)
+            block.unlink()  # the mapping lives on until the block is closed
+            blocks.append(block)
+        with lod.forced_level(job.level):
+            if trace_cache.lookup(job.build, *job.args) is not None:
+                # A frame needed the model first and traced it here
+                for block in blocks:
+                    block.close()
+                return
+            mesh = TracedMesh([(lit, np.ndarray(shape, np.float32, buffer=block.buf))
+                               for (lit, _, shape), block in zip(batches, blocks)])
+            trace_cache.store(job.build, job.args, mesh)
+        self._blocks.extend(blocks)
+
+
+def bake(jobs: List[BakeJob], workers: Optional[int] = BAKE_WORKERS):
+    """Bake the jobs and wait for all of them"""
+    baker.start(jobs, workers)
+    baker.finish()
+
+
+# Global startup baker
+baker = Baker()
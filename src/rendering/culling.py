@@ -0,0 +1,60 @@
+"""
+View-frustum culling against axis-aligned bounding boxes
+"""
+from typing import Optional, Sequence
+
+import numpy as np
+from OpenGL.GL import *
+
+
+class Frustum:
+    """The six clip planes of the current view, as (a, b, c, d) rows
+
+    A point p is inside a plane when a*x + b*y + c*z + d >= 0.
+    """
+
+    def __init__(self, planes: np.ndarray):
+        self.planes = planes
+
+    @classmethod
+    def from_gl(cls, modelview: Optional[np.ndarray] = None) -> 'Frustum':
+        """Extract the planes from the current projection and modelview matrices
+
+        The planes are expressed in the coordinate frame of the modelview
+        (the current one unless given), i.e. the frame geometry is drawn in.
+        """
+        if modelview is None:
+            modelview = glGetFloatv(GL_MODELVIEW_MATRIX)
+        modelview = np.asarray(modelview, dtype=np.float64).reshape(4, 4)
+        projection = np.asarray(glGetFloatv(GL_PROJECTION_MATRIX), dtype=np.float64).reshape(4, 4)
+        # GL matrices read back column-major, i.e. transposed for row vectors
+        clip = modelview @ projection
+        planes = np.array([
+            clip[:, 3] + clip[:, 0],  # left
+            clip[:, 3] - clip[:, 0],  # right
+            clip[:, 3] + clip[:, 1],  # bottom
+            clip[:, 3] - clip[:, 1],  # top
+            clip[:, 3] + clip[:, 2],  # near
+            clip[:, 3] - clip[:, 2],  # far
+        ])
+        return cls(planes)
+
+    def translated(self, dx: float, dy: float, dz: float) -> 'Frustum':
+        """Return the frustum as seen from a child frame translated by (dx, dy, dz)"""
+        planes = self.planes.copy()
+        planes[:, 3] += planes[:, :3] @ np.array([dx, dy, dz])
+        return Frustum(planes)
+
+    def intersects_box(self, lo: Sequence[float], hi: Sequence[float]) -> bool:
+        """Check whether an axis-aligned box may be visible"""
+        normals = self.planes[:, :3]
+        # Corner of the box furthest along each plane normal
+        corner = np.where(normals >= 0, hi, lo)
+        return bool(np.all(np.einsum('ij,ij->i', normals, corner) + self.planes[:, 3] >= 0))
+
+    def visible_boxes(self, los: np.ndarray, his: np.ndarray) -> np.ndarray:
+        """Vectorized intersects_box for (N, 3) arrays of box corners"""
+        normals = self.planes[:, :3]
+        corners = np.where(normals[None, :, :] >= 0, his[:, None, :], los[:, None, :])
+        dist = np.einsum('pj,npj->np', normals, corners) + self.planes[None, :, 3]
+        return np.all(dist >= 0, axis=1)
@@ -2,16 +2,27 @@
 Main display and window functions
 """
 import time
+from typing import Hashable, Optional
 
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 
+from ..config import CAMERA_EYE, CAMERA_CENTER, CAMERA_UP
 from ..game_state import state
-from ..models.plane import draw_plane
+from ..startup import startup
+from ..simulation import simulation, snapshot, interpolated, Snapshot
+from ..timing import FixedTimestep
 from ..models.environment import draw_sky_gradient, draw_sun_with_glow, draw_clouds
-from .text import draw_stroke_text, draw_stroke_text_large, draw_stroke_char
 from .scene import draw_scene
+from .lod import lod
+from .meshes import draw_plane_mesh
+from .stats import render_stats
+from .hud import hud
+from .scheduler import scheduler
+from .frame_cache import frame_cache
+from .baking import baker
+from .glstate import gl_state
 
 
 def resize(width: int, height: int):
@@ -22,136 +33,131 @@ def resize(width: int, height: int):
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
     glFrustum(-ar, ar, -1.0, 1.0, 2.0, 1000.0)
+    lod.set_projection(2.0, height)  # near / top of the frustum
+    hud.set_viewport(width, height)
     
     glMatrixMode(GL_MODELVIEW)
     glLoadIdentity()
 
 
-def display():
-    """Display callback function"""
-    t = (time.time() - state.start_time)
-    a = t * 90.0
-    aa = a
+# Fixed-step clock and the state before the last simulation step
+timestep = FixedTimestep()
+_previous: Optional[Snapshot] = None
 
-    if not state.rot:
-        a = 0
 
-    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-    glLoadIdentity()
+def advance_simulation():
+    """Run the simulation steps that are due since the previous frame"""
+    global _previous
+    steps = timestep.advance()
+    render_stats.count('sim_steps', steps)
+    # Inputs wait for the next step when no step is due this frame
+    for idx in range(steps):
+        was_playing = current_screen() == 'playing'
+        if idx == steps - 1:
+            _previous = snapshot()
+        simulation.step(simulation.take_inputs(), timestep.dt)
+        if not was_playing and current_screen() == 'playing':
+            # Time spent on the menu or paused is not caught up on
+            _previous = snapshot()
+            timestep.reset()
+            break
 
-    gluLookAt(0.0, 4.5, 10.0,
-              0, 4, 0,
-              0, 1.0, 0.0)
 
-    # Draw sky elements (background)
-    draw_sky_gradient()
+def display():
+    """Display callback function"""
+    advance_simulation()
+    with interpolated(_previous, timestep.alpha):
+        render()
+    
+    render_stats.end_frame()
+    swap_start = time.perf_counter()
+    glutSwapBuffers()
+    scheduler.frame_done(time.perf_counter() - swap_start)
+    startup.first_frame()
+    if baker.busy:
+        baker.poll()
+
 
+def current_screen() -> str:
+    """Name of the screen being shown"""
     if state.GAME_OVER:
-        glPushMatrix()
-        glTranslated(0, 2, 0)
-        glRotated(aa, 0, 1, 0)
-        glScaled(1.5, 1.5, 1.5)
-        draw_plane()
-        glPopMatrix()
+        return 'game_over'
+    if state.START:
+        return 'paused' if state.PAUSED else 'playing'
+    return 'menu'
+
+
+def frame_signature(screen: str) -> Optional[Hashable]:
+    """State the background of a screen depends on, or None if it animates"""
+    viewport = tuple(int(v) for v in glGetIntegerv(GL_VIEWPORT))
+    if screen in ('menu', 'game_over'):
+        return (screen, viewport)
+    if screen == 'paused' and not state.rot:
+        view = snapshot()
+        return (screen, viewport, state.zoom, state.cloud_mode, state.layout_version,
+                state.play_time, view.zones.tobytes(), view.attitude.tobytes(),
+                view.clouds.tobytes(), view.vehicles.tobytes())
+    return None
+
+
+def draw_background(screen: str, angle: float):
+    """Draw the sky and, during a game, the 3D scene"""
+    # Draw sky elements (background)
+    draw_sky_gradient()
 
-        draw_stroke_text_large("GAME OVER", -2, -0.5, 0)
-        draw_stroke_text("Press G to Restart or M for Main Menu", -3.5, -1.5, 0)
-
-        # Display final score and time
-        draw_stroke_text("TIME : ", -1, -2, 0)
-        time_val = state.TIME
-        digits = []
-        if time_val == 0:
-            digits.append(0)
-        else:
-            while time_val > 0:
-                digits.append(time_val % 10)
-                time_val //= 10
-            digits.reverse()
-
-        tmp = 0.0
-        for digit in digits:
-            draw_stroke_char(str(digit), 0.0 + tmp, -2, 0)
-            tmp += 0.2
-
-        draw_stroke_text("SCORE : ", -1, -2.5, 0)
-        score_val = state.SCORE
-        score_digits = []
-        if score_val == 0:
-            score_digits.append(0)
-        else:
-            while score_val > 0:
-                score_digits.append(score_val % 10)
-                score_val //= 10
-            score_digits.reverse()
-
-        tmp = 0.0
-        for digit in score_digits:
-            draw_stroke_char(str(digit), 0.3 + tmp, -2.5, 0)
-            tmp += 0.2
-
-    elif state.START:
-        draw_sky_gradient()
+    if screen in ('playing', 'paused'):
+        baker.finish()
         draw_sun_with_glow()
         draw_clouds()
         glPushMatrix()
-        glTranslated(0, 0, 0)
         glScaled(state.zoom, state.zoom, state.zoom)
-        glRotated(a, 0, 1, 0)
+        glRotated(angle, 0, 1, 0)
         draw_scene()
         glPopMatrix()
-        
-        draw_stroke_text("ARROW KEYS: Move Plane, +/- or Mouse Wheel: Zoom, SPACE: Pause, MAIN MENU: M", -8, 0.9, 0)
-        
-        # Display PAUSED indicator
-        if state.PAUSED:
-            draw_stroke_text_large("PAUSED", -1, 2, 0)
-        draw_stroke_text("TIME : ", 3, 0, 0)
-
-        # Draw time digits
-        time_val = state.TIME
-        digits = []
-        if time_val == 0:
-            digits.append(0)
-        else:
-            while time_val > 0:
-                digits.append(time_val % 10)
-                time_val //= 10
-            digits.reverse()
-
-        tmp = 0.0
-        for digit in digits:
-            draw_stroke_char(str(digit), 4 + tmp, 0, 0)
-            tmp += 0.2
-
-        # Draw score below time
-        draw_stroke_text("SCORE : ", 3, -0.5, 0)
-
-        # Draw score digits
-        score_val = state.SCORE
-        score_digits = []
-        if score_val == 0:
-            score_digits.append(0)
-        else:
-            while score_val > 0:
-                score_digits.append(score_val % 10)
-                score_val //= 10
-            score_digits.reverse()
-
-        tmp = 0.0
-        for digit in score_digits:
-            draw_stroke_char(str(digit), 4.3 + tmp, -0.5, 0)
-            tmp += 0.2
-    else:
+
+
+def draw_foreground(screen: str, plane_angle: float):
+    """Draw the animated menu plane and the HUD"""
+    if screen in ('menu', 'game_over'):
         glPushMatrix()
-        glTranslated(0, 3, 0)
-        glRotated(aa, 0, 1, 0)
+        glTranslated(0, 3 if screen == 'menu' else 2, 0)
+        glRotated(plane_angle, 0, 1, 0)
         glScaled(1.5, 1.5, 1.5)
-        draw_plane()
+        draw_plane_mesh()
         glPopMatrix()
-        
-        draw_stroke_text("Press G to Start", -1, -1, 0)
-        draw_stroke_text_large("Plane Game", -2, 0, 0)
-    
-    glutSwapBuffers()
 
+    # Display PAUSED indicator
+    if screen == 'paused':
+        hud.draw('playing', 'paused')
+    else:
+        hud.draw(screen)
+
+
+def render():
+    """Draw the current frame, reusing the cached background of static screens"""
+    t = (time.time() - state.start_time)
+    a = t * 90.0
+    aa = a
+
+    if not state.rot:
+        a = 0
+
+    # State set outside the tracker (setup, GLUT) is not known to it
+    gl_state.invalidate()
+    glLoadIdentity()
+
+    gluLookAt(*CAMERA_EYE, *CAMERA_CENTER, *CAMERA_UP)
+
+    screen = current_screen()
+    key = frame_signature(screen)
+    if frame_cache.matches(key):
+        glClear(GL_DEPTH_BUFFER_BIT)
+        frame_cache.present()
+    else:
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        draw_background(screen, a)
+        # The copy is left to the second frame so the first shows sooner
+        if key is not None and startup.done:
+            frame_cache.capture(key)
+
+    draw_foreground(screen, aa)
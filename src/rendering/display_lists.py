@@ -0,0 +1,51 @@
+"""
+Display list caching for static geometry
+"""
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from OpenGL.GL import *
+
+from .glstate import gl_state, StateEffects
+
+
+class DisplayListCache:
+    """Compile draw functions into display lists once and replay them"""
+
+    def __init__(self):
+        # List id and the GL state the list leaves behind, per key
+        self._lists: Dict[Hashable, Tuple[int, Optional[StateEffects]]] = {}
+        self._version = None
+
+    def sync(self, version: Hashable):
+        """Drop all compiled lists if the data they were built from changed"""
+        if version != self._version:
+            self.clear()
+            self._version = version
+
+    def call(self, key: Hashable, build: Callable, *args):
+        """Draw the list for key, compiling it from build(*args) on first use"""
+        entry = self._lists.get(key)
+        if entry is None:
+            list_id = glGenLists(1)
+            glNewList(list_id, GL_COMPILE)
+            gl_state.begin_list()
+            compiled = False
+            try:
+                build(*args)
+                compiled = True
+            finally:
+                effects = gl_state.end_list()
+                glEndList()
+                if not compiled:
+                    # Drop the half-built list so the next call compiles it again
+                    glDeleteLists(list_id, 1)
+            entry = (list_id, effects)
+            self._lists[key] = entry
+        glCallList(entry[0])
+        gl_state.after_list(entry[1])
+
+    def clear(self):
+        """Delete all compiled lists"""
+        for list_id, _ in self._lists.values():
+            glDeleteLists(list_id, 1)
+        self._lists.clear()
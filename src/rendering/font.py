@@ -0,0 +1,158 @@
+"""
+Font atlas texture for the HUD overlay
+
+The GLUT stroke font is captured once through GL_FEEDBACK, so nothing is
+drawn to the window, and its line segments are rasterized with NumPy into
+an anti-aliased coverage texture with one cell per printable ASCII glyph.
+Text is then laid out as textured quads in stroke font units. The image
+is kept in the on-disk asset cache, so later launches skip the capture.
+"""
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+from OpenGL.GLUT import *
+
+from .asset_cache import asset_cache, source_digest
+from .textures import textures
+
+FONT = GLUT_STROKE_ROMAN
+FONT_ASCENT = 119.05  # Stroke units above the baseline
+FONT_DESCENT = 33.33  # Stroke units below the baseline
+FIRST_CHAR = 32
+LAST_CHAR = 126
+
+ATLAS_COLUMNS = 16
+ATLAS_SCALE = 0.32  # Atlas pixels per stroke unit
+ATLAS_PADDING = 2  # Pixels around each glyph cell
+STROKE_WIDTH = 6.0  # Line width in stroke units (about one pixel at normal HUD size)
+
+# Normal and large HUD text scales (HUD units per stroke unit)
+TEXT_SCALE = 0.002
+TEXT_SCALE_LARGE = 0.005
+
+
+def capture_glyph(code: int) -> np.ndarray:
+    """Line segments of a stroke glyph as an (N, 2, 2) array in font units"""
+    origin = np.array([FONT_ASCENT, FONT_ASCENT])
+    size = int(4 * FONT_ASCENT)
+
+    glPushAttrib(GL_VIEWPORT_BIT | GL_TRANSFORM_BIT)
+    glViewport(0, 0, size, size)
+    glMatrixMode(GL_PROJECTION)
+    glPushMatrix()
+    glLoadIdentity()
+    glOrtho(0, size, 0, size, -1, 1)
+    glMatrixMode(GL_MODELVIEW)
+    glPushMatrix()
+    glLoadIdentity()
+    glTranslatef(origin[0], origin[1], 0)
+
+    # Window coordinates equal the translated font coordinates
+    glFeedbackBuffer(4096, GL_2D)
+    glRenderMode(GL_FEEDBACK)
+    glutStrokeCharacter(FONT, code)
+    feedback = glRenderMode(GL_RENDER)
+
+    glPopMatrix()
+    glMatrixMode(GL_PROJECTION)
+    glPopMatrix()
+    glPopAttrib()
+
+    segments = [[v.vertex[:2] for v in item[1:3]] for item in feedback
+                if len(item) == 3 and hasattr(item[1], 'vertex')]
+    if not segments:
+        return np.zeros((0, 2, 2))
+    return np.asarray(segments, dtype=np.float64) - origin
+
+
+def rasterize_segments(segments: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Anti-aliased coverage of thick line segments in a glyph cell"""
+    coverage = np.zeros((height, width))
+    if len(segments) == 0:
+        return coverage
+
+    # Pixel centers in font units, row 0 at the bottom like GL textures
+    xs = (np.arange(width) + 0.5 - ATLAS_PADDING) / ATLAS_SCALE
+    ys = (np.arange(height) + 0.5 - ATLAS_PADDING) / ATLAS_SCALE - FONT_DESCENT
+    points = np.stack(np.meshgrid(xs, ys), axis=-1).reshape(-1, 1, 2)
+
+    # Distance from every pixel to every segment
+    start = segments[None, :, 0]
+    direction = segments[None, :, 1] - start
+    length_sq = np.maximum(np.einsum('psj,psj->ps', direction, direction), 1e-9)
+    along = np.clip(np.einsum('psj,psj->ps', points - start, direction) / length_sq, 0.0, 1.0)
+    nearest = start + along[..., None] * direction
+    distance = np.sqrt(np.min(np.sum((points - nearest) ** 2, axis=-1), axis=1))
+
+    pixels = (STROKE_WIDTH * 0.5 - distance) * ATLAS_SCALE + 0.5
+    return np.clip(pixels, 0.0, 1.0).reshape(height, width)
+
+
+class FontAtlas:
+    """Glyph atlas texture and quad layout for a range of ASCII characters"""
+
+    def __init__(self):
+        self.advances: Dict[int, float] = {}
+        self.cells: Dict[int, Tuple[float, float, float, float]] = {}
+        self.cell_width = 0
+        self.cell_height = 0
+
+    def make_image(self) -> np.ndarray:
+        """Lay out the glyph cells and return the atlas image, from disk if cached"""
+        codes = list(range(FIRST_CHAR, LAST_CHAR + 1))
+        self.advances = {code: float(glutStrokeWidth(FONT, code)) for code in codes}
+
+        self.cell_width = math.ceil(max(self.advances.values()) * ATLAS_SCALE) + 2 * ATLAS_PADDING
+        self.cell_height = math.ceil((FONT_ASCENT + FONT_DESCENT) * ATLAS_SCALE) + 2 * ATLAS_PADDING
+        rows = math.ceil(len(codes) / ATLAS_COLUMNS)
+        width, height = ATLAS_COLUMNS * self.cell_width, rows * self.cell_height
+        origins = {}
+        for idx, code in enumerate(codes):
+            x = (idx % ATLAS_COLUMNS) * self.cell_width
+            y = (idx // ATLAS_COLUMNS) * self.cell_height
+            origins[code] = (x, y)
+            self.cells[code] = (x / width, y / height,
+                                (x + self.cell_width) / width, (y + self.cell_height) / height)
+
+        source = source_digest((__name__,))
+        cached = asset_cache.load('font_atlas', (), source)
+        if cached is not None and cached['image'].shape == (height, width, 4):
+            return cached['image']
+
+        image = np.zeros((height, width, 4), dtype=np.uint8)
+        image[..., :3] = 255
+        for code, (x, y) in origins.items():
+            coverage = rasterize_segments(capture_glyph(code), self.cell_width, self.cell_height)
+            image[y:y + self.cell_height, x:x + self.cell_width, 3] = np.round(coverage * 255)
+        asset_cache.save('font_atlas', (), source, {'image': image})
+        return image
+
+    def texture(self) -> int:
+        """The atlas texture, generated on first use"""
+        return textures.get('font_atlas', self.make_image)
+
+    def quads(self, text: str, x: float, y: float, scale: float) -> np.ndarray:
+        """Interleaved GL_T2F_V3F quads for text with its baseline at (x, y)"""
+        pad = ATLAS_PADDING / ATLAS_SCALE
+        bottom = y + (-FONT_DESCENT - pad) * scale
+        top = bottom + self.cell_height / ATLAS_SCALE * scale
+
+        vertices: List[Tuple[float, ...]] = []
+        pen = x
+        for char in text:
+            code = ord(char)
+            if code not in self.cells:
+                code = ord('?')
+            u0, v0, u1, v1 = self.cells[code]
+            left = pen - pad * scale
+            right = left + self.cell_width / ATLAS_SCALE * scale
+            vertices += [(u0, v0, left, bottom, 0.0), (u1, v0, right, bottom, 0.0),
+                         (u1, v1, right, top, 0.0), (u0, v1, left, top, 0.0)]
+            pen += self.advances[code] * scale
+        return np.array(vertices, dtype=np.float32).reshape(-1, 5)
+
+
+# Global HUD font atlas
+font_atlas = FontAtlas()
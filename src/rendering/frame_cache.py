@@ -0,0 +1,92 @@
+"""
+Re-presenting unchanged frames from a texture
+
+Static screens (pause, and the sky behind the menu and game-over plane)
+are rendered once, copied from the back buffer into a texture and then
+drawn as a single screen-sized quad until the state they depend on
+changes. Only the animated parts are drawn on top each frame.
+"""
+from typing import Hashable, Optional, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+from .glstate import gl_state
+from .stats import render_stats
+from .textures import create_texture
+
+
+class FrameCache:
+    """The last rendered background of a static screen, kept in a texture"""
+
+    def __init__(self):
+        self.texture: Optional[int] = None
+        self.size: Tuple[int, int] = (0, 0)
+        self.key: Optional[Hashable] = None
+
+    def matches(self, key: Optional[Hashable]) -> bool:
+        """Check whether the cached frame was rendered from the given state"""
+        return key is not None and key == self.key
+
+    def capture(self, key: Hashable):
+        """Copy the back buffer into the texture and remember its state key"""
+        x, y, width, height = (int(v) for v in glGetIntegerv(GL_VIEWPORT))
+        if (width, height) != self.size:
+            if self.texture is not None:
+                glDeleteTextures([self.texture])
+            self.texture = create_texture(np.zeros((height, width, 4), dtype=np.uint8), smooth=False)
+            self.size = (width, height)
+
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glCopyTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, x, y, width, height)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        self.key = key
+        render_stats.count('frames_captured')
+
+    def present(self):
+        """Draw the cached frame over the whole viewport"""
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glLoadIdentity()
+        glOrtho(0.0, 1.0, 0.0, 1.0, -1.0, 1.0)
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+
+        gl_state.disable(GL_LIGHTING)
+        gl_state.disable(GL_DEPTH_TEST)
+        gl_state.disable(GL_BLEND)
+        gl_state.enable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        gl_state.color(1.0, 1.0, 1.0, 1.0)
+
+        glBegin(GL_QUADS)
+        glTexCoord2f(0.0, 0.0)
+        glVertex2f(0.0, 0.0)
+        glTexCoord2f(1.0, 0.0)
+        glVertex2f(1.0, 0.0)
+        glTexCoord2f(1.0, 1.0)
+        glVertex2f(1.0, 1.0)
+        glTexCoord2f(0.0, 1.0)
+        glVertex2f(0.0, 1.0)
+        glEnd()
+
+        glBindTexture(GL_TEXTURE_2D, 0)
+        gl_state.disable(GL_TEXTURE_2D)
+        gl_state.enable(GL_BLEND)
+        gl_state.enable(GL_DEPTH_TEST)
+        gl_state.enable(GL_LIGHTING)
+
+        glPopMatrix()
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+        render_stats.count('frames_reused')
+
+    def invalidate(self):
+        """Force the next frame to be rendered in full"""
+        self.key = None
+
+
+# Global frame cache
+frame_cache = FrameCache()
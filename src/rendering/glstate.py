@@ -0,0 +1,104 @@
+"""
+Redundant GL state filtering
+
+Drawing code sets the current color, capabilities, depth mask and blend
+function through the global gl_state, which remembers the last value and
+drops calls that would not change anything before they reach PyOpenGL.
+
+While a display list is being compiled nothing is executed, so the state
+seen by the list is tracked separately (starting unknown) and the frame
+state is restored afterwards. What the list leaves behind is returned by
+end_list() and applied with after_list() each time the list is replayed.
+State that changes behind the tracker's back, such as drawing with a
+color array, must be forgotten with invalidate() or invalidate_color().
+"""
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from OpenGL.GL import *
+
+from .stats import render_stats
+
+# Tracked values by key: 'color', 'depth_mask', 'blend_func' or a capability.
+# A missing key or None means the value is unknown.
+StateEffects = Dict[Hashable, object]
+
+
+class GLState:
+    """Last known GL state, used to skip calls that would not change it"""
+
+    def __init__(self):
+        self._known: StateEffects = {}
+        self._reset = False  # everything became unknown inside the list being compiled
+        self._saved: List[Tuple[StateEffects, bool]] = []
+
+    @property
+    def compiling(self) -> bool:
+        """Whether a display list is being compiled"""
+        return bool(self._saved)
+
+    def _change(self, key: Hashable, value: object) -> bool:
+        """Record a new value, returning False when it is already set"""
+        if value is not None and self._known.get(key) == value:
+            render_stats.count('gl_calls_elided')
+            return False
+        self._known[key] = value
+        render_stats.count('gl_calls_issued')
+        return True
+
+    def color(self, r: float, g: float, b: float, a: float = 1.0):
+        """Set the current color (glColor3*/glColor4*)"""
+        value = (float(r), float(g), float(b), float(a))
+        if self._change('color', value):
+            glColor4f(*value)
+
+    def enable(self, cap: int):
+        """Enable a capability (glEnable)"""
+        if self._change(cap, True):
+            glEnable(cap)
+
+    def disable(self, cap: int):
+        """Disable a capability (glDisable)"""
+        if self._change(cap, False):
+            glDisable(cap)
+
+    def depth_mask(self, flag: bool):
+        """Enable or disable depth buffer writes (glDepthMask)"""
+        if self._change('depth_mask', bool(flag)):
+            glDepthMask(GL_TRUE if flag else GL_FALSE)
+
+    def blend_func(self, src: int, dst: int):
+        """Set the blend factors (glBlendFunc)"""
+        if self._change('blend_func', (src, dst)):
+            glBlendFunc(src, dst)
+
+    def invalidate_color(self):
+        """Forget the current color (after drawing with a color array)"""
+        self._known['color'] = None
+
+    def invalidate(self):
+        """Forget all tracked state"""
+        self._known = {}
+        self._reset = True
+
+    def begin_list(self):
+        """Track the state of a display list being compiled, starting unknown"""
+        self._saved.append((self._known, self._reset))
+        self._known = {}
+        self._reset = False
+
+    def end_list(self) -> Optional[StateEffects]:
+        """Return to the frame state, giving what the list leaves behind (None: unknown)"""
+        effects = None if self._reset else self._known
+        self._known, self._reset = self._saved.pop()
+        return effects
+
+    def after_list(self, effects: Optional[StateEffects]):
+        """Account for the state changes of a replayed display list"""
+        if effects is None:
+            self.invalidate()
+        else:
+            self._known.update(effects)
+
+
+# Global GL state tracker
+gl_state = GLState()
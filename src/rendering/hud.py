@@ -0,0 +1,170 @@
+"""
+Heads-up display drawn as a 2D overlay pass
+
+All HUD strings of a frame are laid out as textured quads from the font
+atlas and drawn with one vertex array under an orthographic projection,
+with lighting and depth testing off. Static labels are laid out once per
+screen; number fields keep one quad per digit slot and only rewrite the
+slots whose digit changed. The combined array is rebuilt only when the
+set of screens or a number changes.
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+from ..config import HUD_TEXT_COLOR
+from ..game_state import state
+from .font import TEXT_SCALE, TEXT_SCALE_LARGE, font_atlas
+from .glstate import gl_state
+from .stats import render_stats
+
+CONTROLS_TEXT = "ARROW KEYS: Move Plane, +/- or Mouse Wheel: Zoom, SPACE: Pause, MAIN MENU: M"
+
+# Static labels per screen: (text, x, y, scale)
+HUD_LABELS: Dict[str, List[Tuple[str, float, float, float]]] = {
+    'menu': [
+        ("Press G to Start", -1, -1, TEXT_SCALE),
+        ("Plane Game", -2, 0, TEXT_SCALE_LARGE),
+    ],
+    'playing': [
+        (CONTROLS_TEXT, -8, 0.9, TEXT_SCALE),
+        ("TIME : ", 3, 0, TEXT_SCALE),
+        ("SCORE : ", 3, -0.5, TEXT_SCALE),
+    ],
+    'paused': [
+        ("PAUSED", -1, 2, TEXT_SCALE_LARGE),
+    ],
+    'game_over': [
+        ("GAME OVER", -2, -0.5, TEXT_SCALE_LARGE),
+        ("Press G to Restart or M for Main Menu", -3.5, -1.5, TEXT_SCALE),
+        ("TIME : ", -1, -2, TEXT_SCALE),
+        ("SCORE : ", -1, -2.5, TEXT_SCALE),
+    ],
+}
+
+# Number fields per screen: (state attribute, x, y)
+HUD_FIELDS: Dict[str, List[Tuple[str, float, float]]] = {
+    'playing': [('TIME', 4.0, 0), ('SCORE', 4.3, -0.5)],
+    'game_over': [('TIME', 0.0, -2), ('SCORE', 0.3, -2.5)],
+}
+
+# Overlay units: the text plane (z = 0) as the gameplay camera sees it, which
+# is where HUD text used to be drawn in world space
+HUD_BOTTOM = -1.0
+HUD_TOP = 9.0
+HUD_BASELINE = 8.0  # Offset added to every label and field y
+
+DIGIT_SPACING = 0.2
+MAX_DIGITS = 10
+
+
+class NumberField:
+    """A state value drawn as digits, one quad per digit slot"""
+
+    def __init__(self, attr: str, x: float, y: float):
+        self.attr = attr
+        self.x = x
+        self.y = y
+        self.vertices = np.zeros((MAX_DIGITS * 4, 5), dtype=np.float32)
+        self.text = ''
+
+    def update(self) -> bool:
+        """Rewrite the slots whose digit differs from the current value"""
+        text = str(max(int(getattr(state, self.attr)), 0))[:MAX_DIGITS]
+        if text == self.text:
+            return False
+        for idx in range(MAX_DIGITS):
+            digit = text[idx:idx + 1]
+            if digit == self.text[idx:idx + 1]:
+                continue
+            slot = self.vertices[idx * 4:(idx + 1) * 4]
+            if digit:
+                slot[:] = font_atlas.quads(digit, self.x + idx * DIGIT_SPACING,
+                                           self.y + HUD_BASELINE, TEXT_SCALE)
+            else:
+                slot[:] = 0.0  # Degenerate quad
+            render_stats.count('hud_digits_streamed')
+        self.text = text
+        return True
+
+
+class Hud:
+    """Batched HUD text for the screens shown in a frame"""
+
+    def __init__(self):
+        self.aspect = 1.0
+        self._labels: Dict[str, np.ndarray] = {}
+        self._fields: Dict[str, List[NumberField]] = {}
+        self._batch: Optional[np.ndarray] = None
+        self._batch_screens: Tuple[str, ...] = ()
+
+    def set_viewport(self, width: int, height: int):
+        """Record the window aspect ratio for the overlay projection"""
+        self.aspect = width / height if height > 0 else 1.0
+
+    def load(self):
+        """Generate the font atlas (call once a GL context exists)"""
+        font_atlas.texture()
+
+    def _layout(self, screen: str):
+        """Lay out the static labels and create the number fields of a screen"""
+        quads = [font_atlas.quads(text, x, y + HUD_BASELINE, scale)
+                 for text, x, y, scale in HUD_LABELS[screen]]
+        self._labels[screen] = np.vstack(quads)
+        self._fields[screen] = [NumberField(*spec) for spec in HUD_FIELDS.get(screen, [])]
+
+    def _vertices(self, screens: Tuple[str, ...]) -> np.ndarray:
+        """All quads for the screens, reusing the last batch when nothing changed"""
+        changed = screens != self._batch_screens
+        for screen in screens:
+            if screen not in self._labels:
+                self._layout(screen)
+            for field in self._fields[screen]:
+                changed = field.update() or changed
+        if changed or self._batch is None:
+            parts = []
+            for screen in screens:
+                parts.append(self._labels[screen])
+                parts.extend(field.vertices for field in self._fields[screen])
+            self._batch = np.ascontiguousarray(np.vstack(parts))
+            self._batch_screens = screens
+        return self._batch
+
+    def draw(self, *screens: str):
+        """Draw the text of the given screens in one overlay pass"""
+        texture = font_atlas.texture()
+        vertices = self._vertices(screens)
+
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glLoadIdentity()
+        half_height = (HUD_TOP - HUD_BOTTOM) * 0.5
+        glOrtho(-half_height * self.aspect, half_height * self.aspect, HUD_BOTTOM, HUD_TOP, -1.0, 1.0)
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+
+        gl_state.disable(GL_LIGHTING)
+        gl_state.disable(GL_DEPTH_TEST)
+        gl_state.enable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, texture)
+        gl_state.color(*HUD_TEXT_COLOR, 1.0)
+
+        glInterleavedArrays(GL_T2F_V3F, 0, vertices)
+        glDrawArrays(GL_QUADS, 0, len(vertices))
+        render_stats.count('hud_glyphs', len(vertices) // 4)
+
+        glBindTexture(GL_TEXTURE_2D, 0)
+        gl_state.disable(GL_TEXTURE_2D)
+        gl_state.enable(GL_DEPTH_TEST)
+        gl_state.enable(GL_LIGHTING)
+
+        glPopMatrix()
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+
+
+# Global HUD
+hud = Hud()
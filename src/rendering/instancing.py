@@ -0,0 +1,131 @@
+"""
+Batched drawing of many copies of a mesh
+
+Fixed-function OpenGL has no per-instance attributes, so instances are
+expanded with NumPy into one indexed vertex array. The parts of each
+instance that only change with the instance set (rotated vertices,
+normals and colors) are cached, and a frame only rewrites the positions
+that moved before issuing a single glDrawElements call. Instances that
+never turn after they are set (trees) can be drawn with their lighting
+baked into the colors.
+"""
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+from .glstate import gl_state
+from .lighting import baked_lighting, bake_colors
+from .stats import render_stats
+
+# (unit mesh as GL_N3F_V3F triangles, offset, size, color, tint)
+Part = Tuple[np.ndarray, Sequence[float], Sequence[float], Sequence[float], float]
+
+
+def _indexed(mesh: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge the duplicate vertices of a triangle array into an indexed mesh"""
+    vertices, indices = np.unique(mesh, axis=0, return_inverse=True)
+    return vertices, indices.reshape(-1).astype(np.uint32)
+
+
+class InstancedMesh:
+    """One model built from scaled and offset parts, drawn for many instances
+
+    Each part's color is its own color plus tint times the instance color.
+    Instances are rotated about the Y axis by their heading and optionally
+    scaled uniformly about their origin. The parts are built and merged
+    when the first instances are set. With static_lighting the instances
+    are drawn unlit with baked colors while baked lighting is on.
+    """
+
+    def __init__(self, parts: Callable[[], Sequence[Part]], static_lighting: bool = False):
+        self._parts = parts
+        self.static_lighting = static_lighting
+        self.positions: Optional[np.ndarray] = None  # template, built on first use
+
+        self._vertices: Optional[np.ndarray] = None  # (N, V, 10) GL_C4F_N3F_V3F
+        self._local: Optional[np.ndarray] = None  # (N, V, 3) rotated template
+        self._all_indices: Optional[np.ndarray] = None
+        self._instances_key = None
+        self._translations: Optional[np.ndarray] = None
+        self._baked: Optional[np.ndarray] = None  # _vertices with lit colors
+
+    def _build_template(self):
+        """Merge the parts into one indexed template mesh"""
+        positions, normals, colors, tints, indices = [], [], [], [], []
+        count = 0
+        for mesh, offset, size, color, tint in self._parts():
+            vertices, part_indices = _indexed(mesh)
+            part_normals = vertices[:, :3] / np.asarray(size)
+            positions.append(vertices[:, 3:] * size + offset)
+            normals.append(part_normals / np.linalg.norm(part_normals, axis=1, keepdims=True))
+            colors.append(np.tile(color, (len(vertices), 1)))
+            tints.append(np.full(len(vertices), tint))
+            indices.append(part_indices + count)
+            count += len(vertices)
+
+        self.positions = np.vstack(positions)
+        self.normals = np.vstack(normals)
+        self.colors = np.vstack(colors)
+        self.tints = np.concatenate(tints)
+        self.indices = np.concatenate(indices)
+
+    def set_instances(self, headings: np.ndarray, colors: np.ndarray, scales: Optional[np.ndarray] = None):
+        """Build the per-instance rotation, scale and color parts (headings in degrees)"""
+        if self.positions is None:
+            self._build_template()
+        angles = np.radians(headings)
+        cos, sin = np.cos(angles)[:, None], np.sin(angles)[:, None]
+
+        def rotate(points: np.ndarray) -> np.ndarray:
+            x, y, z = points[:, 0], points[:, 1], points[:, 2]
+            return np.stack(np.broadcast_arrays(
+                cos * x + sin * z, y[None, :], cos * z - sin * x
+            ), axis=-1)
+
+        count, size = len(headings), len(self.positions)
+        vertices = np.empty((count, size, 10), dtype=np.float32)
+        vertices[:, :, :3] = self.colors[None] + self.tints[None, :, None] * colors[:, None, :]
+        vertices[:, :, 3] = 1.0
+        vertices[:, :, 4:7] = rotate(self.normals)
+        self._local = rotate(self.positions)
+        if scales is not None:
+            self._local *= np.asarray(scales)[:, None, None]
+        self._local = self._local.astype(np.float32)
+        vertices[:, :, 7:] = self._local
+
+        self._vertices = vertices
+        offsets = (np.arange(count, dtype=np.uint32) * size)[:, None]
+        self._all_indices = (self.indices[None, :] + offsets).reshape(-1)
+        self._translations = None
+        self._baked = None
+
+    def update(self, key, headings: np.ndarray, colors: np.ndarray, translations: np.ndarray,
+               scales: Optional[np.ndarray] = None):
+        """Refresh the batch for the instance set identified by key and its translations"""
+        if key != self._instances_key:
+            self.set_instances(headings, colors, scales)
+            self._instances_key = key
+        if self._translations is None or not np.array_equal(translations, self._translations):
+            np.add(self._local, translations[:, None, :], out=self._vertices[:, :, 7:], casting='unsafe')
+            self._translations = translations.copy()
+            self._baked = None
+            render_stats.count('instances_moved', len(translations))
+
+    def draw(self):
+        """Draw every instance with one call"""
+        if self._vertices is None or len(self._vertices) == 0:
+            return
+        vertices = self._vertices
+        baked = self.static_lighting and baked_lighting()
+        if baked:
+            if self._baked is None:
+                self._baked = bake_colors(self._vertices, 0, 4)
+            vertices = self._baked
+            gl_state.disable(GL_LIGHTING)
+        glInterleavedArrays(GL_C4F_N3F_V3F, 0, vertices)
+        glDrawElements(GL_TRIANGLES, len(self._all_indices), GL_UNSIGNED_INT, self._all_indices)
+        gl_state.invalidate_color()
+        if baked:
+            gl_state.enable(GL_LIGHTING)
+        render_stats.count('instanced_draws')
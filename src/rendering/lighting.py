@@ -0,0 +1,67 @@
+"""
+Static lighting baked into vertex colors
+
+The scene has one directional light, fixed in eye space, and scenery is
+only ever translated under the camera, so its lighting cannot change
+while the view does not spin. lit_colors() evaluates the fixed-function
+model (GL_COLOR_MATERIAL on ambient and diffuse, the LIGHT_* and MAT_*
+settings, an infinite viewer) once per vertex on the CPU, and static
+meshes are then drawn with those colors and lighting off. The plane and
+the vehicles turn, so they keep being lit per frame.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from ..config import (
+    BAKE_STATIC_LIGHTING, CAMERA_EYE, CAMERA_CENTER, CAMERA_UP,
+    LIGHT_AMBIENT, LIGHT_DIFFUSE, LIGHT_SPECULAR, LIGHT_POSITION, MAT_SPECULAR, HIGH_SHININESS
+)
+from ..game_state import state
+
+# Global ambient light (GL's default, main() does not change the light model)
+LIGHT_MODEL_AMBIENT = (0.2, 0.2, 0.2, 1.0)
+
+
+@lru_cache(maxsize=None)
+def view_rotation() -> np.ndarray:
+    """Rotation gluLookAt applies to world directions (rows: right, up, back)"""
+    eye, center, up = (np.array(v, dtype=np.float64) for v in (CAMERA_EYE, CAMERA_CENTER, CAMERA_UP))
+    forward = center - eye
+    forward /= np.linalg.norm(forward)
+    side = np.cross(forward, up)
+    side /= np.linalg.norm(side)
+    return np.array([side, np.cross(side, forward), -forward])
+
+
+def lit_colors(colors: np.ndarray, normals: np.ndarray) -> np.ndarray:
+    """RGBA that lighting gives (N, 4) colors with (N, 3) world-space normals"""
+    normals = normals @ view_rotation().T
+    normals = normals / np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+    light = np.array(LIGHT_POSITION[:3], dtype=np.float64)
+    light /= np.linalg.norm(light)
+    half = light + (0.0, 0.0, 1.0)
+    half /= np.linalg.norm(half)
+
+    diffuse = normals @ light
+    facing = diffuse > 0
+    specular = np.where(facing, np.maximum(normals @ half, 0.0), 0.0) ** HIGH_SHININESS[0]
+    rgb = colors[:, :3] * (np.add(LIGHT_MODEL_AMBIENT[:3], LIGHT_AMBIENT[:3])
+                           + np.maximum(diffuse, 0.0)[:, None] * LIGHT_DIFFUSE[:3]) \
+        + specular[:, None] * np.multiply(LIGHT_SPECULAR[:3], MAT_SPECULAR[:3])
+    return np.hstack([np.clip(rgb, 0.0, 1.0), colors[:, 3:4]])
+
+
+def bake_colors(vertices: np.ndarray, color_column: int, normal_column: int) -> np.ndarray:
+    """Copy of an interleaved vertex array with its RGBA colors replaced by their lit values"""
+    baked = np.array(vertices, dtype=np.float32)
+    colors = baked[..., color_column:color_column + 4].reshape(-1, 4)
+    normals = baked[..., normal_column:normal_column + 3].reshape(-1, 3)
+    baked[..., color_column:color_column + 4] = lit_colors(colors, normals).reshape(
+        baked.shape[:-1] + (4,))
+    return baked
+
+
+def baked_lighting() -> bool:
+    """Whether static meshes are drawn with baked lighting this frame"""
+    return BAKE_STATIC_LIGHTING and not state.rot
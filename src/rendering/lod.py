@@ -0,0 +1,127 @@
+"""
+Distance-based level of detail for curved primitives
+
+Models ask for the tessellation of a sphere, cone or torus through the global
+``lod`` selector. The selector projects the primitive's bounding radius to
+the screen with the current modelview matrix (which already combines the
+camera set up in display(), state.zoom and the model's own placement) and
+picks the coarsest level whose silhouette error stays below
+LOD_MAX_ERROR_PIXELS. Dropping to a coarser level requires an extra
+LOD_HYSTERESIS margin so objects near a threshold do not flicker.
+"""
+import math
+from contextlib import contextmanager
+from typing import Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+from ..config import (
+    WINDOW_HEIGHT, LOD_LEVELS, LOD_MAX_ERROR_PIXELS, LOD_HYSTERESIS,
+    LOD_MIN_SLICES, LOD_MIN_STACKS
+)
+
+
+class LodSelector:
+    """Pick tessellation levels from projected screen size"""
+
+    def __init__(self, levels: Sequence[float] = LOD_LEVELS,
+                 max_error: float = LOD_MAX_ERROR_PIXELS, hysteresis: float = LOD_HYSTERESIS):
+        self.levels = tuple(levels)
+        self.max_error = max_error
+        self.hysteresis = hysteresis
+        self.focal = 2.0
+        self.viewport_height = WINDOW_HEIGHT
+        # Distinguishes repeated instances of the same zone in hysteresis keys
+        self.scope: Hashable = None
+        self._forced: Optional[int] = None
+        self._current: Dict[Hashable, int] = {}
+
+    @property
+    def forced(self) -> Optional[int]:
+        """The level every selection returns, if one is forced"""
+        return self._forced
+
+    def set_projection(self, focal: float, viewport_height: int):
+        """Record the projection (near / top of the frustum) and viewport height"""
+        self.focal = focal
+        self.viewport_height = viewport_height
+
+    def projected_radius(self, radius: float, modelview: Optional[np.ndarray] = None,
+                         center: Sequence[float] = (0.0, 0.0, 0.0)) -> float:
+        """Screen-space radius in pixels of a sphere in the modelview frame"""
+        if modelview is None:
+            modelview = np.asarray(glGetFloatv(GL_MODELVIEW_MATRIX), dtype=np.float64).reshape(4, 4)
+        eye = np.append(center, 1.0) @ modelview
+        depth = -eye[2]
+        if depth <= 0.0:
+            return 0.0
+        scale = math.sqrt(max(np.einsum('ij,ij->i', modelview[:3, :3], modelview[:3, :3])))
+        return radius * scale * self.focal / depth * self.viewport_height * 0.5
+
+    def _coarsest(self, base_slices: int, needed: float) -> int:
+        """Coarsest level that still has at least the needed number of slices"""
+        level = 0
+        for idx, fraction in enumerate(self.levels):
+            if base_slices * fraction >= needed:
+                level = idx
+        return level
+
+    def select(self, key: Hashable, pixel_radius: float, base_slices: int) -> int:
+        """Choose a level for an object of the given on-screen radius
+
+        Pass key=None for objects without a stable identity (no hysteresis).
+        """
+        if self._forced is not None:
+            return self._forced
+
+        # Slices needed to keep the polygon-to-circle sag under max_error
+        needed = math.pi * math.sqrt(pixel_radius / (2.0 * self.max_error))
+        target = self._coarsest(base_slices, needed)
+        if key is None:
+            return target
+
+        key = (self.scope, key)
+        current = self._current.get(key)
+        if current is not None and target > current:
+            # Only drop detail once the object is clearly past the threshold
+            target = max(current, self._coarsest(base_slices, needed * (1.0 + self.hysteresis)))
+        self._current[key] = target
+        return target
+
+    def level(self, key: Hashable, radius: float, base_slices: int,
+              center: Sequence[float] = (0.0, 0.0, 0.0), modelview: Optional[np.ndarray] = None) -> int:
+        """Choose a level for a primitive of the given radius at the current (or given) matrix"""
+        if self._forced is not None:
+            return self._forced
+        return self.select(key, self.projected_radius(radius, modelview, center), base_slices)
+
+    def scaled(self, level: int, slices: int, stacks: int) -> Tuple[int, int]:
+        """Tessellation of a primitive at a level"""
+        fraction = self.levels[level]
+        return (max(LOD_MIN_SLICES, round(slices * fraction)),
+                max(LOD_MIN_STACKS, round(stacks * fraction)))
+
+    def detail(self, key: Hashable, radius: float, slices: int, stacks: int,
+               modelview: Optional[np.ndarray] = None) -> Tuple[int, int]:
+        """Slices and stacks for a primitive of the given radius at the current (or given) matrix"""
+        return self.scaled(self.level(key, radius, slices, modelview=modelview), slices, stacks)
+
+    @contextmanager
+    def forced_level(self, level: int):
+        """Use a fixed level, e.g. while baking one level into a display list"""
+        previous = self._forced
+        self._forced = level
+        try:
+            yield
+        finally:
+            self._forced = previous
+
+    def build_at_level(self, level: int, build, *args):
+        """Call build(*args) with the level forced"""
+        with self.forced_level(level):
+            build(*args)
+
+
+# Global level of detail selector
+lod = LodSelector()
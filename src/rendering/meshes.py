@@ -0,0 +1,18 @@
+"""
+Cached meshes for models that are drawn every frame
+"""
+from ..config import TRACE_STATIC_MODELS
+from ..models.plane import draw_plane
+from .display_lists import DisplayListCache
+from .trace import traced
+
+# Compiled plane model, one display list per tessellation level
+plane_cache = DisplayListCache()
+
+# Plane model as compiled: its traced mesh, or the immediate-mode calls
+PLANE_MODEL = traced(draw_plane) if TRACE_STATIC_MODELS else draw_plane
+
+
+def draw_plane_mesh(detail: str = 'high'):
+    """Draw the plane model from its compiled display list"""
+    plane_cache.call(detail, PLANE_MODEL, detail)
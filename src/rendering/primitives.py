@@ -0,0 +1,176 @@
+"""
+Cached primitive meshes (cube, sphere, torus, cone) built with NumPy
+
+Drop-in replacements for glutSolidCube, glutSolidSphere, glutSolidTorus and
+glutSolidCone. Each shape is generated once per tessellation key and drawn
+from an interleaved normal/vertex array instead of being re-tessellated by
+GLUT on every call. Shapes follow the GLUT conventions: spheres, tori and
+cones are built around the Z axis and cones sit on the Z=0 plane.
+"""
+from typing import Callable, Dict, Hashable
+
+import numpy as np
+from OpenGL.GL import *
+
+# Interleaved GL_N3F_V3F triangle arrays keyed by shape and tessellation
+_meshes: Dict[Hashable, np.ndarray] = {}
+
+
+def _grid_triangles(positions: np.ndarray, normals: np.ndarray) -> np.ndarray:
+    """Triangulate a (rows, cols, 3) vertex grid into an interleaved array
+
+    Grids are laid out so that (row step) x (column step) points outwards,
+    which makes the triangles wind counter-clockwise seen from the front.
+    """
+    v00 = np.stack([positions[:-1, :-1], normals[:-1, :-1]])
+    v01 = np.stack([positions[:-1, 1:], normals[:-1, 1:]])
+    v10 = np.stack([positions[1:, :-1], normals[1:, :-1]])
+    v11 = np.stack([positions[1:, 1:], normals[1:, 1:]])
+
+    # Two triangles per quad: (00, 10, 11) and (00, 11, 01)
+    tris = np.stack([v00, v10, v11, v00, v11, v01], axis=3)
+    points = tris[0].reshape(-1, 3)
+    norms = tris[1].reshape(-1, 3)
+    return np.hstack([norms, points]).astype(np.float32)
+
+
+def _build_cube() -> np.ndarray:
+    """Unit cube centered on the origin, one flat normal per face"""
+    faces = []
+    for axis in range(3):
+        for sign in (1.0, -1.0):
+            normal = np.zeros(3)
+            normal[axis] = sign
+            # Two in-plane axes ordered so that u x v == normal
+            u_axis, v_axis = (axis + 1) % 3, (axis + 2) % 3
+            u = np.zeros(3)
+            v = np.zeros(3)
+            u[u_axis] = 0.5
+            v[v_axis] = 0.5 * sign
+            center = normal * 0.5
+            corners = [center - u - v, center + u - v, center + u + v, center - u + v]
+            for idx in (0, 1, 2, 0, 2, 3):
+                faces.append(np.concatenate([normal, corners[idx]]))
+    return np.array(faces, dtype=np.float32)
+
+
+def _build_sphere(slices: int, stacks: int) -> np.ndarray:
+    """Unit sphere with its poles on the Z axis"""
+    phi = np.linspace(0.0, np.pi, stacks + 1)[:, None]
+    theta = np.linspace(0.0, 2.0 * np.pi, slices + 1)[None, :]
+    normals = np.stack(np.broadcast_arrays(
+        np.sin(phi) * np.cos(theta),
+        np.sin(phi) * np.sin(theta),
+        np.cos(phi)
+    ), axis=-1)
+    return _grid_triangles(normals, normals)
+
+
+def _build_cone(slices: int, stacks: int) -> np.ndarray:
+    """Cone with unit base radius on Z=0 and its apex at Z=1"""
+    theta = np.linspace(0.0, 2.0 * np.pi, slices + 1)[None, :]
+    height = np.linspace(1.0, 0.0, stacks + 1)[:, None]
+    radius = 1.0 - height
+
+    # Rows start at the apex so the grid faces outwards
+    positions = np.stack(np.broadcast_arrays(
+        radius * np.cos(theta), radius * np.sin(theta), height
+    ), axis=-1)
+    slope = 1.0 / np.sqrt(2.0)
+    normals = np.stack(np.broadcast_arrays(
+        slope * np.cos(theta), slope * np.sin(theta), np.full_like(height, slope)
+    ), axis=-1)
+    side = _grid_triangles(positions, normals)
+
+    # Base disc facing -Z
+    ring = np.stack([np.cos(theta[0]), np.sin(theta[0]), np.zeros(slices + 1)], axis=-1)
+    center = np.zeros((slices, 3))
+    base_points = np.stack([center, ring[1:], ring[:-1]], axis=1).reshape(-1, 3)
+    base_normals = np.tile([0.0, 0.0, -1.0], (len(base_points), 1))
+    base = np.hstack([base_normals, base_points]).astype(np.float32)
+    return np.vstack([side, base])
+
+
+def _build_torus(inner_radius: float, outer_radius: float, sides: int, rings: int) -> np.ndarray:
+    """Torus around the Z axis with tube radius inner_radius"""
+    ring = np.linspace(0.0, 2.0 * np.pi, rings + 1)[:, None]
+    side = np.linspace(0.0, 2.0 * np.pi, sides + 1)[None, :]
+    normals = np.stack(np.broadcast_arrays(
+        np.cos(ring) * np.cos(side), np.sin(ring) * np.cos(side), np.sin(side)
+    ), axis=-1)
+    distance = outer_radius + inner_radius * np.cos(side)
+    positions = np.stack(np.broadcast_arrays(
+        np.cos(ring) * distance, np.sin(ring) * distance, inner_radius * np.sin(side)
+    ), axis=-1)
+    return _grid_triangles(positions, normals)
+
+
+def get_mesh(key: Hashable, build: Callable, *args) -> np.ndarray:
+    """Return the cached interleaved array for key, building it on first use"""
+    mesh = _meshes.get(key)
+    if mesh is None:
+        mesh = np.ascontiguousarray(build(*args), dtype=np.float32)
+        _meshes[key] = mesh
+    return mesh
+
+
+def cube_mesh() -> np.ndarray:
+    """Interleaved normal/vertex array of the unit cube"""
+    return get_mesh(('cube',), _build_cube)
+
+
+def sphere_mesh(slices: int, stacks: int) -> np.ndarray:
+    """Interleaved normal/vertex array of the unit sphere"""
+    return get_mesh(('sphere', slices, stacks), _build_sphere, slices, stacks)
+
+
+def cone_mesh(slices: int, stacks: int) -> np.ndarray:
+    """Interleaved normal/vertex array of the unit cone"""
+    return get_mesh(('cone', slices, stacks), _build_cone, slices, stacks)
+
+
+def torus_mesh(inner_radius: float, outer_radius: float, sides: int, rings: int) -> np.ndarray:
+    """Interleaved normal/vertex array of a torus"""
+    return get_mesh(('torus', inner_radius, outer_radius, sides, rings),
+                    _build_torus, inner_radius, outer_radius, sides, rings)
+
+
+def draw_mesh(mesh: np.ndarray):
+    """Draw an interleaved GL_N3F_V3F triangle array"""
+    glInterleavedArrays(GL_N3F_V3F, 0, mesh)
+    glDrawArrays(GL_TRIANGLES, 0, len(mesh))
+
+
+def solid_cube(size: float):
+    """Draw a solid cube (same call shape as glutSolidCube)"""
+    if size == 1:
+        draw_mesh(cube_mesh())
+        return
+    glPushMatrix()
+    glScaled(size, size, size)
+    draw_mesh(cube_mesh())
+    glPopMatrix()
+
+
+def solid_sphere(radius: float, slices: int, stacks: int):
+    """Draw a solid sphere (same call shape as glutSolidSphere)"""
+    if radius == 1:
+        draw_mesh(sphere_mesh(slices, stacks))
+        return
+    glPushMatrix()
+    glScaled(radius, radius, radius)
+    draw_mesh(sphere_mesh(slices, stacks))
+    glPopMatrix()
+
+
+def solid_cone(base: float, height: float, slices: int, stacks: int):
+    """Draw a solid cone (same call shape as glutSolidCone)"""
+    glPushMatrix()
+    glScaled(base, base, height)
+    draw_mesh(cone_mesh(slices, stacks))
+    glPopMatrix()
+
+
+def solid_torus(inner_radius: float, outer_radius: float, sides: int, rings: int):
+    """Draw a solid torus (same call shape as glutSolidTorus)"""
+    draw_mesh(torus_mesh(inner_radius, outer_radius, sides, rings))
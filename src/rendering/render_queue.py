@@ -0,0 +1,130 @@
+"""
+Render queue for the 3D scene
+
+While the scene is being drawn, draws are submitted with the modelview
+matrix they need, a lighting state and the center of what they draw
+instead of being issued right away. The queue then draws the opaque items
+grouped by state and front to back, so fewer state changes are made and
+nearer geometry hides the rest early, and finally the blended items back
+to front with depth writes off, so they composite in the right order.
+
+Outside of a scene pass, and while a display list is being compiled,
+submitted draws are issued immediately in their state, and lighting is
+switched back on afterwards.
+
+Reading the modelview back from GL is a round trip to the driver, so the
+scene reads it once per pass and derives the matrices of what it places
+on the CPU (see transforms.py), passing them as matrix=. Only submits
+without one read the matrix from GL. A draw issued right away with a
+matrix is drawn at that matrix, so callers that pass one need not also
+set it on the GL stack.
+"""
+from typing import Callable, Hashable, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+from OpenGL.GL import *
+
+from .glstate import gl_state
+from .lod import lod
+from .stats import render_stats
+from .transforms import current_modelview
+
+# Lighting each queue state draws with
+STATE_LIGHTING = {
+    'lit': True,
+    'unlit': False,
+}
+
+
+class DrawItem(NamedTuple):
+    """A queued draw call"""
+    state: str
+    depth: float  # distance from the eye along the view axis
+    matrix: np.ndarray  # modelview matrix to draw with
+    scope: Hashable  # level of detail scope at submission
+    draw: Callable
+    args: tuple
+
+
+class RenderQueue:
+    """Collect scene draws and issue them sorted by state and depth"""
+
+    def __init__(self):
+        self.opaque: List[DrawItem] = []
+        self.transparent: List[DrawItem] = []
+        self._collecting = False
+        self._flushing = False
+
+    def begin(self):
+        """Start collecting the draws of a scene pass"""
+        self._collecting = True
+
+    def submit(self, draw: Callable, *args, state: str = 'lit', blended: bool = False,
+               center: Sequence[float] = (0.0, 0.0, 0.0), matrix: Optional[np.ndarray] = None):
+        """Queue draw(*args) at the current (or given) modelview matrix
+
+        A given matrix is absolute, so it must not be passed while a
+        display list is being compiled.
+        """
+        queued = self._collecting and not gl_state.compiling
+        if not queued or (self._flushing and not blended):
+            self._apply(state)
+            if matrix is None:
+                draw(*args)
+            else:
+                glPushMatrix()
+                glLoadMatrixf(matrix)
+                draw(*args)
+                glPopMatrix()
+            gl_state.enable(GL_LIGHTING)
+            return
+
+        if matrix is None:
+            matrix = current_modelview()
+        depth = -float(np.append(center, 1.0) @ matrix[:, 2])
+        item = DrawItem(state, depth, matrix, lod.scope, draw, args)
+        (self.transparent if blended else self.opaque).append(item)
+
+    def _apply(self, state: str):
+        """Set the GL state a queue state stands for"""
+        if STATE_LIGHTING[state]:
+            gl_state.enable(GL_LIGHTING)
+        else:
+            gl_state.disable(GL_LIGHTING)
+
+    def _draw(self, item: DrawItem):
+        """Issue a queued draw with its matrix and state"""
+        glLoadMatrixf(item.matrix)
+        self._apply(item.state)
+        lod.scope = item.scope
+        item.draw(*item.args)
+
+    def flush(self):
+        """Draw the opaque items, then the blended ones, and stop collecting"""
+        glPushMatrix()
+        self._flushing = True
+        self.opaque.sort(key=lambda item: (item.state, item.depth))
+        for item in self.opaque:
+            self._draw(item)
+
+        # Opaque draws may queue blended parts, so sort those afterwards
+        self.transparent.sort(key=lambda item: -item.depth)
+        gl_state.enable(GL_BLEND)
+        gl_state.depth_mask(False)
+        for item in self.transparent:
+            self._draw(item)
+        gl_state.depth_mask(True)
+        gl_state.enable(GL_LIGHTING)
+        glPopMatrix()
+
+        render_stats.count('queued_opaque', len(self.opaque))
+        render_stats.count('queued_transparent', len(self.transparent))
+        self.opaque.clear()
+        self.transparent.clear()
+        self._collecting = False
+        self._flushing = False
+        lod.scope = None
+
+
+# Global render queue
+render_queue = RenderQueue()
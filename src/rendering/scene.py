@@ -1,327 +1,316 @@
 """
 Scene drawing functions
 """
-import math
-import time
-import random
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 from OpenGL.GL import *
-from OpenGL.GLUT import *
 
-from ..config import EN_SIZE, TORUS_POS_X, TORUS_POS_Y, ANGLE_BACK_FRAC, MAX_SPEED
+from ..config import EN_SIZE, TORUS_POS_X, TORUS_POS_Y, TRAFFIC_MODE, TRACE_STATIC_MODELS
 from ..game_state import state
-from ..models.plane import draw_plane
 from ..models.buildings import draw_house
-from ..models.landmarks import draw_shaheed_minar, draw_radio_tower, draw_national_parliament
-from ..models.environment import (
-    draw_roads, draw_vehicles, draw_trees,
-    init_vehicles, update_vehicles, generate_tree_positions
+from ..models.landmarks import (
+    draw_shaheed_minar, draw_radio_tower_structure, draw_radio_tower_lights,
+    draw_national_parliament_structure, draw_parliament_water
 )
+from ..models.environment import draw_roads, draw_vehicles, draw_trees, update_vehicle_batch
+from ..simulation import BUILDING_ROWS
+from .culling import Frustum
+from .display_lists import DisplayListCache
+from .glstate import gl_state
+from .lighting import baked_lighting
+from .lod import lod
+from .meshes import draw_plane_mesh
+from .primitives import solid_cube, solid_torus
+from .render_queue import render_queue
+from .stats import render_stats
+from .trace import traced
+from .transforms import current_modelview, rotated, scaled, translated
 
+Vec3 = Tuple[float, float, float]
 
-def check_collision(plane_x: float, plane_y: float, plane_z: float,
-                    obs_x: float, obs_y: float, obs_z: float) -> bool:
-    """Check if plane collides with obstacle (torus)"""
-    dx = plane_x - obs_x
-    dy = (plane_y + 1.0) - obs_y
-    dz = plane_z - obs_z
+# Landmark placements per environment zone: (x, y, z, scale)
+ZONE_RADIO_TOWERS = {
+    1: [(-15, 0.15, -8, 1.2), (15, 0.15, 6, 1.0)],
+    2: [(-14, 0.15, 5, 1.3)],
+    4: [(14, 0.15, -5, 1.5)],
+    5: [(-14, 0.15, -3, 1.0)],
+}
+ZONE_PARLIAMENTS = {
+    3: [(-12, 0.15, -6, 0.8)],
+    5: [(12, 0.15, 5, 0.7)],
+}
 
-    distance = math.sqrt(dx*dx + dy*dy + dz*dz)
-    collision_threshold = 1.8
+# Cache key for the Shaheed Minar zone and its monuments: (x, y, z, angle)
+SHAHEED_MINAR_ZONE = 'shaheed_minar'
+SHAHEED_MINARS = [(-8, -2.7, -5, 65), (8, -2.7, -5, -65)]
 
-    return distance < collision_threshold
+# Model bounds used for culling, in model coordinates before placement
+BUILDING_TOP = 5.3  # five floors of height 1 starting at y=0.3
+TREE_TOP = 3.3  # tallest tree (scale 1.5) standing at y=0.15
+TREE_BOUNDS = ((-EN_SIZE - 1.0, 0.15, -EN_SIZE - 1.0), (EN_SIZE + 1.0, TREE_TOP, EN_SIZE + 1.0))
 
+# Every zone shows the same trees, so they share one baked list
+TREES_CHUNK = 'trees'
+RADIO_TOWER_LO, RADIO_TOWER_HI = (-0.4, 0.0, -0.4), (0.4, 9.5, 0.4)
+PARLIAMENT_LO, PARLIAMENT_HI = (-4.0, 0.0, -3.2), (4.0, 5.6, 5.5)
+SHAHEED_MINAR_LO, SHAHEED_MINAR_HI = (-2.3, 3.0, -2.5), (2.3, 5.2, 2.5)
+if TRAFFIC_MODE:
+    VEHICLE_BOUNDS = ((-EN_SIZE - 0.5, 0.15, -EN_SIZE - 0.5), (EN_SIZE + 0.5, 0.7, EN_SIZE + 0.5))
+else:
+    VEHICLE_BOUNDS = ((-EN_SIZE - 0.5, 0.15, -1.0), (EN_SIZE + 0.5, 0.7, 1.0))
 
-def check_passed_obstacle(obs_z: float, prev_passed: bool) -> bool:
-    """Check if obstacle has just passed the plane"""
-    if not prev_passed and 0 < obs_z < 3:
-        return True
-    return prev_passed
 
+class ZoneChunk(NamedTuple):
+    """A separately baked and culled piece of an environment zone"""
+    key: Hashable
+    build: Optional[Callable]  # static part, compiled into a display list
+    animate: Optional[Callable]  # animated part, drawn every frame
+    args: tuple
+    lo: Vec3
+    hi: Vec3
+    lod_radius: float = 0.0  # baked once per detail level when set
+    lod_slices: int = 0
 
-def draw_shaheed_minar_env():
-    """Draw environment with Shaheed Minar"""
-    # Ground
-    glColor3d(0, 0.5, 0.1)
+
+# Baked static zone geometry, rebuilt whenever layouts are re-randomized
+zone_cache = DisplayListCache()
+
+# Chunk lists per zone, built on first use
+_zone_chunks: Dict[Hashable, Tuple[List[ZoneChunk], np.ndarray, np.ndarray]] = {}
+
+
+def draw_shaheed_minar_ground():
+    """Draw the grass ground of the Shaheed Minar zone"""
+    gl_state.color(0, 0.5, 0.1)
     glPushMatrix()
     glTranslated(0, 0, 0)
     glScaled(EN_SIZE * 2, 0.3, EN_SIZE * 2)
-    glutSolidCube(1)
-    glPopMatrix()
-    
-    glPushMatrix()
-    glTranslated(-8, -2.7, -5)
-    glRotated(65, 0, 1, 0)
-    glScaled(2, 2, 2)
-    draw_shaheed_minar()
+    solid_cube(1)
     glPopMatrix()
-    
+
+
+def draw_shaheed_minar_placed(x: float, y: float, z: float, angle: float):
+    """Draw a Shaheed Minar placed in its zone"""
     glPushMatrix()
-    glTranslated(8, -2.7, -5)
-    glRotated(-65, 0, 1, 0)
+    glTranslated(x, y, z)
+    glRotated(angle, 0, 1, 0)
     glScaled(2, 2, 2)
     draw_shaheed_minar()
     glPopMatrix()
 
 
-def draw_environment(n: int):
-    """Draw the game environment with buildings and landmarks"""
+def draw_shaheed_minar_env():
+    """Draw environment with Shaheed Minar"""
+    SHAHEED_MINAR_GROUND_MODEL()
+    for x, y, z, angle in SHAHEED_MINARS:
+        SHAHEED_MINAR_MODEL(x, y, z, angle)
+
+
+def draw_zone_base(n: int):
+    """Draw the ground, roads and obstacle ring of an environment zone"""
     # Ground - grass
-    glColor3d(0.15, 0.55, 0.15)
+    gl_state.color(0.15, 0.55, 0.15)
     glPushMatrix()
     glTranslated(0, 0, 0)
     glScaled(EN_SIZE * 2, 0.3, EN_SIZE * 2)
-    glutSolidCube(1)
+    solid_cube(1)
     glPopMatrix()
     
     # Draw roads first (under vehicles)
     draw_roads()
 
     # Obstacle torus (ring to fly through)
-    glColor3d(0, 1, 0.1)
+    gl_state.color(0, 1, 0.1)
     glPushMatrix()
     glTranslated(TORUS_POS_X[n], TORUS_POS_Y[n], 0)
     glScaled(0.3, 0.3, 0.3)
-    glutSolidTorus(1, 3, 30, 30)
+    solid_torus(1, 3, 30, 30)
     glPopMatrix()
-    
-    # Draw vehicles on roads
-    draw_vehicles()
-    
-    # Draw trees
-    draw_trees()
-    
-    # Add landmarks based on environment zone number
-    if n == 1:
-        draw_radio_tower(-15, 0.15, -8, 1.2)
-        draw_radio_tower(15, 0.15, 6, 1.0)
-    elif n == 2:
-        draw_radio_tower(-14, 0.15, 5, 1.3)
-    elif n == 3:
-        draw_national_parliament(-12, 0.15, -6, 0.8)
-    elif n == 4:
-        draw_radio_tower(14, 0.15, -5, 1.5)
-    elif n == 5:
-        draw_national_parliament(12, 0.15, 5, 0.7)
-        draw_radio_tower(-14, 0.15, -3, 1.0)
-    
-    # Buildings
-    for i in range(-(EN_SIZE // 2) + 1, EN_SIZE // 2, 2):
-        for j in range(-(EN_SIZE // 2) + 1, EN_SIZE // 2, 2):
-            idx_i = i + (EN_SIZE // 2) + 1
-            idx_j = j + (EN_SIZE // 2) + 1
-            
-            if idx_i >= 5000 or idx_j >= 5000:
-                continue
-            
-            # Skip building placement where landmarks are
-            if n == 3 and i < -8 and -8 < j < -2:
-                continue
-            if n == 5 and i > 8 and 2 < j < 8:
-                continue
-                
-            if state.tola[idx_i][idx_j] != 0:
-                glPushMatrix()
-                glTranslated(i, 0, j)
-                draw_house(state.tola[idx_i][idx_j], i, j)
-                glPopMatrix()
-            elif not (-5 <= i <= 5):
-                state.tola[idx_i][idx_j] = random.randint(1, 5)
-                glPushMatrix()
-                glTranslated(i, 0, j)
-                draw_house(state.tola[idx_i][idx_j], i, j)
-                glPopMatrix()
 
 
-def draw_scene():
-    """Main scene drawing function"""
-    if state.GAME_OVER:
-        return
+# Static zone models as baked: their traced meshes (with the lighting baked
+# in when it is on), or the immediate-mode calls
+if TRACE_STATIC_MODELS:
+    SHAHEED_MINAR_GROUND_MODEL = traced(draw_shaheed_minar_ground, static=True)
+    SHAHEED_MINAR_MODEL = traced(draw_shaheed_minar_placed, static=True)
+    ZONE_BASE_MODEL = traced(draw_zone_base, static=True)
+    RADIO_TOWER_MODEL = traced(draw_radio_tower_structure, static=True)
+    PARLIAMENT_MODEL = traced(draw_national_parliament_structure, static=True)
+else:
+    SHAHEED_MINAR_GROUND_MODEL = draw_shaheed_minar_ground
+    SHAHEED_MINAR_MODEL = draw_shaheed_minar_placed
+    ZONE_BASE_MODEL = draw_zone_base
+    RADIO_TOWER_MODEL = draw_radio_tower_structure
+    PARLIAMENT_MODEL = draw_national_parliament_structure
 
-    t = (time.time() - state.start_time - state.total_pause_time)
-    state.TIME = int(t)
-    
-    # Update animation times
-    state.glow_time = t
-    state.blink_time = t
-    
-    # Initialize vehicles and trees if not done
-    init_vehicles()
-    generate_tree_positions()
-
-    # Plane rotation limits
-    if state.rotX > 11:
-        state.rotX = 11
-    if state.rotX < -11:
-        state.rotX = -11
-    if state.rotZ > 10:
-        state.rotZ = 10
-    if state.rotZ < -15:
-        state.rotZ = -15
-    
-    # Update vehicles
-    if not state.PAUSED:
-        update_vehicles()
+
+def draw_building_row(n: int, j: int):
+    """Draw the row of buildings at z=j of an environment zone"""
+    idx_j = j + (EN_SIZE // 2) + 1
+    for i in BUILDING_ROWS:
+        idx_i = i + (EN_SIZE // 2) + 1
+        
+        floors = state.tola.get(n, idx_i, idx_j)
+        if floors != 0:
+            glPushMatrix()
+            glTranslated(i, 0, j)
+            draw_house(floors, i, j)
+            glPopMatrix()
+
+
+def _scaled_bounds(x: float, y: float, z: float, scale: float, lo: Vec3, hi: Vec3) -> Tuple[Vec3, Vec3]:
+    """Bounds of a model with local bounds (lo, hi) placed at (x, y, z) with scale"""
+    return (
+        (x + lo[0] * scale, y + lo[1] * scale, z + lo[2] * scale),
+        (x + hi[0] * scale, y + hi[1] * scale, z + hi[2] * scale),
+    )
+
+
+def _build_zone_chunks(n: Hashable) -> List[ZoneChunk]:
+    """Split a zone into separately baked and culled chunks"""
+    half = EN_SIZE
+    ground_lo = (-half, -0.15, -half)
     
-    # Draw plane
-    glPushMatrix()
-    glTranslated(0, 1, 0)
-    glRotated(90, 0, 1, 0)
-    glRotated(5, 0, 0, 1)
-    glRotated(state.rotX, 1, 0, 0)
-    glRotated(state.rotY, 0, 1, 0)
-    glRotated(state.rotZ, 0, 0, 1)
-    glScaled(0.4, 0.4, 0.4)
-    draw_plane()
-    glPopMatrix()
+    if n == SHAHEED_MINAR_ZONE:
+        chunks = [ZoneChunk((n, 'ground'), SHAHEED_MINAR_GROUND_MODEL, None, (),
+                            ground_lo, (half, 0.15, half))]
+        for idx, (x, y, z, angle) in enumerate(SHAHEED_MINARS):
+            chunks.append(ZoneChunk(
+                (n, 'minar', idx), SHAHEED_MINAR_MODEL, None, (x, y, z, angle),
+                *_scaled_bounds(x, y, z, 1.0, SHAHEED_MINAR_LO, SHAHEED_MINAR_HI)
+            ))
+        return chunks
     
-    # Movement limits
-    if state.tX >= 4.1:
-        state.tX = 4.1
-    if state.tX <= -4.1:
-        state.tX = -4.1
-    if state.tY > 0.1:
-        state.tY = 0.1
-    if state.tY < -15:
-        state.tY = -15
+    base_top = TORUS_POS_Y[n] + 1.2
+    chunks = [
+        ZoneChunk((n, 'base'), ZONE_BASE_MODEL, None, (n,), ground_lo, (half, base_top, half)),
+        ZoneChunk((TREES_CHUNK,), draw_trees, None, (), *TREE_BOUNDS),
+        ZoneChunk((n, 'vehicles'), None, draw_vehicles, (), *VEHICLE_BOUNDS),
+    ]
+    for idx, (x, y, z, scale) in enumerate(ZONE_RADIO_TOWERS.get(n, [])):
+        chunks.append(ZoneChunk(
+            (n, 'tower', idx), RADIO_TOWER_MODEL, draw_radio_tower_lights, (x, y, z, scale),
+            *_scaled_bounds(x, y, z, scale, RADIO_TOWER_LO, RADIO_TOWER_HI)
+        ))
+    for idx, (x, y, z, scale) in enumerate(ZONE_PARLIAMENTS.get(n, [])):
+        chunks.append(ZoneChunk(
+            (n, 'parliament', idx), PARLIAMENT_MODEL, draw_parliament_water, (x, y, z, scale),
+            *_scaled_bounds(x, y, z, scale, PARLIAMENT_LO, PARLIAMENT_HI),
+            lod_radius=2.5 * scale, lod_slices=20
+        ))
+    for j in BUILDING_ROWS:
+        chunks.append(ZoneChunk(
+            (n, 'buildings', j), draw_building_row, None, (n, j),
+            (-EN_SIZE // 2, 0.3, j - 0.5), (EN_SIZE // 2, BUILDING_TOP, j + 0.5)
+        ))
+    return chunks
+
+
+def zone_chunks(n: Hashable) -> Tuple[List[ZoneChunk], np.ndarray, np.ndarray]:
+    """Chunks of a zone with their stacked (N, 3) bounding box corners"""
+    entry = _zone_chunks.get(n)
+    if entry is None:
+        chunks = _build_zone_chunks(n)
+        los = np.array([chunk.lo for chunk in chunks], dtype=np.float64)
+        his = np.array([chunk.hi for chunk in chunks], dtype=np.float64)
+        entry = (chunks, los, his)
+        _zone_chunks[n] = entry
+    return entry
+
+
+def zone_bounds(n: Hashable) -> Tuple[np.ndarray, np.ndarray]:
+    """Bounding box enclosing every chunk of a zone"""
+    _, los, his = zone_chunks(n)
+    return los.min(axis=0), his.max(axis=0)
+
+
+def draw_zone(n: Hashable, frustum: Optional[Frustum] = None, modelview: Optional[np.ndarray] = None):
+    """Draw an environment zone from its baked chunks plus animated parts
+
+    If a frustum in zone coordinates is given, chunks outside it are skipped.
+    Inside a scene pass the baked chunks are submitted to the render queue,
+    and the animated parts submit their own draws, all at the zone's
+    modelview (read from GL unless given).
+    """
+    # Spinning the view turns the scenery under the light, so lists are
+    # recompiled when baked lighting switches on or off
+    zone_cache.sync((state.layout_version, baked_lighting()))
+    chunks, los, his = zone_chunks(n)
+    if frustum is None:
+        visible = np.ones(len(chunks), dtype=bool)
+    else:
+        visible = frustum.visible_boxes(los, his)
     
-    # Draw environments
-    glPushMatrix()
-    glTranslated(state.tX, state.tY, state.tZ)
-    draw_environment(2)
-    glPopMatrix()
+    if modelview is None:
+        modelview = current_modelview()
+    centers = (los + his) * 0.5
+    for chunk, center, is_visible in zip(chunks, centers, visible):
+        if not is_visible:
+            continue
+        if chunk.build is not None and chunk.lod_radius:
+            pixels = lod.projected_radius(chunk.lod_radius, modelview.astype(np.float64), center)
+            level = lod.select(chunk.key, pixels, chunk.lod_slices)
+            render_queue.submit(zone_cache.call, chunk.key + (level,), lod.build_at_level,
+                                level, chunk.build, *chunk.args, center=center, matrix=modelview)
+        elif chunk.build is not None:
+            render_queue.submit(zone_cache.call, chunk.key, chunk.build, *chunk.args,
+                                center=center, matrix=modelview)
+        if chunk.animate is not None:
+            chunk.animate(*chunk.args, matrix=modelview)
     
+    drawn = int(np.count_nonzero(visible))
+    render_stats.count('chunks_drawn', drawn)
+    render_stats.count('chunks_culled', len(chunks) - drawn)
+
+
+def zone_layout() -> List[Tuple[Hashable, float]]:
+    """The zones currently in play with their Z positions"""
+    zones = [(2, state.tZ)]
     # Only render Shahid Minar if it hasn't passed yet
     if not state.shaheed_minar_passed:
-        glPushMatrix()
-        glTranslated(state.tX, state.tY, state.tZ1)
-        draw_shaheed_minar_env()
-        glPopMatrix()
-    
-    glPushMatrix()
-    glTranslated(state.tX, state.tY, state.tZ2)
-    draw_environment(3)
-    glPopMatrix()
-    
-    glPushMatrix()
-    glTranslated(state.tX, state.tY, state.tZ3)
-    draw_environment(1)
-    glPopMatrix()
-    
-    glPushMatrix()
-    glTranslated(state.tX, state.tY, state.tZ4)
-    draw_environment(5)
-    glPopMatrix()
-    
-    glPushMatrix()
-    glTranslated(state.tX, state.tY, state.tZ5)
-    draw_environment(4)
-    glPopMatrix()
-    
-    glPushMatrix()
-    glTranslated(state.tX, state.tY, state.tZ6)
-    draw_environment(2)
-    glPopMatrix()
-    
-    # Skip all game updates when paused
-    if state.PAUSED:
-        return
-    
-    # Update z positions
-    state.tZ += state.speed
-    state.tZ1 += state.speed
-    state.tZ2 += state.speed
-    state.tZ3 += state.speed
-    state.tZ4 += state.speed
-    state.tZ5 += state.speed
-    state.tZ6 += state.speed
-    
-    # Reset positions
-    if state.tZ >= 20:
-        state.tZ = -110
-    if state.tZ1 >= 20:
-        state.shaheed_minar_passed = True
-    if state.tZ2 >= 20:
-        state.tZ2 = -110
-    if state.tZ3 >= 20:
-        state.tZ3 = -110
-    if state.tZ4 >= 20:
-        state.tZ4 = -110
-    if state.tZ5 >= 20:
-        state.tZ5 = -110
-    if state.tZ6 >= 20:
-        state.tZ6 = -110
-    
-    # Update cloud positions
-    for cloud in state.cloud_data:
-        cloud[2] += state.speed
-        
-        if cloud[2] >= 20:
-            cloud[0] = random.uniform(-40, 40)
-            cloud[1] = random.uniform(20, 45)
-            cloud[2] = -130.0
-            cloud[3] = random.uniform(2.0, 5.0)
-    
-    # Rotation damping
-    if state.rotX > 0:
-        state.rotX -= ANGLE_BACK_FRAC
-    if state.rotX < 0:
-        state.rotX += ANGLE_BACK_FRAC
-    if state.rotY > 0:
-        state.rotY -= ANGLE_BACK_FRAC
-    if state.rotY < 0:
-        state.rotY += ANGLE_BACK_FRAC
-    if state.rotZ > 0:
-        state.rotZ -= ANGLE_BACK_FRAC
-    if state.rotZ < 0:
-        state.rotZ += ANGLE_BACK_FRAC
-    
-    # Increase speed
-    state.speed += 0.0002
-    if state.speed >= MAX_SPEED:
-        state.speed = MAX_SPEED
-
-    # Collision detection and scoring
-    obstacle_zones = [
-        (2, state.tZ),
+        zones.append((SHAHEED_MINAR_ZONE, state.tZ1))
+    zones += [
         (3, state.tZ2),
         (1, state.tZ3),
         (5, state.tZ4),
         (4, state.tZ5),
-        (2, state.tZ6)
+        (2, state.tZ6),
     ]
+    return zones
+
+
+def draw_scene():
+    """Main scene drawing function (a read-only view of the game state)"""
+    if state.GAME_OVER:
+        return
+
+    render_queue.begin()
+    # The one modelview read of the pass; placements below are tracked on the CPU
+    view = current_modelview()
 
-    for idx, (zone_num, zone_z) in enumerate(obstacle_zones):
-        if zone_num in [1, 2, 3, 4, 5]:
-            obs_world_x = TORUS_POS_X[zone_num] + state.tX
-            obs_world_y = TORUS_POS_Y[zone_num] + state.tY
-            obs_world_z = zone_z
-
-            plane_world_x = 0
-            plane_world_y = 1
-            plane_world_z = 0
-
-            if check_collision(plane_world_x, plane_world_y, plane_world_z,
-                             obs_world_x, obs_world_y, obs_world_z):
-                state.GAME_OVER = True
-                return
-
-            if check_passed_obstacle(obs_world_z, state.obstacle_passed[idx]):
-                if not state.obstacle_passed[idx]:
-                    state.SCORE += 1
-                    state.obstacle_passed[idx] = True
-
-    # Reset obstacle_passed flags when obstacles loop back
-    if state.tZ <= -110:
-        state.obstacle_passed[0] = False
-    if state.tZ2 <= -110:
-        state.obstacle_passed[1] = False
-    if state.tZ3 <= -110:
-        state.obstacle_passed[2] = False
-    if state.tZ4 <= -110:
-        state.obstacle_passed[3] = False
-    if state.tZ5 <= -110:
-        state.obstacle_passed[4] = False
-    if state.tZ6 <= -110:
-        state.obstacle_passed[5] = False
+    # Draw plane, placed on the CPU (the queue loads the matrix)
+    matrix = translated(view, 0, 1, 0)
+    for rotation in ((90, 0, 1, 0), (5, 0, 0, 1), (state.rotX, 1, 0, 0),
+                     (state.rotY, 0, 1, 0), (state.rotZ, 0, 0, 1)):
+        matrix = rotated(matrix, *rotation)
+    render_queue.submit(draw_plane_mesh, 'low', matrix=scaled(matrix, 0.4, 0.4, 0.4))
+    
+    # Every zone shows the same vehicles, so they are moved once for all of them
+    update_vehicle_batch()
+
+    # Draw environments, skipping zones that are outside the view
+    frustum = Frustum.from_gl(view)
+    for slot, (n, zone_z) in enumerate(zone_layout()):
+        lod.scope = slot
+        zone_frustum = frustum.translated(state.tX, state.tY, zone_z)
+        if not zone_frustum.intersects_box(*zone_bounds(n)):
+            render_stats.count('zones_culled')
+            continue
+        render_stats.count('zones_drawn')
+        
+        draw_zone(n, zone_frustum, translated(view, state.tX, state.tY, zone_z))
+    lod.scope = None
 
+    # Issue everything sorted by state and depth, blended draws last
+    render_queue.flush()
@@ -0,0 +1,118 @@
+"""
+Frame pacing with GLUT timers
+
+Replaces the busy idle callback. Frames are requested from a glutTimerFunc
+chain at TARGET_FPS during play and at IDLE_FPS on the menu, pause and
+game-over screens (IDLE_FPS = 0 only redraws on input). The timer is set
+for the frame deadline; if it fires early, a short timer is armed for the
+rest instead of sleeping, so input is still handled while a frame waits.
+When buffer swaps block for a large part of the frame, vsync is assumed
+and the blocking swap paces the loop on its own, so two clocks do not beat
+against each other.
+"""
+import math
+import statistics
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from OpenGL.GLUT import *
+
+from ..config import TARGET_FPS, IDLE_FPS, RENDER_STATS_INTERVAL
+from ..game_state import state
+from ..simulation import simulation
+from .stats import render_stats
+
+TIMER_TOLERANCE = 0.0005  # Seconds before the deadline a timer may fire and still start the frame
+VSYNC_SWAP_FRACTION = 0.25  # Median swap time (fraction of the period) that indicates vsync
+HISTORY = 120  # Frames kept for jitter and vsync statistics
+
+
+class FrameScheduler:
+    """Request redraws at a target frame rate from a GLUT timer chain"""
+
+    def __init__(self, target_fps: float = TARGET_FPS, idle_fps: float = IDLE_FPS):
+        self.target_fps = target_fps
+        self.idle_fps = idle_fps
+        self.vsync = False
+        self.intervals: Deque[float] = deque(maxlen=HISTORY)
+        self.swap_times: Deque[float] = deque(maxlen=HISTORY)
+        self._deadline = 0.0
+        self._timer_pending = False
+        self._last_frame: Optional[float] = None
+        self._last_report = time.perf_counter()
+
+    def period(self) -> Optional[float]:
+        """Seconds between frames in the current mode, or None to wait for input"""
+        playing = state.START and not state.PAUSED and not state.GAME_OVER
+        fps = self.target_fps if playing or simulation.pending else self.idle_fps
+        if fps <= 0:
+            return None
+        if playing and self.vsync:
+            return 0.0
+        return 1.0 / fps
+
+    def start(self):
+        """Start the timer chain"""
+        self._deadline = time.perf_counter()
+        self._schedule()
+
+    def _schedule(self):
+        """Arm the timer for the next frame deadline"""
+        period = self.period()
+        if period is None:
+            return
+        now = time.perf_counter()
+        # Keep a steady cadence, but never try to catch up on missed frames
+        self._deadline = max(self._deadline + period, now)
+        self._arm(self._deadline - now)
+
+    def _arm(self, delay: float):
+        """Arm the timer to fire after delay seconds (rounded up to whole milliseconds)"""
+        self._timer_pending = True
+        glutTimerFunc(max(math.ceil(delay * 1000), 0), self._tick, 0)
+
+    def _tick(self, value: int):
+        """Timer callback: request a frame, or wait again if it fired early"""
+        remaining = self._deadline - time.perf_counter()
+        if remaining > TIMER_TOLERANCE:
+            self._arm(remaining)
+            return
+        self._timer_pending = False
+        glutPostRedisplay()
+
+    def frame_done(self, swap_time: float):
+        """Record a presented frame and arm the timer for the next one"""
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            self.intervals.append(now - self._last_frame)
+        self._last_frame = now
+        self.swap_times.append(swap_time)
+        self._detect_vsync()
+
+        if not self._timer_pending:
+            self._schedule()
+
+        if render_stats.enabled and now - self._last_report >= RENDER_STATS_INTERVAL:
+            print(self.report())
+            self._last_report = now
+
+    def _detect_vsync(self):
+        """Assume vsync when swaps block for a large part of the frame period"""
+        if len(self.swap_times) < HISTORY // 4:
+            return
+        self.vsync = statistics.median(self.swap_times) > VSYNC_SWAP_FRACTION / self.target_fps
+
+    def report(self) -> str:
+        """Frame rate and frame-time jitter over the recent frames"""
+        if len(self.intervals) < 2:
+            return '[frames] collecting'
+        mean = statistics.fmean(self.intervals)
+        jitter = statistics.pstdev(self.intervals)
+        return (f'[frames] {1.0 / mean:.1f} fps, interval {mean * 1000:.2f} ms '
+                f'+/- {jitter * 1000:.2f} (max {max(self.intervals) * 1000:.2f}), '
+                f'vsync {"on" if self.vsync else "off"}')
+
+
+# Global frame scheduler
+scheduler = FrameScheduler()
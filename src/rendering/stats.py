@@ -0,0 +1,53 @@
+"""
+Per-frame render statistics
+"""
+import time
+from collections import defaultdict
+from typing import Dict
+
+from ..config import SHOW_RENDER_STATS, RENDER_STATS_INTERVAL
+
+
+class RenderStats:
+    """Counters collected while drawing, reported as per-frame averages"""
+
+    def __init__(self, enabled: bool = SHOW_RENDER_STATS, interval: float = RENDER_STATS_INTERVAL):
+        self.enabled = enabled
+        self.interval = interval
+        self.frame: Dict[str, int] = defaultdict(int)
+        self.last_frame: Dict[str, int] = {}
+        self._totals: Dict[str, int] = defaultdict(int)
+        self._frames = 0
+        self._last_report = time.perf_counter()
+
+    def count(self, name: str, amount: int = 1):
+        """Add to a counter of the frame being drawn"""
+        self.frame[name] += amount
+
+    def end_frame(self):
+        """Close the current frame and print a report when one is due"""
+        self.last_frame = dict(self.frame)
+        for name, value in self.frame.items():
+            self._totals[name] += value
+        self._frames += 1
+        self.frame.clear()
+
+        now = time.perf_counter()
+        if now - self._last_report >= self.interval:
+            if self.enabled:
+                print(self.report())
+            self._totals.clear()
+            self._frames = 0
+            self._last_report = now
+
+    def report(self) -> str:
+        """Format the average of every counter since the last report"""
+        frames = max(self._frames, 1)
+        values = ' '.join(
+            f'{name}={self._totals[name] / frames:.1f}' for name in sorted(self._totals)
+        )
+        return f'[render] {self._frames} frames, per frame: {values}'
+
+
+# Global statistics instance
+render_stats = RenderStats()
@@ -0,0 +1,45 @@
+"""
+Texture creation helpers
+"""
+from typing import Callable, Dict, Hashable
+
+import numpy as np
+from OpenGL.GL import *
+
+
+def create_texture(image: np.ndarray, smooth: bool = True, repeat: bool = False) -> int:
+    """Upload an (height, width, 4) uint8 RGBA image as a 2D texture"""
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width = image.shape[:2]
+    texture_filter = GL_LINEAR if smooth else GL_NEAREST
+    wrap = GL_REPEAT if repeat else GL_CLAMP_TO_EDGE
+
+    texture_id = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, texture_id)
+    glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, texture_filter)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, texture_filter)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, wrap)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, wrap)
+    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, image)
+    glBindTexture(GL_TEXTURE_2D, 0)
+    return texture_id
+
+
+class TextureCache:
+    """Build textures from procedural images on first use"""
+
+    def __init__(self):
+        self._textures: Dict[Hashable, int] = {}
+
+    def get(self, key: Hashable, build: Callable[[], np.ndarray], **options) -> int:
+        """Return the texture for key, creating it from build() if needed"""
+        texture_id = self._textures.get(key)
+        if texture_id is None:
+            texture_id = create_texture(build(), **options)
+            self._textures[key] = texture_id
+        return texture_id
+
+
+# Global texture cache
+textures = TextureCache()
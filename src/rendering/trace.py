@@ -0,0 +1,432 @@
+"""
+Trace compiler for immediate-mode model functions
+
+A model function such as draw_shaheed_minar() is run once against a
+recording backend instead of OpenGL: the names it calls (matrix stack,
+glBegin/glVertex, gl_state colors and lighting, and the solid_* shapes)
+are swapped for recorders in the model modules while it runs. Every shape
+is transformed on the CPU by the recorded matrix, and the result is one
+flattened GL_C4F_N3F_V3F triangle buffer per lighting state, drawn with a
+single glDrawArrays each. Static scenery can instead be drawn from one
+buffer with its lighting baked into the colors (see lighting.py).
+
+Functions that use anything else (textures, vertex arrays, the render
+queue) raise TraceError, so they keep being drawn as they are. verify()
+compares a trace with the immediate-mode output through GL_FEEDBACK.
+"""
+import math
+import sys
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+from ..config import (
+    BUILDING_COLORS_R, BUILDING_COLORS_G, BUILDING_COLORS_B, EN_SIZE, TORUS_POS_X, TORUS_POS_Y,
+    LOD_LEVELS, LOD_MIN_SLICES, LOD_MIN_STACKS
+)
+from .asset_cache import asset_cache, source_digest, value_digest
+from .glstate import gl_state
+from .lighting import baked_lighting, lit_colors
+from .lod import lod
+from .primitives import cube_mesh, sphere_mesh, cone_mesh, torus_mesh
+from .stats import render_stats
+from .transforms import rotation, scaling, translation
+
+# Packages whose modules are switched to the recorder while tracing
+TRACED_PACKAGES = [__name__.rsplit('.', 2)[0] + '.models']
+
+# Everything a traced mesh depends on, hashed to tell stale disk entries:
+# the model sources, and the values of the settings they read (hashing all
+# of config.py would drop every cached mesh on any unrelated tweak)
+TRACE_SOURCES = tuple(TRACED_PACKAGES) + tuple(
+    __name__.rsplit('.', 1)[0] + '.' + module for module in ('trace', 'primitives', 'lod', 'transforms')
+)
+TRACE_SETTINGS = (
+    BUILDING_COLORS_R, BUILDING_COLORS_G, BUILDING_COLORS_B, EN_SIZE, TORUS_POS_X, TORUS_POS_Y,
+    LOD_LEVELS, LOD_MIN_SLICES, LOD_MIN_STACKS
+)
+
+# File names of the per-lighting-state buffers in the asset cache
+LIGHTING_NAMES = {True: 'lit', False: 'unlit'}
+
+# Detail level traced when none is forced: a trace must not depend on where
+# the camera happens to be (or, in a bake worker, read a matrix at all)
+DEFAULT_TRACE_LEVEL = 0
+
+
+class TraceError(Exception):
+    """A model function made a call the trace compiler cannot record"""
+
+
+class TracedMesh:
+    """Flattened triangles of a traced model, one buffer per lighting state"""
+
+    def __init__(self, batches: List[Tuple[bool, np.ndarray]]):
+        self.batches = batches
+        self._baked: Optional[np.ndarray] = None  # GL_C4UB_V3F, built on first draw_baked()
+
+    @property
+    def vertex_count(self) -> int:
+        """Number of vertices over all batches"""
+        return sum(len(vertices) for _, vertices in self.batches)
+
+    def draw(self):
+        """Draw every batch with one call each"""
+        for lit, vertices in self.batches:
+            if lit:
+                gl_state.enable(GL_LIGHTING)
+            else:
+                gl_state.disable(GL_LIGHTING)
+            glInterleavedArrays(GL_C4F_N3F_V3F, 0, vertices)
+            glDrawArrays(GL_TRIANGLES, 0, len(vertices))
+            render_stats.count('traced_draws')
+        gl_state.invalidate_color()
+        gl_state.enable(GL_LIGHTING)
+
+    def baked(self) -> np.ndarray:
+        """Every batch in one GL_C4UB_V3F buffer, lit batches with their lighting applied"""
+        if self._baked is None:
+            baked = np.empty((self.vertex_count, 4), dtype=np.float32)
+            start = 0
+            for lit, vertices in self.batches:
+                colors = lit_colors(vertices[:, :4], vertices[:, 4:7]) if lit else vertices[:, :4]
+                end = start + len(vertices)
+                baked[start:end, :1] = np.round(colors * 255).astype(np.uint8).view(np.float32)
+                baked[start:end, 1:] = vertices[:, 7:]
+                start = end
+            self._baked = baked
+        return self._baked
+
+    def draw_baked(self):
+        """Draw every batch with one call, lighting off and colors baked"""
+        vertices = self.baked()
+        gl_state.disable(GL_LIGHTING)
+        glInterleavedArrays(GL_C4UB_V3F, 0, vertices)
+        glDrawArrays(GL_TRIANGLES, 0, len(vertices))
+        render_stats.count('traced_draws')
+        gl_state.invalidate_color()
+        gl_state.enable(GL_LIGHTING)
+
+
+class _StateRecorder:
+    """Stands in for gl_state while tracing"""
+
+    def __init__(self, recorder: 'TraceRecorder'):
+        self._recorder = recorder
+
+    def color(self, r: float, g: float, b: float, a: float = 1.0):
+        self._recorder.color = (r, g, b, a)
+
+    def enable(self, cap: int):
+        self._recorder.set_cap(cap, True)
+
+    def disable(self, cap: int):
+        self._recorder.set_cap(cap, False)
+
+    def __getattr__(self, name: str):
+        raise TraceError(f'gl_state.{name} cannot be traced')
+
+
+class TraceRecorder:
+    """Recording backend: matrix stack, color, lighting and triangles"""
+
+    def __init__(self):
+        self.matrix = np.identity(4)
+        self.stack: List[np.ndarray] = []
+        self.color = (1.0, 1.0, 1.0, 1.0)
+        self.normal = (0.0, 0.0, 1.0)
+        self.lit = True
+        self.chunks: List[Tuple[bool, np.ndarray, np.ndarray, tuple]] = []
+        self._mode = None
+        self._vertices: List[tuple] = []
+
+    def functions(self) -> Dict[str, Callable]:
+        """Replacements for the names model modules call"""
+        return {
+            'glPushMatrix': self.push, 'glPopMatrix': self.pop,
+            'glTranslated': self.translate, 'glTranslatef': self.translate,
+            'glScaled': self.scale, 'glScalef': self.scale,
+            'glRotated': self.rotate, 'glRotatef': self.rotate,
+            'glBegin': self.begin, 'glEnd': self.end,
+            'glVertex3f': self.vertex, 'glVertex3d': self.vertex,
+            'glNormal3f': self.set_normal, 'glNormal3d': self.set_normal,
+            'glColor3f': self.set_color, 'glColor3d': self.set_color,
+            'glColor4f': self.set_color, 'glColor4d': self.set_color,
+            'solid_cube': self.cube, 'solid_sphere': self.sphere,
+            'solid_cone': self.cone, 'solid_torus': self.torus,
+            'gl_state': _StateRecorder(self),
+        }
+
+    # Matrix stack
+    def push(self):
+        self.stack.append(self.matrix.copy())
+
+    def pop(self):
+        self.matrix = self.stack.pop()
+
+    def translate(self, x: float, y: float, z: float):
+        self.matrix = self.matrix @ translation(x, y, z)
+
+    def scale(self, x: float, y: float, z: float):
+        self.matrix = self.matrix @ scaling(x, y, z)
+
+    def rotate(self, angle: float, x: float, y: float, z: float):
+        self.matrix = self.matrix @ rotation(angle, x, y, z)
+
+    # Current attributes
+    def set_color(self, r: float, g: float, b: float, a: float = 1.0):
+        self.color = (r, g, b, a)
+
+    def set_normal(self, x: float, y: float, z: float):
+        self.normal = (x, y, z)
+
+    def set_cap(self, cap: int, enabled: bool):
+        if cap != GL_LIGHTING:
+            raise TraceError(f'capability {cap} cannot be traced')
+        self.lit = enabled
+
+    # Geometry
+    def add_mesh(self, mesh: np.ndarray, scale: Tuple[float, float, float] = (1.0, 1.0, 1.0)):
+        """Add a GL_N3F_V3F triangle mesh scaled about its origin"""
+        matrix = self.matrix @ scaling(*scale)
+        self.chunks.append((self.lit, mesh[:, 3:], mesh[:, :3], (matrix, self.color)))
+
+    def cube(self, size: float):
+        self.add_mesh(cube_mesh(), (size, size, size))
+
+    def sphere(self, radius: float, slices: int, stacks: int):
+        self.add_mesh(sphere_mesh(slices, stacks), (radius, radius, radius))
+
+    def cone(self, base: float, height: float, slices: int, stacks: int):
+        self.add_mesh(cone_mesh(slices, stacks), (base, base, height))
+
+    def torus(self, inner_radius: float, outer_radius: float, sides: int, rings: int):
+        self.add_mesh(torus_mesh(inner_radius, outer_radius, sides, rings))
+
+    def begin(self, mode: int):
+        if mode not in (GL_TRIANGLES, GL_QUADS):
+            raise TraceError(f'glBegin mode {mode} cannot be traced')
+        self._mode = mode
+        self._vertices = []
+
+    def vertex(self, x: float, y: float, z: float):
+        self._vertices.append(tuple(self.normal) + (x, y, z))
+
+    def end(self):
+        vertices = np.array(self._vertices, dtype=np.float32).reshape(-1, 6)
+        if self._mode == GL_QUADS:
+            quads = vertices.reshape(-1, 4, 6)
+            vertices = quads[:, [0, 1, 2, 0, 2, 3]].reshape(-1, 6)
+        self.add_mesh(vertices)
+        self._mode = None
+
+    def result(self) -> TracedMesh:
+        """Transform the recorded shapes into one buffer per lighting state"""
+        batches = []
+        for lit in (True, False):
+            parts = []
+            for chunk_lit, positions, normals, (matrix, color) in self.chunks:
+                if chunk_lit != lit:
+                    continue
+                linear = matrix[:3, :3]
+                part = np.empty((len(positions), 10), dtype=np.float32)
+                part[:, :4] = color
+                # Normals go through the inverse transpose; GL_NORMALIZE is on anyway
+                normal_matrix = np.linalg.inv(linear) if abs(np.linalg.det(linear)) > 1e-12 else linear
+                transformed = normals @ normal_matrix
+                lengths = np.linalg.norm(transformed, axis=1, keepdims=True)
+                part[:, 4:7] = transformed / np.maximum(lengths, 1e-12)
+                part[:, 7:] = positions @ linear.T + matrix[:3, 3]
+                parts.append(part)
+            if parts:
+                batches.append((lit, np.ascontiguousarray(np.vstack(parts))))
+        return TracedMesh(batches)
+
+
+def _traced_modules(build: Callable) -> List[str]:
+    """Packages and modules to record while tracing build: the models and its own module"""
+    if any(build.__module__.startswith(package) for package in TRACED_PACKAGES):
+        return TRACED_PACKAGES
+    return TRACED_PACKAGES + [build.__module__]
+
+
+def _trace_level() -> int:
+    """Detail level a trace started now records"""
+    return lod.forced if lod.forced is not None else DEFAULT_TRACE_LEVEL
+
+
+def _sources(build: Callable) -> Tuple[str, ...]:
+    """Modules the traced mesh of build depends on"""
+    return TRACE_SOURCES + tuple(_traced_modules(build)[len(TRACED_PACKAGES):])
+
+
+def _source_key(build: Callable) -> str:
+    """Hash of the sources and settings the traced mesh of build depends on"""
+    return value_digest((source_digest(_sources(build)), TRACE_SETTINGS))
+
+
+@contextmanager
+def recording(recorder: TraceRecorder, packages: List[str] = TRACED_PACKAGES):
+    """Point the modules of packages at the recorder; other gl* calls raise TraceError
+
+    Level of detail is forced for the duration, to DEFAULT_TRACE_LEVEL
+    unless a level is forced already.
+    """
+    replacements = recorder.functions()
+    modules = [module for name, module in list(sys.modules.items())
+               if module is not None and any(name.startswith(p) for p in packages)]
+    saved = []
+
+    def unsupported(name: str) -> Callable:
+        def call(*args, **kwargs):
+            raise TraceError(f'{name} cannot be traced')
+        return call
+
+    try:
+        for module in modules:
+            for name, value in list(vars(module).items()):
+                if name in replacements:
+                    new = replacements[name]
+                elif name in ('render_queue', 'glInterleavedArrays') or (name.startswith('gl') and callable(value)):
+                    new = unsupported(name)
+                else:
+                    continue
+                saved.append((module, name, value))
+                setattr(module, name, new)
+        with lod.forced_level(_trace_level()):
+            yield recorder
+    finally:
+        for module, name, value in reversed(saved):
+            setattr(module, name, value)
+
+
+def trace(build: Callable, *args) -> TracedMesh:
+    """Run build(*args) against the recorder and return its flattened triangles"""
+    recorder = TraceRecorder()
+    with recording(recorder, _traced_modules(build)):
+        build(*args)
+    return recorder.result()
+
+
+class TraceCache:
+    """Traced meshes per model function, arguments and forced detail level
+
+    Meshes are also kept in the on-disk asset cache, so a later launch
+    memory-maps them instead of tracing again.
+    """
+
+    def __init__(self):
+        self._meshes: Dict[Hashable, TracedMesh] = {}
+
+    def _key(self, build: Callable, args: tuple) -> Tuple[str, tuple]:
+        """Cache name and parameters of build(*args) at the current forced level"""
+        return f'{build.__module__}.{build.__qualname__}', (args, _trace_level())
+
+    def lookup(self, build: Callable, *args) -> Optional[TracedMesh]:
+        """Return the mesh of build(*args) from memory or disk, or None if never traced"""
+        name, params = self._key(build, args)
+        mesh = self._meshes.get((name, params))
+        if mesh is None:
+            arrays = asset_cache.load(name, params, _source_key(build))
+            if arrays is not None:
+                mesh = TracedMesh([(lit, arrays[LIGHTING_NAMES[lit]]) for lit in (True, False)
+                                   if LIGHTING_NAMES[lit] in arrays])
+                self._meshes[(name, params)] = mesh
+        return mesh
+
+    def store(self, build: Callable, args: tuple, mesh: TracedMesh):
+        """Keep a mesh traced elsewhere (e.g. in a bake worker) as that of build(*args)"""
+        name, params = self._key(build, args)
+        self._meshes[(name, params)] = mesh
+        asset_cache.save(name, params, _source_key(build), {
+            LIGHTING_NAMES[lit]: vertices for lit, vertices in mesh.batches
+        })
+
+    def get(self, build: Callable, *args) -> TracedMesh:
+        """Return the traced mesh of build(*args), tracing it on first use"""
+        mesh = self.lookup(build, *args)
+        if mesh is None:
+            mesh = trace(build, *args)
+            self.store(build, args, mesh)
+        return mesh
+
+    def clear(self):
+        """Forget the meshes held in memory"""
+        self._meshes.clear()
+
+    def draw(self, build: Callable, *args):
+        """Draw build(*args) from its traced mesh"""
+        self.get(build, *args).draw()
+
+    def draw_baked(self, build: Callable, *args):
+        """Draw build(*args) from its traced mesh with the lighting baked in"""
+        self.get(build, *args).draw_baked()
+
+
+# Global trace cache
+trace_cache = TraceCache()
+
+
+def traced(build: Callable, static: bool = False) -> Callable:
+    """Wrap a model function so it draws from its traced mesh
+
+    A static model is placed by translation only, so its traced normals
+    face the same way in the world and its lighting can be baked.
+    """
+    def draw(*args):
+        if static and baked_lighting():
+            trace_cache.draw_baked(build, *args)
+        else:
+            trace_cache.draw(build, *args)
+    draw.__name__ = build.__name__
+    draw.__qualname__ = build.__qualname__
+    draw.__doc__ = build.__doc__
+    return draw
+
+
+def feedback_vertices(draw: Callable, size: int) -> np.ndarray:
+    """Window position and lit color of every vertex draw() emits, in rows of 7
+
+    Face culling is off while capturing: whether an edge-on or degenerate
+    triangle is culled depends on rounding, which differs between the paths.
+    """
+    glPushAttrib(GL_ENABLE_BIT)
+    glDisable(GL_CULL_FACE)
+    glFeedbackBuffer(size, GL_3D_COLOR)
+    glRenderMode(GL_FEEDBACK)
+    draw()
+    feedback = glRenderMode(GL_RENDER)
+    glPopAttrib()
+    rows = [tuple(v.vertex[:3]) + tuple(v.color[:4]) for item in feedback
+            for v in item[1:] if hasattr(v, 'vertex')]
+    return np.array(rows, dtype=np.float64).reshape(-1, 7)
+
+
+def verify(build: Callable, *args) -> float:
+    """Largest difference between the immediate-mode and traced output of build(*args)
+
+    Both are captured at the current matrices and the traced detail level
+    through GL_FEEDBACK, as window positions and lit colors, and compared vertex by vertex after sorting.
+    Returns infinity if they do not emit the same number of vertices.
+    """
+    mesh = trace(build, *args)
+    size = mesh.vertex_count * 8 + 4096  # polygon token and count, then 7 floats per vertex
+    with lod.forced_level(_trace_level()):
+        immediate = feedback_vertices(lambda: build(*args), size)
+    traced_rows = feedback_vertices(mesh.draw, size)
+    if immediate.shape != traced_rows.shape:
+        return math.inf
+    if len(immediate) == 0:
+        return 0.0
+    immediate = immediate[np.lexsort(np.round(immediate, 2).T[::-1])]
+    traced_rows = traced_rows[np.lexsort(np.round(traced_rows, 2).T[::-1])]
+    differences = np.abs(immediate - traced_rows).max(axis=1)
+    # Vertices at nearly the same place (e.g. where a torus touches its axis)
+    # can sort differently on rounding, so pair up the leftovers by distance
+    left = np.nonzero(differences > 1e-3)[0]
+    if len(left):
+        pairs = np.abs(immediate[left, None, :] - traced_rows[None, left, :]).max(axis=2)
+        differences[left] = pairs.min(axis=1)
+    return float(differences.max())
@@ -0,0 +1,60 @@
+"""
+4x4 transform matrices
+
+translation(), rotation() and scaling() build the matrices glTranslated,
+glRotated and glScaled multiply onto the current one (for column vectors),
+so the trace recorder can keep its own matrix stack. translated(),
+rotated() and scaled() apply them to a modelview as read back from GL
+(column-major, i.e. laid out for row vectors), so the scene can track
+where it places things instead of asking the driver each time.
+"""
+import math
+
+import numpy as np
+from OpenGL.GL import *
+
+
+def translation(x: float, y: float, z: float) -> np.ndarray:
+    """4x4 translation matrix like glTranslated"""
+    matrix = np.identity(4)
+    matrix[:3, 3] = (x, y, z)
+    return matrix
+
+
+def rotation(angle: float, x: float, y: float, z: float) -> np.ndarray:
+    """4x4 rotation matrix like glRotated"""
+    axis = np.array([x, y, z], dtype=np.float64)
+    axis /= np.linalg.norm(axis)
+    c, s = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+    ux, uy, uz = axis
+    matrix = np.identity(4)
+    matrix[:3, :3] = c * np.identity(3) + s * np.array([[0, -uz, uy], [uz, 0, -ux], [-uy, ux, 0]]) \
+        + (1 - c) * np.outer(axis, axis)
+    return matrix
+
+
+def scaling(x: float, y: float, z: float) -> np.ndarray:
+    """4x4 scale matrix like glScaled"""
+    return np.diag([x, y, z, 1.0])
+
+
+def current_modelview() -> np.ndarray:
+    """The GL modelview matrix, read back column-major (i.e. laid out for row vectors)"""
+    return np.asarray(glGetFloatv(GL_MODELVIEW_MATRIX), dtype=np.float32).reshape(4, 4)
+
+
+def translated(matrix: np.ndarray, x: float, y: float, z: float) -> np.ndarray:
+    """A read-back modelview after glTranslated"""
+    result = matrix.copy()
+    result[3] += x * matrix[0] + y * matrix[1] + z * matrix[2]
+    return result
+
+
+def rotated(matrix: np.ndarray, angle: float, x: float, y: float, z: float) -> np.ndarray:
+    """A read-back modelview after glRotated"""
+    return (rotation(angle, x, y, z).T @ matrix).astype(matrix.dtype)
+
+
+def scaled(matrix: np.ndarray, x: float, y: float, z: float) -> np.ndarray:
+    """A read-back modelview after glScaled"""
+    return (scaling(x, y, z) @ matrix).astype(matrix.dtype)
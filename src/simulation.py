@@ -0,0 +1,369 @@
+"""
+Headless game simulation
+
+Simulation.step(inputs, dt) owns every GameState update: plane steering,
+pause and restart, zone scrolling, cloud recycling, vehicles, rotation
+damping, the speed ramp, collisions and scoring. Nothing here touches
+OpenGL, so the game can be stepped without a window for testing and
+fast-forwarding; rendering only reads the resulting state.
+
+Movement rates are the original per-frame values, scaled by
+dt * SIM_FRAME_RATE.
+"""
+import math
+from contextlib import contextmanager
+from typing import Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+from .config import (
+    EN_SIZE, NUM_CLOUDS, NUM_TREES, NUM_VEHICLES, NUM_ZONE_VARIANTS, TORUS_POS_X, TORUS_POS_Y,
+    ANGLE_BACK_FRAC, MAX_SPEED, SIM_FRAME_RATE, VEHICLE_COLORS, TRAFFIC_MODE, TRAFFIC_VEHICLES
+)
+from .game_state import state, CLOUD_DTYPE, VEHICLE_DTYPE
+
+# Input commands queued by the input handlers
+UP = 'up'
+DOWN = 'down'
+LEFT = 'left'
+RIGHT = 'right'
+PAUSE = 'pause'
+START = 'start'
+MENU = 'menu'
+
+# Steering impulse per arrow key press
+MOVE_STEP = 0.3
+ROT_STEP = 1.0
+
+# Zone scrolling: attributes of the zones in play and their wrap points
+ZONE_ATTRS = ('tZ', 'tZ1', 'tZ2', 'tZ3', 'tZ4', 'tZ5', 'tZ6')
+ZONE_END = 20
+ZONE_RESTART = -110
+
+# Obstacle zones: (zone variant, position attribute), indexed like obstacle_passed
+OBSTACLE_ZONES = [(2, 'tZ'), (3, 'tZ2'), (1, 'tZ3'), (5, 'tZ4'), (4, 'tZ5'), (2, 'tZ6')]
+
+# Traffic lanes: (axis, lane coordinate, direction). Axis 0 lanes run along X at
+# the given Z on the main road, axis 1 lanes along Z at the given X on the side roads
+MAIN_ROAD_LANES = [(0, -0.5, 1.0), (0, 0.5, -1.0)]
+SIDE_ROAD_LANES = [(1, -10.35, -1.0), (1, -9.65, 1.0), (1, 9.65, -1.0), (1, 10.35, 1.0)]
+ROAD_END = 20
+
+# Building grid rows and columns (zone-local x and z)
+BUILDING_ROWS = range(-(EN_SIZE // 2) + 1, EN_SIZE // 2, 2)
+
+
+def check_collision(plane_x: float, plane_y: float, plane_z: float,
+                    obs_x: float, obs_y: float, obs_z: float) -> bool:
+    """Check if plane collides with obstacle (torus)"""
+    dx = plane_x - obs_x
+    dy = (plane_y + 1.0) - obs_y
+    dz = plane_z - obs_z
+
+    distance = math.sqrt(dx*dx + dy*dy + dz*dz)
+    collision_threshold = 1.8
+
+    return distance < collision_threshold
+
+
+def check_passed_obstacle(obs_z: float, prev_passed: bool) -> bool:
+    """Check if obstacle has just passed the plane"""
+    if not prev_passed and 0 < obs_z < 3:
+        return True
+    return prev_passed
+
+
+def building_site(n: int, i: int, j: int) -> bool:
+    """Check whether a building may stand at a grid cell of a zone"""
+    # Keep the flight path clear
+    if -5 <= i <= 5:
+        return False
+    # Skip building placement where landmarks are
+    if n == 3 and i < -8 and -8 < j < -2:
+        return False
+    if n == 5 and i > 8 and 2 < j < 8:
+        return False
+    return True
+
+
+def _toward_zero(value: float, amount: float) -> float:
+    """Move value towards zero by amount without overshooting"""
+    if value > 0:
+        return max(value - amount, 0.0)
+    if value < 0:
+        return min(value + amount, 0.0)
+    return value
+
+
+class Simulation:
+    """Advance the game state from input commands and elapsed time"""
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = seed
+        self._rng = None
+        self.pending: List[str] = []
+
+    @property
+    def rng(self) -> 'np.random.Generator':
+        """Random generator, created when first needed (numpy.random is slow to import)"""
+        if self._rng is None:
+            self._rng = np.random.default_rng(self.seed)
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: 'np.random.Generator'):
+        self._rng = rng
+
+    def queue(self, command: str):
+        """Queue an input command for the next step"""
+        self.pending.append(command)
+
+    def take_inputs(self) -> List[str]:
+        """Return and clear the queued input commands"""
+        inputs, self.pending = self.pending, []
+        return inputs
+
+    def start(self):
+        """Start a new game with fresh random layouts"""
+        state.reset()
+        self.generate_buildings()
+        self.generate_trees()
+        self.generate_vehicles()
+        self.generate_clouds()
+        state.START = True
+
+    def generate_buildings(self):
+        """Assign random building heights to every free grid cell"""
+        sites = np.zeros(state.tola.cells.shape, dtype=bool)
+        offset = (EN_SIZE // 2) + 1
+        for n in range(NUM_ZONE_VARIANTS):
+            for j in BUILDING_ROWS:
+                for i in BUILDING_ROWS:
+                    sites[n, i + offset, j + offset] = building_site(n, i, j)
+        state.tola.randomize(sites, self.rng)
+
+    def generate_trees(self, count: int = NUM_TREES):
+        """Generate random tree positions for the environment"""
+        # Trees around the edges, avoiding the center flight path
+        side = self.rng.choice([-1.0, 1.0], size=count)
+        x = side * self.rng.uniform(6, 18, count)
+        z = self.rng.uniform(-18, 18, count)
+        scale = self.rng.uniform(0.8, 1.5, count)
+        state.tree_positions = np.column_stack([x, np.full(count, 0.15), z, scale])
+        state.population_version += 1
+
+    def generate_vehicles(self, count: Optional[int] = None, side_roads: bool = TRAFFIC_MODE):
+        """Initialize vehicle positions and properties"""
+        if count is None:
+            count = TRAFFIC_VEHICLES if TRAFFIC_MODE else NUM_VEHICLES
+        lanes = np.array(MAIN_ROAD_LANES + (SIDE_ROAD_LANES if side_roads else []))
+        lane = lanes[np.arange(count) % len(lanes)]  # Alternate vehicles between lanes
+        along = self.rng.uniform(-18, 18, count)
+
+        vehicles = np.zeros(count, dtype=VEHICLE_DTYPE)
+        vehicles['axis'] = lane[:, 0]
+        vehicles['x'] = np.where(lane[:, 0] == 0, along, lane[:, 1])
+        vehicles['z'] = np.where(lane[:, 0] == 0, lane[:, 1], along)
+        vehicles['direction'] = lane[:, 2]
+        vehicles['speed'] = self.rng.uniform(0.03, 0.08, count)
+        vehicles['color'] = self.rng.integers(0, len(VEHICLE_COLORS), count)
+        state.vehicle_data = vehicles
+        state.population_version += 1
+
+    def generate_clouds(self, count: int = NUM_CLOUDS):
+        """Scatter clouds across the sky ahead of the plane"""
+        clouds = np.zeros(count, dtype=CLOUD_DTYPE)
+        clouds['pos'][:, 0] = self.rng.uniform(-50, 50, count)
+        clouds['pos'][:, 1] = self.rng.uniform(18, 50, count)
+        clouds['pos'][:, 2] = -10.0 - np.arange(count) * 5.0
+        clouds['scale'] = self.rng.uniform(1.5, 6.0, count)
+        state.cloud_data = clouds
+
+    def apply(self, command: str):
+        """Apply one input command"""
+        if command == START:
+            self.start()
+        elif command == MENU:
+            state.reset()
+            state.START = False
+        elif command == PAUSE:
+            state.PAUSED = not state.PAUSED
+        elif command == UP:
+            state.tY -= MOVE_STEP
+            state.rotZ += ROT_STEP
+        elif command == DOWN:
+            state.tY += MOVE_STEP
+            state.rotZ -= ROT_STEP
+        elif command == LEFT:
+            state.tX += MOVE_STEP
+            state.rotX -= ROT_STEP * 3
+            state.rotY += ROT_STEP / 2
+        elif command == RIGHT:
+            state.tX -= MOVE_STEP
+            state.rotX += ROT_STEP * 3
+            state.rotY -= ROT_STEP / 2
+
+    def step(self, inputs: Iterable[str], dt: float):
+        """Apply the inputs and advance the game by dt seconds"""
+        for command in inputs:
+            self.apply(command)
+        if not state.START or state.GAME_OVER:
+            return
+
+        # Plane rotation and movement limits
+        state.rotX = min(max(state.rotX, -11), 11)
+        state.rotZ = min(max(state.rotZ, -15), 10)
+        state.tX = min(max(state.tX, -4.1), 4.1)
+        state.tY = min(max(state.tY, -15), 0.1)
+
+        if state.PAUSED:
+            return
+        frames = dt * SIM_FRAME_RATE
+
+        state.play_time += dt
+        state.TIME = int(state.play_time)
+        state.glow_time = state.play_time
+        state.blink_time = state.play_time
+
+        self.update_vehicles(frames)
+        self.update_zones(frames)
+        self.update_clouds(frames)
+
+        # Rotation damping
+        damping = ANGLE_BACK_FRAC * frames
+        state.rotX = _toward_zero(state.rotX, damping)
+        state.rotY = _toward_zero(state.rotY, damping)
+        state.rotZ = _toward_zero(state.rotZ, damping)
+
+        # Increase speed
+        state.speed = min(state.speed + 0.0002 * frames, MAX_SPEED)
+
+        self.check_obstacles()
+
+    def update_vehicles(self, frames: float):
+        """Move vehicles along their lanes, wrapping at the road ends"""
+        vehicles = state.vehicle_data
+        step = vehicles['direction'] * vehicles['speed'] * frames
+        along_x = vehicles['axis'] == 0
+        for field, moving in (('x', along_x), ('z', ~along_x)):
+            position = vehicles[field]
+            position += np.where(moving, step, 0.0)
+
+            # Wrap around when reaching edge of road
+            position[position > ROAD_END] = -ROAD_END
+            position[position < -ROAD_END] = ROAD_END
+
+    def update_zones(self, frames: float):
+        """Scroll the zones towards the plane and recycle the ones behind it"""
+        distance = state.speed * frames
+        for attr in ZONE_ATTRS:
+            setattr(state, attr, getattr(state, attr) + distance)
+
+        # The Shaheed Minar zone is shown once, the others loop back
+        if state.tZ1 >= ZONE_END:
+            state.shaheed_minar_passed = True
+        for attr in ZONE_ATTRS:
+            if attr != 'tZ1' and getattr(state, attr) >= ZONE_END:
+                setattr(state, attr, ZONE_RESTART)
+
+    def update_clouds(self, frames: float):
+        """Drift clouds towards the plane and respawn the ones behind it"""
+        positions = state.cloud_data['pos']
+        positions[:, 2] += state.speed * frames
+
+        respawn = positions[:, 2] >= 20
+        count = int(np.count_nonzero(respawn))
+        if count:
+            positions[respawn] = np.column_stack([
+                self.rng.uniform(-40, 40, count),
+                self.rng.uniform(20, 45, count),
+                np.full(count, -130.0),
+            ])
+            state.cloud_data['scale'][respawn] = self.rng.uniform(2.0, 5.0, count)
+
+    def check_obstacles(self):
+        """Collision detection and scoring"""
+        for idx, (zone_num, attr) in enumerate(OBSTACLE_ZONES):
+            obs_world_x = TORUS_POS_X[zone_num] + state.tX
+            obs_world_y = TORUS_POS_Y[zone_num] + state.tY
+            obs_world_z = getattr(state, attr)
+
+            # The plane sits at (0, 1, 0) in world space
+            if check_collision(0, 1, 0, obs_world_x, obs_world_y, obs_world_z):
+                state.GAME_OVER = True
+                return
+
+            if check_passed_obstacle(obs_world_z, state.obstacle_passed[idx]):
+                if not state.obstacle_passed[idx]:
+                    state.SCORE += 1
+                    state.obstacle_passed[idx] = True
+
+        # Reset obstacle_passed flags when obstacles loop back
+        for idx, (_, attr) in enumerate(OBSTACLE_ZONES):
+            if getattr(state, attr) <= ZONE_RESTART:
+                state.obstacle_passed[idx] = False
+
+
+class Snapshot(NamedTuple):
+    """The moving parts of the game state that rendering interpolates"""
+    layout: int  # layout_version, a new game is never interpolated from the old one
+    zones: np.ndarray  # Z of every zone, in ZONE_ATTRS order
+    attitude: np.ndarray  # tX, tY, rotX, rotY, rotZ
+    clouds: np.ndarray  # (N, 3) cloud positions
+    vehicles: np.ndarray  # (N, 2) X and Z of every vehicle
+
+
+def snapshot() -> Snapshot:
+    """Capture the current moving parts of the game state"""
+    return Snapshot(
+        state.layout_version,
+        np.array([getattr(state, attr) for attr in ZONE_ATTRS]),
+        np.array([state.tX, state.tY, state.rotX, state.rotY, state.rotZ]),
+        state.cloud_data['pos'].copy(),
+        np.column_stack([state.vehicle_data['x'], state.vehicle_data['z']]),
+    )
+
+
+def _write(view: Snapshot):
+    """Store snapshot values into the game state"""
+    for attr, value in zip(ZONE_ATTRS, view.zones.tolist()):
+        setattr(state, attr, value)
+    state.tX, state.tY, state.rotX, state.rotY, state.rotZ = view.attitude.tolist()
+    state.cloud_data['pos'] = view.clouds
+    state.vehicle_data['x'] = view.vehicles[:, 0]
+    state.vehicle_data['z'] = view.vehicles[:, 1]
+
+
+@contextmanager
+def interpolated(previous: Optional[Snapshot], alpha: float):
+    """Temporarily blend the game state between the previous step and the current one
+
+    Values that wrapped or respawned during the last step are not blended.
+    The current state is restored on exit.
+    """
+    current = snapshot()
+    if (previous is None or previous.layout != current.layout
+            or previous.clouds.shape != current.clouds.shape
+            or previous.vehicles.shape != current.vehicles.shape):
+        yield
+        return
+
+    def blend(old: np.ndarray, new: np.ndarray, keep: np.ndarray) -> np.ndarray:
+        return np.where(keep, old + (new - old) * alpha, new)
+
+    zones = blend(previous.zones, current.zones, current.zones >= previous.zones)
+    clouds = blend(previous.clouds, current.clouds,
+                   (current.clouds[:, 2] >= previous.clouds[:, 2])[:, None])
+    vehicles = blend(previous.vehicles, current.vehicles,
+                     np.all(np.abs(current.vehicles - previous.vehicles) < ROAD_END, axis=1)[:, None])
+    attitude = blend(previous.attitude, current.attitude, True)
+
+    _write(Snapshot(current.layout, zones, attitude, clouds, vehicles))
+    try:
+        yield
+    finally:
+        _write(current)
+
+
+# Global simulation driving the game state
+simulation = Simulation()
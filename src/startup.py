@@ -0,0 +1,59 @@
+"""
+Startup timing report
+
+Startup phases are marked as they finish, timed from when this module is
+imported (the first thing src.main does, so interpreter start-up is not
+included) to the first frame on screen. With SHOW_STARTUP_REPORT set, or
+`--startup-report` on the command line, the phases are printed in the
+style of `python -X importtime` once the first frame has been presented.
+"""
+import sys
+import time
+from typing import List, Tuple
+
+from .config import SHOW_STARTUP_REPORT, STARTUP_BUDGET_MS
+
+
+class StartupReport:
+    """Time taken by each startup phase up to the first frame"""
+
+    def __init__(self, enabled: bool = SHOW_STARTUP_REPORT, budget_ms: float = STARTUP_BUDGET_MS):
+        self.enabled = enabled or '--startup-report' in sys.argv
+        self.budget_ms = budget_ms
+        self.origin = time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+        self.done = False
+
+    def mark(self, phase: str):
+        """Record that a phase has just finished"""
+        if not self.done:
+            self.marks.append((phase, time.perf_counter()))
+
+    def first_frame(self):
+        """Close the report once the first frame is presented, printing it if enabled"""
+        if self.done:
+            return
+        self.mark('first frame')
+        self.done = True
+        if self.enabled:
+            print(self.report())
+
+    @property
+    def total_ms(self) -> float:
+        """Milliseconds from the start of the report to the last mark"""
+        return (self.marks[-1][1] - self.origin) * 1000 if self.marks else 0.0
+
+    def report(self) -> str:
+        """Format every phase with its own and its cumulative time"""
+        lines = ['startup: phase [ms] | cumulative [ms] | phase']
+        previous = self.origin
+        for phase, at in self.marks:
+            lines.append(f'startup: {(at - previous) * 1000:10.1f} | {(at - self.origin) * 1000:15.1f} | {phase}')
+            previous = at
+        verdict = 'within' if self.total_ms <= self.budget_ms else 'over'
+        lines.append(f'startup: first frame after {self.total_ms:.0f} ms, {verdict} the {self.budget_ms:.0f} ms budget')
+        return '\n'.join(lines)
+
+
+# Global startup report, started when src.main is imported
+startup = StartupReport()
@@ -0,0 +1,40 @@
+"""
+Fixed-timestep clock for the simulation
+"""
+import time
+from typing import Callable
+
+from .config import SIM_TICK_RATE, MAX_FRAME_TIME
+
+
+class FixedTimestep:
+    """Accumulate monotonic clock time and release it in fixed steps"""
+
+    def __init__(self, rate: float = SIM_TICK_RATE, max_frame_time: float = MAX_FRAME_TIME,
+                 clock: Callable[[], float] = time.monotonic):
+        self.dt = 1.0 / rate
+        self.max_frame_time = max_frame_time
+        self.clock = clock
+        self.accumulator = 0.0
+        self._last = None
+
+    def advance(self) -> int:
+        """Add the time since the last call and return the number of steps due"""
+        now = self.clock()
+        if self._last is not None:
+            # Clamp long stalls so the simulation does not spiral trying to catch up
+            self.accumulator += min(now - self._last, self.max_frame_time)
+        self._last = now
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+        return steps
+
+    def reset(self):
+        """Drop the accumulated time and count the next steps from now"""
+        self.accumulator = 0.0
+        self._last = self.clock()
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step left in the accumulator, for render interpolation"""
+        return self.accumulator / self.dt
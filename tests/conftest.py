@@ -0,0 +1,14 @@
+"""
+Shared fixtures: every test starts from a fresh game state
+"""
+import pytest
+
+from src.game_state import state
+
+
+@pytest.fixture(autouse=True)
+def fresh_state():
+    """Reinitialize the global game state around each test"""
+    state._initialize()
+    yield state
+    state._initialize()
@@ -0,0 +1,70 @@
+"""
+On-disk baked geometry cache: round trips, stale entries and damaged files
+"""
+import os
+
+import numpy as np
+
+from src.rendering.asset_cache import AssetCache, value_digest
+
+ARRAYS = {'lit': np.arange(12, dtype=np.float32).reshape(4, 3), 'unlit': np.ones(5, dtype=np.uint8)}
+
+
+def saved_cache(tmp_path, source: str = 'src1') -> AssetCache:
+    """A cache under tmp_path holding ARRAYS for ('tower', (1, 2))"""
+    cache = AssetCache(str(tmp_path / 'meshes'))
+    cache.save('tower', (1, 2), source, ARRAYS)
+    return cache
+
+
+def test_saved_arrays_load_back(tmp_path):
+    loaded = saved_cache(tmp_path).load('tower', (1, 2), 'src1')
+    assert sorted(loaded) == sorted(ARRAYS)
+    for key, array in ARRAYS.items():
+        np.testing.assert_array_equal(loaded[key], array)
+        assert loaded[key].dtype == array.dtype
+
+
+def test_other_parameters_miss(tmp_path):
+    cache = saved_cache(tmp_path)
+    assert cache.load('tower', (1, 3), 'src1') is None
+    assert cache.load('minar', (1, 2), 'src1') is None
+
+
+def test_stale_source_digest_misses_and_is_replaced(tmp_path):
+    cache = saved_cache(tmp_path)
+    assert cache.load('tower', (1, 2), 'src2') is None
+    cache.save('tower', (1, 2), 'src2', ARRAYS)
+    assert cache.load('tower', (1, 2), 'src1') is None
+    assert cache.load('tower', (1, 2), 'src2') is not None
+    assert os.listdir(cache.directory) == [f'tower-{value_digest((1, 2))}-src2']
+
+
+def test_truncated_file_misses_and_is_dropped(tmp_path):
+    cache = saved_cache(tmp_path)
+    entry = os.path.join(cache.directory, os.listdir(cache.directory)[0])
+    path = os.path.join(entry, 'lit.npy')
+    with open(path, 'r+b') as file:
+        file.truncate(os.path.getsize(path) - 8)
+    assert cache.load('tower', (1, 2), 'src1') is None
+    assert not os.path.exists(entry)
+    cache.save('tower', (1, 2), 'src1', ARRAYS)
+    np.testing.assert_array_equal(cache.load('tower', (1, 2), 'src1')['lit'], ARRAYS['lit'])
+
+
+def test_disabled_cache_neither_saves_nor_loads(tmp_path):
+    cache = AssetCache(str(tmp_path / 'meshes'), enabled=False)
+    cache.save('tower', (1, 2), 'src1', ARRAYS)
+    assert not os.path.exists(cache.directory)
+    assert cache.load('tower', (1, 2), 'src1') is None
+
+
+def test_clear_removes_every_entry(tmp_path):
+    cache = saved_cache(tmp_path)
+    cache.clear()
+    assert cache.load('tower', (1, 2), 'src1') is None
+
+
+def test_value_digest_is_stable_and_tells_values_apart():
+    assert value_digest((1, 2.5, 'a')) == value_digest((1, 2.5, 'a'))
+    assert value_digest((1, 2.5, 'a')) != value_digest((1, 2.5, 'b'))
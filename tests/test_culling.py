@@ -0,0 +1,51 @@
+"""
+Frustum culling of bounding boxes, on a frustum given by its planes
+"""
+import numpy as np
+
+from src.rendering.culling import Frustum
+
+
+def cube_frustum() -> Frustum:
+    """The frustum of the cube -1 <= x, y, z <= 1 (an orthographic view)"""
+    planes = []
+    for axis in range(3):
+        for sign in (1.0, -1.0):
+            plane = np.zeros(4)
+            plane[axis] = sign
+            plane[3] = 1.0
+            planes.append(plane)
+    return Frustum(np.array(planes))
+
+
+def test_boxes_inside_straddling_and_outside():
+    los = np.array([[-0.5, -0.5, -0.5], [0.5, 0.5, 0.5], [2.0, 0.0, 0.0], [-3.0, -3.0, -3.0]])
+    his = np.array([[0.5, 0.5, 0.5], [1.5, 1.5, 1.5], [3.0, 1.0, 1.0], [3.0, 3.0, 3.0]])
+    visible = cube_frustum().visible_boxes(los, his)
+    assert visible.tolist() == [True, True, False, True]
+
+
+def test_touching_box_is_visible():
+    visible = cube_frustum().visible_boxes(np.array([[1.0, 0.0, 0.0]]), np.array([[2.0, 0.5, 0.5]]))
+    assert visible.tolist() == [True]
+
+
+def test_matches_intersects_box():
+    rng = np.random.default_rng(3)
+    frustum = Frustum(rng.normal(size=(6, 4)))
+    los = rng.uniform(-4.0, 4.0, size=(200, 3))
+    his = los + rng.uniform(0.0, 2.0, size=(200, 3))
+    expected = [frustum.intersects_box(lo, hi) for lo, hi in zip(los, his)]
+    assert frustum.visible_boxes(los, his).tolist() == expected
+
+
+def test_translated_frustum_culls_in_the_child_frame():
+    # A child frame placed at x = 5 sees the cube at -6 <= x <= -4
+    frustum = cube_frustum().translated(5.0, 0.0, 0.0)
+    los = np.array([[-0.5, -0.5, -0.5], [-5.5, -0.5, -0.5]])
+    his = np.array([[0.5, 0.5, 0.5], [-4.5, 0.5, 0.5]])
+    assert frustum.visible_boxes(los, his).tolist() == [False, True]
+
+
+def test_no_boxes():
+    assert cube_frustum().visible_boxes(np.zeros((0, 3)), np.zeros((0, 3))).shape == (0,)
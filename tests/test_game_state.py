@@ -0,0 +1,60 @@
+"""
+Building layout grid: shape, cell indexing and random layouts
+"""
+import numpy as np
+
+from src.config import EN_SIZE, NUM_ZONE_VARIANTS
+from src.game_state import BuildingGrid, state
+from src.simulation import BUILDING_ROWS, Simulation, building_site
+
+OFFSET = (EN_SIZE // 2) + 1  # Grid index of building coordinate 0
+
+
+def test_grid_has_one_uint8_layer_per_zone():
+    grid = BuildingGrid()
+    assert grid.cells.shape == (NUM_ZONE_VARIANTS, EN_SIZE + 1, EN_SIZE + 1)
+    assert grid.cells.dtype == np.uint8
+    assert not grid.cells.any()
+
+
+def test_get_indexes_zone_then_i_then_j():
+    grid = BuildingGrid(zones=3, size=5)
+    grid.cells[2, 1, 4] = 3
+    assert grid.get(2, 1, 4) == 3
+    assert grid.get(2, 4, 1) == 0
+    assert grid.get(1, 1, 4) == 0
+    assert type(grid.get(2, 1, 4)) is int
+
+
+def test_randomize_fills_only_the_sites():
+    grid = BuildingGrid(zones=2, size=6)
+    sites = np.zeros(grid.cells.shape, dtype=bool)
+    sites[0, 1:4, 2] = True
+    sites[1, 5, 5] = True
+    grid.randomize(sites, np.random.default_rng(0))
+    assert (grid.cells[sites] >= 1).all() and (grid.cells[sites] <= 5).all()
+    assert not grid.cells[~sites].any()
+    grid.clear()
+    assert not grid.cells.any()
+
+
+def test_randomize_is_reproducible():
+    first, second = BuildingGrid(), BuildingGrid()
+    sites = np.ones(first.cells.shape, dtype=bool)
+    first.randomize(sites, np.random.default_rng(4))
+    second.randomize(sites, np.random.default_rng(4))
+    np.testing.assert_array_equal(first.cells, second.cells)
+
+
+def test_generated_layout_matches_the_building_sites():
+    Simulation(seed=1).generate_buildings()
+    for n in range(NUM_ZONE_VARIANTS):
+        for j in BUILDING_ROWS:
+            for i in BUILDING_ROWS:
+                floors = state.tola.get(n, i + OFFSET, j + OFFSET)
+                assert (floors > 0) == building_site(n, i, j)
+    # Cells between the building rows stay empty
+    rows = [i + OFFSET for i in BUILDING_ROWS]
+    mask = np.zeros(state.tola.cells.shape[1:], dtype=bool)
+    mask[np.ix_(rows, rows)] = True
+    assert not state.tola.cells[:, ~mask].any()
@@ -0,0 +1,84 @@
+"""
+Baked lighting: the ambient, diffuse and specular terms of lit_colors
+"""
+import numpy as np
+import pytest
+
+from src.config import CAMERA_CENTER, CAMERA_EYE
+from src.rendering import lighting
+from src.rendering.lighting import bake_colors, lit_colors, view_rotation
+
+GREY = np.array([[0.5, 0.5, 0.5, 0.75]])
+
+
+@pytest.fixture
+def eye_space(monkeypatch):
+    """Light along +Z in eye space, world normals taken as eye-space normals"""
+    monkeypatch.setattr(lighting, 'view_rotation', lambda: np.identity(3))
+    monkeypatch.setattr(lighting, 'LIGHT_POSITION', [0.0, 0.0, 1.0, 0.0])
+    monkeypatch.setattr(lighting, 'LIGHT_AMBIENT', [0.0, 0.0, 0.0, 1.0])
+    monkeypatch.setattr(lighting, 'LIGHT_DIFFUSE', [1.0, 1.0, 1.0, 1.0])
+    monkeypatch.setattr(lighting, 'LIGHT_SPECULAR', [1.0, 1.0, 1.0, 1.0])
+    monkeypatch.setattr(lighting, 'MAT_SPECULAR', [0.0, 0.0, 0.0, 1.0])
+    monkeypatch.setattr(lighting, 'HIGH_SHININESS', [10.0])
+
+
+def normal(degrees: float) -> np.ndarray:
+    """Unit normal tilted from +Z towards +X"""
+    angle = np.radians(degrees)
+    return np.array([[np.sin(angle), 0.0, np.cos(angle)]])
+
+
+def test_ambient_only_facing_away(eye_space):
+    rgba = lit_colors(GREY, normal(180))
+    np.testing.assert_allclose(rgba, [[0.1, 0.1, 0.1, 0.75]])
+
+
+def test_light_ambient_adds_to_the_global_ambient(eye_space, monkeypatch):
+    monkeypatch.setattr(lighting, 'LIGHT_AMBIENT', [0.3, 0.3, 0.3, 1.0])
+    np.testing.assert_allclose(lit_colors(GREY, normal(180))[:, :3], 0.25)
+
+
+def test_diffuse_follows_the_cosine(eye_space):
+    for degrees, cosine in ((0, 1.0), (60, 0.5), (90, 0.0)):
+        rgb = lit_colors(GREY, normal(degrees))[:, :3]
+        np.testing.assert_allclose(rgb, 0.5 * (0.2 + cosine), atol=1e-12)
+
+
+def test_specular_uses_the_half_vector_and_shininess(eye_space, monkeypatch):
+    monkeypatch.setattr(lighting, 'LIGHT_DIFFUSE', [0.0, 0.0, 0.0, 1.0])
+    monkeypatch.setattr(lighting, 'MAT_SPECULAR', [1.0, 1.0, 1.0, 1.0])
+    black = np.array([[0.0, 0.0, 0.0, 1.0]])
+    # Light and viewer both on +Z, so the half vector is +Z too
+    np.testing.assert_allclose(lit_colors(black, normal(0))[:, :3], 1.0)
+    np.testing.assert_allclose(lit_colors(black, normal(30))[:, :3], np.cos(np.radians(30)) ** 10)
+
+
+def test_no_specular_on_faces_away_from_the_light(eye_space, monkeypatch):
+    monkeypatch.setattr(lighting, 'LIGHT_POSITION', [1.0, 0.0, 0.0, 0.0])
+    monkeypatch.setattr(lighting, 'MAT_SPECULAR', [1.0, 1.0, 1.0, 1.0])
+    # Tilted away from the light but still towards the half vector (1, 0, 1)
+    tilted = normal(-10)
+    assert (tilted @ [1.0, 0.0, 0.0])[0] < 0
+    np.testing.assert_allclose(lit_colors(GREY, tilted)[:, :3], 0.1)
+
+
+def test_colors_are_clipped_and_alpha_kept(eye_space, monkeypatch):
+    monkeypatch.setattr(lighting, 'MAT_SPECULAR', [1.0, 1.0, 1.0, 1.0])
+    rgba = lit_colors(np.array([[0.9, 0.9, 0.9, 0.4]]), normal(0))
+    np.testing.assert_allclose(rgba, [[1.0, 1.0, 1.0, 0.4]])
+
+
+def test_view_rotation_turns_the_direction_to_the_eye_to_z():
+    rotation = view_rotation()
+    np.testing.assert_allclose(rotation @ rotation.T, np.identity(3), atol=1e-12)
+    to_eye = np.subtract(CAMERA_EYE, CAMERA_CENTER)
+    np.testing.assert_allclose(rotation @ (to_eye / np.linalg.norm(to_eye)), [0.0, 0.0, 1.0], atol=1e-12)
+
+
+def test_bake_colors_only_replaces_the_colors(eye_space):
+    # GL_C4F_N3F_V3F-like rows: color, normal, position
+    vertices = np.hstack([GREY, normal(60), [[1.0, 2.0, 3.0]]]).astype(np.float32)
+    baked = bake_colors(vertices, 0, 4)
+    np.testing.assert_allclose(baked[:, :4], lit_colors(GREY, normal(60)), atol=1e-6)
+    np.testing.assert_array_equal(baked[:, 4:], vertices[:, 4:])
@@ -0,0 +1,82 @@
+"""
+Level of detail selection: thresholds, hysteresis and forced levels
+"""
+import math
+
+import numpy as np
+import pytest
+
+from src.rendering.lod import LodSelector
+
+BASE_SLICES = 16  # Levels 0, 1, 2 have 16, 8 and 4 slices
+
+
+def selector() -> LodSelector:
+    """A selector with three levels, one pixel of error and a 20% margin"""
+    return LodSelector(levels=(1.0, 0.5, 0.25), max_error=1.0, hysteresis=0.2)
+
+
+def radius_needing(slices: float) -> float:
+    """On-screen radius at which the selector needs this many slices"""
+    return 2.0 * (slices / math.pi) ** 2
+
+
+def test_detail_drops_with_screen_size():
+    lod = selector()
+    levels = [lod.select(None, radius_needing(n), BASE_SLICES) for n in (12, 6, 3)]
+    assert levels == [0, 1, 2]
+
+
+def test_does_not_flip_at_the_threshold():
+    lod = selector()
+    assert lod.select('tree', radius_needing(12), BASE_SLICES) == 0
+    # 8 slices are just enough for level 1, but not with the hysteresis margin
+    assert lod.select('tree', radius_needing(8), BASE_SLICES) == 0
+    assert lod.select('tree', radius_needing(7.5), BASE_SLICES) == 0
+
+
+def test_oscillating_around_the_threshold_keeps_the_level():
+    lod = selector()
+    lod.select('tree', radius_needing(12), BASE_SLICES)
+    levels = {lod.select('tree', radius_needing(n), BASE_SLICES) for n in (7.9, 8.1) * 5}
+    assert levels == {0}
+
+
+def test_drops_once_clearly_past_the_threshold_and_refines_at_once():
+    lod = selector()
+    lod.select('tree', radius_needing(12), BASE_SLICES)
+    assert lod.select('tree', radius_needing(6), BASE_SLICES) == 1
+    assert lod.select('tree', radius_needing(8.5), BASE_SLICES) == 0
+
+
+def test_hysteresis_is_per_key_and_scope():
+    lod = selector()
+    lod.select('near', radius_needing(12), BASE_SLICES)
+    assert lod.select('far', radius_needing(7.5), BASE_SLICES) == 1
+    lod.scope = 'other zone'
+    assert lod.select('near', radius_needing(7.5), BASE_SLICES) == 1
+    # Without a key nothing is remembered
+    lod.select(None, radius_needing(12), BASE_SLICES)
+    assert lod.select(None, radius_needing(7.5), BASE_SLICES) == 1
+
+
+def test_forced_level_overrides_and_restores():
+    lod = selector()
+    with lod.forced_level(2):
+        assert lod.select('tree', radius_needing(12), BASE_SLICES) == 2
+        with lod.forced_level(1):
+            assert lod.forced == 1
+        assert lod.forced == 2
+    assert lod.forced is None
+    assert lod.select('tree', radius_needing(12), BASE_SLICES) == 0
+
+
+def test_projected_radius_with_a_given_modelview():
+    lod = selector()
+    lod.set_projection(2.0, 100)
+    modelview = np.identity(4)
+    modelview[3, 2] = -10.0  # Read-back layout: the translation is the last row
+    assert lod.projected_radius(1.0, modelview) == pytest.approx(10.0)
+    assert lod.projected_radius(1.0, modelview, (0.0, 0.0, 5.0)) == pytest.approx(20.0)
+    # Behind the eye
+    assert lod.projected_radius(1.0, modelview, (0.0, 0.0, 20.0)) == 0.0
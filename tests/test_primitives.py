@@ -0,0 +1,56 @@
+"""
+Primitive meshes: unit normals and counter-clockwise front faces
+"""
+import numpy as np
+import pytest
+
+from src.rendering.primitives import cone_mesh, cube_mesh, sphere_mesh, torus_mesh
+
+MESHES = {
+    'cube': lambda: cube_mesh(),
+    'sphere': lambda: sphere_mesh(12, 8),
+    'cone': lambda: cone_mesh(10, 4),
+    'torus': lambda: torus_mesh(0.5, 2.0, 8, 12),
+}
+
+
+def triangles(mesh: np.ndarray):
+    """Normals and positions of an interleaved mesh, shaped (triangles, 3, 3)"""
+    return mesh[:, :3].reshape(-1, 3, 3), mesh[:, 3:].reshape(-1, 3, 3)
+
+
+@pytest.mark.parametrize('name', sorted(MESHES))
+def test_normals_have_unit_length(name):
+    normals, _ = triangles(MESHES[name]())
+    np.testing.assert_allclose(np.linalg.norm(normals, axis=-1), 1.0, atol=1e-5)
+
+
+@pytest.mark.parametrize('name', sorted(MESHES))
+def test_triangles_wind_counter_clockwise_towards_their_normals(name):
+    normals, positions = triangles(MESHES[name]())
+    faces = np.cross(positions[:, 1] - positions[:, 0], positions[:, 2] - positions[:, 0])
+    area = np.linalg.norm(faces, axis=-1)
+    solid = area > 1e-6  # Triangles collapsed at sphere poles have no winding
+    assert solid.sum() > len(faces) // 2
+    facing = np.einsum('ij,ij->i', faces[solid], normals[solid].mean(axis=1))
+    assert (facing > 0).all()
+
+
+def test_cube_is_a_unit_cube_with_flat_faces():
+    normals, positions = triangles(cube_mesh())
+    assert len(normals) == 12
+    np.testing.assert_allclose(np.abs(positions).max(axis=(0, 1)), 0.5)
+    # Every vertex of a face lies on the plane its normal points to
+    np.testing.assert_allclose(np.einsum('tvi,tvi->tv', normals, positions), 0.5, atol=1e-6)
+
+
+def test_cone_sits_on_z0_with_its_apex_at_z1():
+    _, positions = triangles(cone_mesh(10, 4))
+    z = positions[..., 2]
+    assert z.min() == pytest.approx(0.0)
+    assert z.max() == pytest.approx(1.0)
+
+
+def test_meshes_are_built_once_per_key():
+    assert sphere_mesh(12, 8) is sphere_mesh(12, 8)
+    assert sphere_mesh(12, 8) is not sphere_mesh(12, 9)
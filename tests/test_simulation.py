@@ -0,0 +1,117 @@
+"""
+Headless simulation: determinism, input commands, pause and interpolation
+"""
+import numpy as np
+
+from src.config import SIM_TICK_RATE
+from src.game_state import state
+from src.simulation import (
+    LEFT, MOVE_STEP, PAUSE, START, UP, ZONE_ATTRS, ZONE_END, Simulation, interpolated, snapshot
+)
+
+DT = 1.0 / SIM_TICK_RATE
+
+
+def run(seed: int, steps: int):
+    """Start a game with the seed and step it, returning the final snapshot"""
+    simulation = Simulation(seed)
+    simulation.step([START], DT)
+    for i in range(steps):
+        simulation.step([UP] if i % 50 == 0 else [], DT)
+    return snapshot(), state.SCORE, state.GAME_OVER
+
+
+def test_same_seed_gives_same_state():
+    first = run(7, 2000)
+    state._initialize()
+    second = run(7, 2000)
+    for a, b in zip(first[0], second[0]):
+        np.testing.assert_array_equal(a, b)
+    assert first[1:] == second[1:]
+
+
+def test_different_seeds_give_different_layouts():
+    run(1, 0)
+    trees = state.tree_positions.copy()
+    run(2, 0)
+    assert not np.array_equal(trees, state.tree_positions)
+
+
+def test_commands_are_applied_in_order():
+    simulation = Simulation(0)
+    simulation.step([START, LEFT, LEFT], 0.0)
+    assert state.tX == 2 * MOVE_STEP
+
+    # Starting again afterwards resets the position the moves gave
+    simulation.step([LEFT, START], 0.0)
+    assert state.tX == 0.0
+
+
+def test_queued_commands_are_taken_once():
+    simulation = Simulation(0)
+    simulation.queue(START)
+    simulation.queue(PAUSE)
+    assert simulation.take_inputs() == [START, PAUSE]
+    assert simulation.take_inputs() == []
+
+
+def test_pause_freezes_step():
+    simulation = Simulation(0)
+    simulation.step([START], DT)
+    simulation.step([PAUSE], DT)
+    before = snapshot()
+    play_time = state.play_time
+    for _ in range(100):
+        simulation.step([], DT)
+    after = snapshot()
+    assert state.PAUSED
+    assert state.play_time == play_time
+    for a, b in zip(before, after):
+        np.testing.assert_array_equal(a, b)
+
+    simulation.step([PAUSE], DT)
+    assert state.play_time > play_time
+
+
+def test_interpolated_blends_and_restores():
+    simulation = Simulation(0)
+    simulation.step([START], DT)
+    previous = snapshot()
+    simulation.step([], DT)
+    current = snapshot()
+
+    with interpolated(previous, 0.5):
+        midway = snapshot()
+    np.testing.assert_allclose(midway.zones, (previous.zones + current.zones) / 2)
+    np.testing.assert_allclose(midway.clouds, (previous.clouds + current.clouds) / 2)
+    for a, b in zip(snapshot(), current):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_interpolated_does_not_blend_wrapped_values():
+    simulation = Simulation(0)
+    simulation.step([START], DT)
+    state.tZ = ZONE_END - 0.01
+    state.vehicle_data['x'][0] = 19.99
+    previous = snapshot()
+    simulation.step([], DT)
+    assert state.tZ < 0  # the zone wrapped back
+    state.vehicle_data['x'][0] = -20.0  # as if the vehicle wrapped at the road end
+    current = snapshot()
+
+    with interpolated(previous, 0.5):
+        assert state.tZ == current.zones[ZONE_ATTRS.index('tZ')]
+        assert state.vehicle_data['x'][0] == -20.0
+        # Zones that did not wrap are still blended
+        assert state.tZ2 == (previous.zones[2] + current.zones[2]) / 2
+
+
+def test_interpolated_skips_a_new_layout():
+    simulation = Simulation(0)
+    simulation.step([START], DT)
+    previous = snapshot()
+    simulation.step([START], DT)
+    current = snapshot()
+    with interpolated(previous, 0.5):
+        for a, b in zip(snapshot(), current):
+            np.testing.assert_array_equal(a, b)
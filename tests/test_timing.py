@@ -0,0 +1,94 @@
+"""
+Fixed-timestep clock and the steps each frame runs
+"""
+import importlib
+
+import pytest
+
+from src.config import MAX_FRAME_TIME, SIM_TICK_RATE
+from src.game_state import state
+from src.simulation import PAUSE, START, simulation
+from src.timing import FixedTimestep
+
+# The module, which the package shadows with its display() callback
+display = importlib.import_module('src.rendering.display')
+
+
+class FakeClock:
+    """Clock advanced by hand"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_first_advance_gives_no_steps():
+    clock = FakeClock()
+    assert FixedTimestep(clock=clock).advance() == 0
+
+
+def test_steps_at_tick_rate():
+    clock = FakeClock()
+    timestep = FixedTimestep(clock=clock)
+    timestep.advance()
+    clock.now += 12.5 / SIM_TICK_RATE
+    assert timestep.advance() == 12
+
+
+def test_long_frames_are_clamped():
+    clock = FakeClock()
+    timestep = FixedTimestep(clock=clock)
+    timestep.advance()
+    clock.now += 10.0
+    assert timestep.advance() == round(MAX_FRAME_TIME * SIM_TICK_RATE)
+    assert timestep.accumulator < timestep.dt
+
+
+def test_alpha_is_the_leftover_fraction_of_a_step():
+    clock = FakeClock()
+    timestep = FixedTimestep(clock=clock)
+    timestep.advance()
+    clock.now += 1.5 * timestep.dt
+    assert timestep.advance() == 1
+    assert timestep.alpha == pytest.approx(0.5)
+
+    # The leftover carries into the next frame
+    clock.now += 0.75 * timestep.dt
+    assert timestep.advance() == 1
+    assert timestep.alpha == pytest.approx(0.25)
+
+
+def test_reset_drops_the_accumulated_time():
+    clock = FakeClock()
+    timestep = FixedTimestep(clock=clock)
+    timestep.advance()
+    clock.now += 0.5 * timestep.dt
+    timestep.advance()
+    clock.now += 10.0
+    timestep.reset()
+    assert timestep.alpha == 0.0
+    clock.now += 1.5 * timestep.dt
+    assert timestep.advance() == 1
+
+
+@pytest.mark.parametrize('leave', [[START], [START, PAUSE, PAUSE]])
+def test_no_catch_up_steps_when_play_starts_or_resumes(monkeypatch, leave):
+    clock = FakeClock()
+    monkeypatch.setattr(display, 'timestep', FixedTimestep(clock=clock))
+    simulation.take_inputs()
+    display.advance_simulation()
+    for command in leave[:-1]:
+        simulation.queue(command)
+        clock.now += 1.5 / SIM_TICK_RATE
+        display.advance_simulation()
+    play_time = state.play_time
+
+    # A long wait on the menu or paused, then the key that starts play
+    clock.now += 10.0
+    simulation.queue(leave[-1])
+    display.advance_simulation()
+    assert display.current_screen() == 'playing'
+    assert state.play_time - play_time <= display.timestep.dt
+    assert display.timestep.alpha == 0.0